@@ -57,6 +57,7 @@ from .galaxy.masked_galaxy_data import MaskedGalaxyDataset
 from .hyper import hyper_data
 from .analysis.analysis import AnalysisImaging
 from .analysis.analysis import AnalysisInterferometer
+from .analysis.profiling import Profiler
 from autogalaxy.analysis.setup import SetupHyper
 from .plane.plane import Plane
 from .profiles import (
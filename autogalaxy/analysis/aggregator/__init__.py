@@ -1,3 +1,10 @@
+from autogalaxy.analysis.aggregator.aggregator import LazyProxy
+from autogalaxy.analysis.aggregator.aggregator import FitValues
+from autogalaxy.analysis.aggregator.aggregator import parallel_map_from
+from autogalaxy.analysis.aggregator.aggregator import shared_array_from
+from autogalaxy.analysis.aggregator.aggregator import dataset_fingerprint_from
+from autogalaxy.analysis.aggregator.aggregator import dataset_via_cache_from
+
 from autogalaxy.analysis.aggregator.aggregator import plane_via_database_from
 from autogalaxy.analysis.aggregator.aggregator import plane_gen_from as Plane
 
@@ -18,3 +25,6 @@ from autogalaxy.analysis.aggregator.aggregator import (
 from autogalaxy.analysis.aggregator.aggregator import (
     fit_interferometer_gen_from as FitInterferometer,
 )
+
+from autogalaxy.analysis.aggregator.exporter import attribute_rows_gen_from
+from autogalaxy.analysis.aggregator.exporter import output_attributes_to_parquet
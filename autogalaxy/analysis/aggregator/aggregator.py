@@ -1,12 +1,346 @@
+import hashlib
+import multiprocessing
+import numpy as np
+import pickle
+import sys
+import weakref
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor
+from autoconf import conf
 from autofit.database.model.fit import Fit
 import autogalaxy as ag
+from autogalaxy import exc
 
 from typing import Optional
 
 from functools import partial
 
+"""
+The arrays loaded by the aggregator (e.g. hyper images, data, noise-maps), keyed by a hash of their values, which
+are held weakly such that an array is shared by every loaded fit that references the same values and is freed once
+no fit uses it.
+"""
+_shared_arrays = weakref.WeakValueDictionary()
 
-def plane_gen_from(aggregator):
+"""
+The datasets created by the aggregator with their settings applied (e.g. their grids and `Convolver`), keyed by the
+fingerprint of the values they are created from, such that fits of the same dataset reuse them.
+"""
+_dataset_cache = OrderedDict()
+
+
+def _sha_from(array) -> str:
+    """
+    Returns a hash of the values and mask of an array.
+    """
+    sha = hashlib.sha1()
+    sha.update(np.ascontiguousarray(array).tobytes())
+
+    mask = getattr(array, "mask", None)
+
+    if isinstance(mask, np.ndarray):
+        sha.update(np.ascontiguousarray(mask).tobytes())
+
+    return sha.hexdigest()
+
+
+def shared_array_from(array):
+    """
+    Returns an array loaded by the aggregator, or the identical array already loaded for another fit if there is one,
+    such that e.g. the same `hyper_model_image` is held in memory once for every fit which uses it.
+
+    Arrays are identical if they are the same type with the same shape, values and mask. Shared arrays should
+    therefore not be modified in place.
+
+    Parameters
+    ----------
+    array : np.ndarray
+        The array loaded via the aggregator, which is returned unchanged if it is not an ndarray (e.g. `None`).
+    """
+    if not isinstance(array, np.ndarray):
+        return array
+
+    key = (type(array), array.shape, array.dtype.str, _sha_from(array))
+
+    shared_array = _shared_arrays.get(key)
+
+    if shared_array is not None:
+        return shared_array
+
+    _shared_arrays[key] = array
+
+    return array
+
+
+def dataset_fingerprint_from(values) -> tuple:
+    """
+    Returns the fingerprint of the values a dataset is created from by the aggregator (e.g. its data, noise-map, PSF
+    and settings), which is identical for the fits of every search of the same dataset.
+
+    Arrays are fingerprinted by their type, shape, values and mask, and all other values by their pickled bytes.
+    """
+    fingerprint = []
+
+    for value in values:
+
+        if isinstance(value, np.ndarray):
+            fingerprint.append(
+                (type(value), value.shape, value.dtype.str, _sha_from(value))
+            )
+        else:
+            fingerprint.append(hashlib.sha1(pickle.dumps(value)).hexdigest())
+
+    return tuple(fingerprint)
+
+
+def dataset_via_cache_from(values, func):
+    """
+    Returns the dataset created from a list of values, reusing the dataset previously created from values with the
+    same fingerprint (see `dataset_fingerprint_from`) if it is in the cache, such that its grids, blurring grid and
+    `Convolver` are not rebuilt for every fit of the same dataset.
+
+    The cache holds the most recently used datasets, up to the `dataset_cache_size` entry of the [aggregator]
+    section of the general.ini config. Cached datasets are shared by every fit they are reused for, so should not be
+    modified in place.
+
+    Parameters
+    ----------
+    values
+        The values the dataset is created from.
+    func
+        The function which creates the dataset if it is not in the cache, which takes no arguments.
+    """
+    key = dataset_fingerprint_from(values=values)
+
+    if key in _dataset_cache:
+
+        _dataset_cache.move_to_end(key)
+        return _dataset_cache[key]
+
+    dataset = func()
+
+    _dataset_cache[key] = dataset
+
+    dataset_cache_size = conf.instance["general"]["aggregator"]["dataset_cache_size"]
+
+    while len(_dataset_cache) > dataset_cache_size:
+        _dataset_cache.popitem(last=False)
+
+    return dataset
+
+
+class LazyProxy:
+    def __init__(self, func, fit: Fit):
+        """
+        A proxy for an object loaded via the aggregator (e.g. a `FitImaging`), which defers loading the object's
+        arrays from the database and creating it until one of its attributes is accessed.
+
+        The generators of this module return these proxies if `lazy=True`, such that iterating over the results of
+        many model-fits only loads the fits whose attributes are used, and `unload` frees a loaded fit's memory.
+
+        Parameters
+        ----------
+        func
+            The function which creates the object from the aggregator's `Fit` (e.g. `fit_imaging_via_database_from`).
+        fit
+            The aggregator's `Fit` of one set of results.
+        """
+        self._func = func
+        self._fit = fit
+        self._instance = None
+
+    @property
+    def instance(self):
+        """
+        The object the proxy represents, which is created the first time it is accessed.
+        """
+        if self._instance is None:
+            self._instance = self._func(fit=self._fit)
+
+        return self._instance
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._instance is not None
+
+    def unload(self):
+        """
+        Free the loaded object, which is recreated if an attribute is accessed again.
+        """
+        self._instance = None
+
+    def __getattr__(self, item):
+
+        if item.startswith("_"):
+            raise AttributeError(item)
+
+        return getattr(self.instance, item)
+
+
+"""
+The names of the values loaded from the database by every function of this module which creates an object from an
+aggregator's `Fit`, which are the values a `FitValues` snapshot loads for that function.
+"""
+plane_value_names = ("hyper_model_image", "hyper_galaxy_image_path_dict")
+imaging_value_names = ("data", "noise_map", "psf", "settings_dataset")
+interferometer_value_names = (
+    "data",
+    "noise_map",
+    "uv_wavelengths",
+    "real_space_mask",
+    "settings_dataset",
+)
+inversion_value_names = ("settings_pixelization", "settings_inversion")
+
+
+class FitValues:
+    def __init__(self, fit: Fit, names):
+        """
+        A snapshot of the model instance and the input values of an aggregator's `Fit`, which can be pickled and sent
+        to a worker process (unlike the `Fit`, which is bound to the database session it was loaded in).
+
+        It has the same `instance` attribute and `value` method as the `Fit`, such that it can be passed to every
+        function of this module which creates an object from a `Fit`.
+
+        Parameters
+        ----------
+        fit
+            The aggregator's `Fit` of one set of results.
+        names
+            The names of the values loaded from the `Fit`.
+        """
+        self.instance = fit.instance
+        self.values = {name: fit.value(name=name) for name in names}
+
+    def value(self, name: str):
+        return self.values.get(name)
+
+
+def _results_from_chunk(func, chunk):
+    return [func(fit=fit_values) for fit_values in chunk]
+
+
+def parallel_map_from(
+    aggregator,
+    func,
+    names,
+    processes: int = 2,
+    chunk_size: int = 1,
+    max_in_flight: Optional[int] = None,
+):
+    """
+    Map a function which creates an object from an aggregator's `Fit` (e.g. `fit_imaging_via_database_from`) over the
+    aggregator using a pool of worker processes, returning a generator of the objects in the same order as
+    `aggregator.map`.
+
+    The values every function needs are loaded from the database in this process as `FitValues` snapshots, which are
+    dispatched to the workers in chunks of `chunk_size` fits. At most `max_in_flight` chunks are dispatched and not
+    yet returned at any time, such that the memory used stays flat however many fits are in the aggregator.
+
+    Workers are created by forking where the platform supports it, so that they inherit the configs of this process
+    (on Python 3.6, which cannot set the start method of the pool, the platform's default start method is used).
+
+    Parameters
+    ----------
+    aggregator : af.Aggregator
+        A PyAutoFit aggregator object containing the results of PyAutoGalaxy model-fits.
+    func
+        The function which creates the object from an aggregator's `Fit`, which must be picklable (e.g. a module-level
+        function or a `partial` of one).
+    names
+        The names of the values `func` loads from the `Fit`.
+    processes
+        The number of worker processes.
+    chunk_size
+        The number of fits dispatched to a worker at once.
+    max_in_flight
+        The maximum number of chunks which are dispatched but not yet returned, which defaults to twice the number
+        of processes.
+    """
+    max_in_flight = max_in_flight or 2 * processes
+
+    if sys.version_info >= (3, 7) and "fork" in multiprocessing.get_all_start_methods():
+        executor_kwargs = {"mp_context": multiprocessing.get_context("fork")}
+    else:
+        executor_kwargs = {}
+
+    fit_values_gen = aggregator.map(func=partial(FitValues, names=names))
+
+    with ProcessPoolExecutor(max_workers=processes, **executor_kwargs) as executor:
+
+        futures = deque()
+
+        chunk = []
+
+        for fit_values in fit_values_gen:
+
+            chunk.append(fit_values)
+
+            if len(chunk) < chunk_size:
+                continue
+
+            if len(futures) >= max_in_flight:
+                yield from futures.popleft().result()
+
+            futures.append(executor.submit(_results_from_chunk, func, chunk))
+
+            chunk = []
+
+        if chunk:
+            futures.append(executor.submit(_results_from_chunk, func, chunk))
+
+        while futures:
+            yield from futures.popleft().result()
+
+
+def _map_from(
+    aggregator,
+    func,
+    lazy: bool,
+    names=(),
+    processes: Optional[int] = None,
+    chunk_size: int = 1,
+    max_in_flight: Optional[int] = None,
+):
+    """
+    Map a function which creates an object from an aggregator's `Fit` over the aggregator, where:
+
+    - If `processes` is input, the objects are created by `processes` worker processes in chunks of `chunk_size`
+      fits, with at most `max_in_flight` chunks pending (see `parallel_map_from`).
+    - Otherwise, if `lazy` is `True`, every object is returned as a `LazyProxy` which creates it when it is used.
+
+    The objects created by worker processes are already loaded, so `lazy` and `processes` cannot both be input.
+    """
+    if processes is not None:
+
+        if lazy:
+            raise exc.AggregatorException(
+                "The aggregator cannot create objects lazily (lazy=True) and in worker processes (processes is "
+                "input), as objects created in worker processes are loaded when they are returned."
+            )
+
+        return parallel_map_from(
+            aggregator=aggregator,
+            func=func,
+            names=names,
+            processes=processes,
+            chunk_size=chunk_size,
+            max_in_flight=max_in_flight,
+        )
+
+    if lazy:
+        return aggregator.map(func=partial(LazyProxy, func))
+
+    return aggregator.map(func=func)
+
+
+def plane_gen_from(
+    aggregator,
+    lazy: bool = False,
+    processes: Optional[int] = None,
+    chunk_size: int = 1,
+    max_in_flight: Optional[int] = None,
+):
     """
     Returns a generator of `Plane` objects from an input aggregator, which generates a list of the `Plane` objects
     for every set of results loaded in the aggregator.
@@ -17,8 +351,27 @@ def plane_gen_from(aggregator):
     Parameters
     ----------
     aggregator : af.Aggregator
-        A PyAutoFit aggregator object containing the results of PyAutoGalaxy model-fits."""
-    return aggregator.map(func=plane_via_database_from)
+        A PyAutoFit aggregator object containing the results of PyAutoGalaxy model-fits.
+    lazy
+        If `True`, every plane is returned as a `LazyProxy` which only loads it when one of its attributes is used.
+        This cannot be combined with `processes`.
+    processes
+        If input, the planes are created in parallel by this many worker processes (see `parallel_map_from`).
+    chunk_size
+        The number of fits dispatched to a worker process at once if `processes` is input.
+    max_in_flight
+        The maximum number of chunks dispatched to worker processes but not yet returned if `processes` is input,
+        which defaults to twice the number of processes.
+    """
+    return _map_from(
+        aggregator=aggregator,
+        func=plane_via_database_from,
+        lazy=lazy,
+        names=plane_value_names,
+        processes=processes,
+        chunk_size=chunk_size,
+        max_in_flight=max_in_flight,
+    )
 
 
 def plane_via_database_from(fit: Fit):
@@ -39,22 +392,32 @@ def plane_via_database_from(fit: Fit):
 
     galaxies = fit.instance.galaxies
 
-    hyper_model_image = fit.value(name="hyper_model_image")
     hyper_galaxy_image_path_dict = fit.value(name="hyper_galaxy_image_path_dict")
 
     if hyper_galaxy_image_path_dict is not None:
 
+        hyper_model_image = shared_array_from(fit.value(name="hyper_model_image"))
+
         for (galaxy_path, galaxy) in fit.instance.path_instance_tuples_for_class(
             ag.Galaxy
         ):
             if galaxy_path in hyper_galaxy_image_path_dict:
                 galaxy.hyper_model_image = hyper_model_image
-                galaxy.hyper_galaxy_image = hyper_galaxy_image_path_dict[galaxy_path]
+                galaxy.hyper_galaxy_image = shared_array_from(
+                    hyper_galaxy_image_path_dict[galaxy_path]
+                )
 
     return ag.Plane(galaxies=galaxies)
 
 
-def imaging_gen_from(aggregator, settings_imaging: Optional[ag.SettingsImaging] = None):
+def imaging_gen_from(
+    aggregator,
+    settings_imaging: Optional[ag.SettingsImaging] = None,
+    lazy: bool = False,
+    processes: Optional[int] = None,
+    chunk_size: int = 1,
+    max_in_flight: Optional[int] = None,
+):
     """
     Returns a generator of `Imaging` objects from an input aggregator, which generates a list of the
     `Imaging` objects for every set of results loaded in the aggregator.
@@ -66,11 +429,31 @@ def imaging_gen_from(aggregator, settings_imaging: Optional[ag.SettingsImaging]
     Parameters
     ----------
     aggregator : af.Aggregator
-        A PyAutoFit aggregator object containing the results of PyAutoGalaxy model-fits."""
+        A PyAutoFit aggregator object containing the results of PyAutoGalaxy model-fits.
+    lazy
+        If `True`, every imaging is returned as a `LazyProxy` which only loads it when one of its attributes is used.
+        This cannot be combined with `processes`.
+    processes
+        If input, the imaging datasets are created in parallel by this many worker processes (see
+        `parallel_map_from`).
+    chunk_size
+        The number of fits dispatched to a worker process at once if `processes` is input.
+    max_in_flight
+        The maximum number of chunks dispatched to worker processes but not yet returned if `processes` is input,
+        which defaults to twice the number of processes.
+    """
 
     func = partial(imaging_via_database_from, settings_imaging=settings_imaging)
 
-    return aggregator.map(func=func)
+    return _map_from(
+        aggregator=aggregator,
+        func=func,
+        lazy=lazy,
+        names=imaging_value_names,
+        processes=processes,
+        chunk_size=chunk_size,
+        max_in_flight=max_in_flight,
+    )
 
 
 def imaging_via_database_from(
@@ -90,22 +473,28 @@ def imaging_via_database_from(
         A PyAutoFit aggregator's SearchOutput object containing the generators of the results of PyAutoGalaxy model-fits.
     """
 
-    data = fit.value(name="data")
-    noise_map = fit.value(name="noise_map")
-    psf = fit.value(name="psf")
+    data = shared_array_from(fit.value(name="data"))
+    noise_map = shared_array_from(fit.value(name="noise_map"))
+    psf = shared_array_from(fit.value(name="psf"))
     settings_imaging = settings_imaging or fit.value(name="settings_dataset")
 
-    imaging = ag.Imaging(
-        image=data,
-        noise_map=noise_map,
-        psf=psf,
-        settings=settings_imaging,
-        setup_convolver=True,
-    )
+    def imaging_from():
 
-    imaging.apply_settings(settings=settings_imaging)
+        imaging = ag.Imaging(
+            image=data,
+            noise_map=noise_map,
+            psf=psf,
+            settings=settings_imaging,
+            setup_convolver=True,
+        )
 
-    return imaging
+        imaging.apply_settings(settings=settings_imaging)
+
+        return imaging
+
+    return dataset_via_cache_from(
+        values=[data, noise_map, psf, settings_imaging], func=imaging_from
+    )
 
 
 def fit_imaging_gen_from(
@@ -113,6 +502,10 @@ def fit_imaging_gen_from(
     settings_imaging: Optional[ag.SettingsImaging] = None,
     settings_pixelization: Optional[ag.SettingsPixelization] = None,
     settings_inversion: Optional[ag.SettingsInversion] = None,
+    lazy: bool = False,
+    processes: Optional[int] = None,
+    chunk_size: int = 1,
+    max_in_flight: Optional[int] = None,
 ):
     """
     Returns a generator of `FitImaging` objects from an input aggregator, which generates a list of the
@@ -124,7 +517,18 @@ def fit_imaging_gen_from(
     Parameters
     ----------
     aggregator : af.Aggregator
-        A PyAutoFit aggregator object containing the results of PyAutoGalaxy model-fits."""
+        A PyAutoFit aggregator object containing the results of PyAutoGalaxy model-fits.
+    lazy
+        If `True`, every fit is returned as a `LazyProxy` which only loads it when one of its attributes is used.
+        This cannot be combined with `processes`.
+    processes
+        If input, the fits are created in parallel by this many worker processes (see `parallel_map_from`).
+    chunk_size
+        The number of fits dispatched to a worker process at once if `processes` is input.
+    max_in_flight
+        The maximum number of chunks dispatched to worker processes but not yet returned if `processes` is input,
+        which defaults to twice the number of processes.
+    """
 
     func = partial(
         fit_imaging_via_database_from,
@@ -133,7 +537,15 @@ def fit_imaging_gen_from(
         settings_inversion=settings_inversion,
     )
 
-    return aggregator.map(func=func)
+    return _map_from(
+        aggregator=aggregator,
+        func=func,
+        lazy=lazy,
+        names=imaging_value_names + plane_value_names + inversion_value_names,
+        processes=processes,
+        chunk_size=chunk_size,
+        max_in_flight=max_in_flight,
+    )
 
 
 def fit_imaging_via_database_from(
@@ -175,6 +587,10 @@ def interferometer_gen_from(
     aggregator,
     real_space_mask: Optional[ag.Mask2D] = None,
     settings_interferometer: Optional[ag.SettingsInterferometer] = None,
+    lazy: bool = False,
+    processes: Optional[int] = None,
+    chunk_size: int = 1,
+    max_in_flight: Optional[int] = None,
 ):
     """
     Returns a generator of `Interferometer` objects from an input aggregator, which generates a list of the
@@ -187,7 +603,19 @@ def interferometer_gen_from(
     Parameters
     ----------
     aggregator : af.Aggregator
-        A PyAutoFit aggregator object containing the results of PyAutoGalaxy model-fits."""
+        A PyAutoFit aggregator object containing the results of PyAutoGalaxy model-fits.
+    lazy
+        If `True`, every interferometer is returned as a `LazyProxy` which only loads it when one of its attributes
+        is used. This cannot be combined with `processes`.
+    processes
+        If input, the interferometer datasets are created in parallel by this many worker processes (see
+        `parallel_map_from`).
+    chunk_size
+        The number of fits dispatched to a worker process at once if `processes` is input.
+    max_in_flight
+        The maximum number of chunks dispatched to worker processes but not yet returned if `processes` is input,
+        which defaults to twice the number of processes.
+    """
 
     func = partial(
         interferometer_via_database_from,
@@ -195,7 +623,15 @@ def interferometer_gen_from(
         settings_interferometer=settings_interferometer,
     )
 
-    return aggregator.map(func=func)
+    return _map_from(
+        aggregator=aggregator,
+        func=func,
+        lazy=lazy,
+        names=interferometer_value_names,
+        processes=processes,
+        chunk_size=chunk_size,
+        max_in_flight=max_in_flight,
+    )
 
 
 def interferometer_via_database_from(
@@ -220,25 +656,36 @@ def interferometer_via_database_from(
         model-fits.
     """
 
-    data = fit.value(name="data")
-    noise_map = fit.value(name="noise_map")
-    uv_wavelengths = fit.value(name="uv_wavelengths")
+    data = shared_array_from(fit.value(name="data"))
+    noise_map = shared_array_from(fit.value(name="noise_map"))
+    uv_wavelengths = shared_array_from(fit.value(name="uv_wavelengths"))
     real_space_mask = real_space_mask or fit.value(name="real_space_mask")
     settings_interferometer = settings_interferometer or fit.value(
         name="settings_dataset"
     )
 
-    interferometer = ag.Interferometer(
-        visibilities=data,
-        noise_map=noise_map,
-        uv_wavelengths=uv_wavelengths,
-        real_space_mask=real_space_mask,
+    def interferometer_from():
+
+        interferometer = ag.Interferometer(
+            visibilities=data,
+            noise_map=noise_map,
+            uv_wavelengths=uv_wavelengths,
+            real_space_mask=real_space_mask,
+        )
+
+        return interferometer.apply_settings(settings=settings_interferometer)
+
+    return dataset_via_cache_from(
+        values=[
+            data,
+            noise_map,
+            uv_wavelengths,
+            real_space_mask,
+            settings_interferometer,
+        ],
+        func=interferometer_from,
     )
 
-    interferometer = interferometer.apply_settings(settings=settings_interferometer)
-
-    return interferometer
-
 
 def fit_interferometer_gen_from(
     aggregator,
@@ -246,6 +693,10 @@ def fit_interferometer_gen_from(
     settings_interferometer: Optional[ag.SettingsInterferometer] = None,
     settings_pixelization: Optional[ag.SettingsPixelization] = None,
     settings_inversion: Optional[ag.SettingsInversion] = None,
+    lazy: bool = False,
+    processes: Optional[int] = None,
+    chunk_size: int = 1,
+    max_in_flight: Optional[int] = None,
 ):
     """
     Returns a `FitInterferometer` object from an aggregator's `SearchOutput` class, which we call an 'agg_obj' to
@@ -259,6 +710,16 @@ def fit_interferometer_gen_from(
     ----------
     agg_obj : af.SearchOutput
         A PyAutoFit aggregator's SearchOutput object containing the generators of the results of PyAutoGalaxy model-fits.
+    lazy
+        If `True`, every fit is returned as a `LazyProxy` which only loads it when one of its attributes is used.
+        This cannot be combined with `processes`.
+    processes
+        If input, the fits are created in parallel by this many worker processes (see `parallel_map_from`).
+    chunk_size
+        The number of fits dispatched to a worker process at once if `processes` is input.
+    max_in_flight
+        The maximum number of chunks dispatched to worker processes but not yet returned if `processes` is input,
+        which defaults to twice the number of processes.
     """
 
     func = partial(
@@ -269,7 +730,15 @@ def fit_interferometer_gen_from(
         settings_inversion=settings_inversion,
     )
 
-    return aggregator.map(func=func)
+    return _map_from(
+        aggregator=aggregator,
+        func=func,
+        lazy=lazy,
+        names=interferometer_value_names + plane_value_names + inversion_value_names,
+        processes=processes,
+        chunk_size=chunk_size,
+        max_in_flight=max_in_flight,
+    )
 
 
 def fit_interferometer_via_database_from(
@@ -0,0 +1,175 @@
+import numpy as np
+import warnings
+from functools import partial
+from autofit.database.model.fit import Fit
+
+from autogalaxy.analysis.aggregator.aggregator import plane_via_database_from
+
+
+def column_value_from(value):
+    """
+    Convert a value extracted from a plane (e.g. a `ValuesIrregular` of every light profile's axis ratio, a
+    `Grid2DIrregular` of every mass profile's centre or a float) to the value stored in a column of an exported
+    table, where numeric arrays are converted to (nested) lists of floats and NumPy scalars to Python scalars.
+
+    Arrays which are not numeric (e.g. a list of strings) or are ragged (e.g. lists of different lengths) are
+    converted element by element.
+    """
+    if value is None:
+        return None
+
+    if isinstance(value, (np.ndarray, list, tuple)):
+
+        try:
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore")
+                array = np.asarray(value)
+        except ValueError:
+            array = None
+
+        if array is not None and array.dtype.kind in "iuf":
+            return array.astype("float64").tolist()
+
+        return [column_value_from(value=element) for element in value]
+
+    if isinstance(value, np.generic):
+        return value.item()
+
+    return value
+
+
+def attribute_row_from(fit: Fit, attributes: dict) -> dict:
+    """
+    Returns a row of an exported table for one fit in the aggregator, which maps every column name in `attributes`
+    to the value of that attribute for the fit's maximum likelihood plane.
+
+    Every entry of `attributes` is either:
+
+    - A tuple `(cls, attr_name)`, which extracts the attribute of every profile of that class in the plane via
+      `Plane.extract_attribute` (e.g. `(ag.mp.MassProfile, "einstein_radius")`).
+
+    - A function which takes the plane and returns the column value, for derived quantities which need inputs (e.g.
+      `lambda plane: plane.galaxies[0].luminosity_within_circle(radius=1.0)`).
+
+    Parameters
+    ----------
+    fit
+        The aggregator's `Fit` of one set of results.
+    attributes
+        A dictionary mapping the name of every column to the attribute it is filled with.
+    """
+    plane = plane_via_database_from(fit=fit)
+
+    row = {"identifier": getattr(fit, "id", None)}
+
+    for name, attribute in attributes.items():
+
+        if callable(attribute):
+            value = attribute(plane)
+        else:
+            cls, attr_name = attribute
+            value = plane.extract_attribute(cls=cls, attr_name=attr_name)
+
+        row[name] = column_value_from(value)
+
+    return row
+
+
+def attribute_rows_gen_from(aggregator, attributes: dict):
+    """
+    Returns a generator of the rows of an exported table, one for every fit in the aggregator (see
+    `attribute_row_from`), which only holds one fit's plane in memory at a time.
+
+    Parameters
+    ----------
+    aggregator : af.Aggregator
+        A PyAutoFit aggregator object containing the results of PyAutoGalaxy model-fits.
+    attributes
+        A dictionary mapping the name of every column to the attribute it is filled with.
+    """
+    return aggregator.map(func=partial(attribute_row_from, attributes=attributes))
+
+
+def output_attributes_to_parquet(
+    aggregator, attributes: dict, file_path: str, chunk_size: int = 1000
+):
+    """
+    Output the attributes of every fit in the aggregator to a columnar Parquet file, with one row per fit and one
+    column per attribute (see `attribute_row_from`), such that the catalogue can be queried with vectorized tools
+    (e.g. pandas, pyarrow or polars).
+
+    Rows are written in chunks of `chunk_size` fits, such that the memory used is independent of the number of fits
+    in the aggregator. The schema of the file is inferred from the first chunk, so attributes which are `None` for
+    every fit in the first chunk should be avoided.
+
+    Every row also has an `identifier` column containing the unique identifier of its fit, which is used to join
+    rows back to their fits.
+
+    This requires the optional dependency `pyarrow`.
+
+    Parameters
+    ----------
+    aggregator : af.Aggregator
+        A PyAutoFit aggregator object containing the results of PyAutoGalaxy model-fits.
+    attributes
+        A dictionary mapping the name of every column to the attribute it is filled with.
+    file_path
+        The path of the .parquet file the table is output to.
+    chunk_size
+        The number of rows written to the file at once.
+    """
+    try:
+        import pyarrow as pa
+        from pyarrow import parquet as pq
+    except ImportError as e:
+        raise ImportError(
+            "Outputting aggregator results to Parquet requires pyarrow, which can be installed via "
+            "`pip install pyarrow`."
+        ) from e
+
+    writer = None
+
+    def write(rows, writer):
+
+        columns = {
+            "identifier": pa.array(
+                [
+                    None if row["identifier"] is None else str(row["identifier"])
+                    for row in rows
+                ],
+                type=pa.string(),
+            )
+        }
+        columns.update({name: [row[name] for row in rows] for name in attributes})
+
+        if writer is None:
+            table = pa.Table.from_pydict(columns)
+            writer = pq.ParquetWriter(file_path, schema=table.schema)
+        else:
+            table = pa.Table.from_pydict(columns, schema=writer.schema)
+
+        writer.write_table(table)
+
+        return writer
+
+    rows = []
+
+    try:
+
+        rows_gen = attribute_rows_gen_from(aggregator=aggregator, attributes=attributes)
+
+        for row in rows_gen:
+
+            rows.append(row)
+
+            if len(rows) == chunk_size:
+                writer = write(rows=rows, writer=writer)
+                rows = []
+
+        if rows or writer is None:
+            writer = write(rows=rows, writer=writer)
+
+    finally:
+
+        if writer is not None:
+            writer.close()
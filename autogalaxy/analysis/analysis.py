@@ -1,15 +1,29 @@
+import numpy as np
 from astropy import cosmology as cosmo
+from contextlib import contextmanager
+from typing import Optional
 
 import autofit as af
 from autoarray import preloads as pload
 from autoarray.exc import PixelizationException, InversionException, GridException
 from autoarray.inversion import pixelizations as pix, inversions as inv
 from autofit.exc import FitException
+from autogalaxy.analysis import profiling
 from autogalaxy.analysis import result as res
 from autogalaxy.analysis import visualizer as vis
 from autogalaxy.fit import fit_imaging, fit_interferometer
 from autogalaxy.galaxy import galaxy as g
 from autogalaxy.plane import plane as pl
+from autogalaxy.util import plane_util
+from autogalaxy.util import profiling_util
+
+
+@contextmanager
+def _null_context():
+    """
+    A context manager which does nothing, used instead of `contextlib.nullcontext` which requires Python 3.7.
+    """
+    yield
 
 
 class Analysis(af.Analysis):
@@ -27,6 +41,7 @@ class AnalysisDataset(Analysis):
         settings_pixelization=pix.SettingsPixelization(),
         settings_inversion=inv.SettingsInversion(),
         preloads=pload.Preloads(),
+        profiler: Optional[profiling.Profiler] = None,
     ):
 
         super().__init__(hyper_result=hyper_result, cosmology=cosmology)
@@ -48,6 +63,7 @@ class AnalysisDataset(Analysis):
         self.settings_pixelization = settings_pixelization
         self.settings_inversion = settings_inversion
         self.preloads = preloads
+        self.profiler = profiler
 
     def set_hyper_dataset(self, result):
 
@@ -67,6 +83,26 @@ class AnalysisDataset(Analysis):
     def plane_for_instance(self, instance):
         return pl.Plane(galaxies=instance.galaxies)
 
+    def profiling_for_instance(self, instance):
+        """
+        Returns the context manager a `log_likelihood_function` call of an instance is evaluated inside, which
+        records the call in the analysis's `Profiler` if it has one and otherwise does nothing.
+
+        The names of the instance's galaxies in the model (e.g. `galaxies.lens`) are passed to the profiler, so that
+        the timings of every galaxy are labelled with them.
+        """
+        if self.profiler is None:
+            return _null_context()
+
+        return self.profiler.evaluation(
+            galaxy_names={
+                id(galaxy): ".".join(galaxy_path)
+                for galaxy_path, galaxy in instance.path_instance_tuples_for_class(
+                    g.Galaxy
+                )
+            }
+        )
+
     def associate_hyper_images(self, instance: af.ModelInstance) -> af.ModelInstance:
         """
         Takes images from the last result, if there is one, and associates them with galaxies in this search
@@ -124,6 +160,102 @@ class AnalysisDataset(Analysis):
                 "hyper_galaxy_image_path_dict", self.hyper_galaxy_image_path_dict
             )
 
+    def save_profiling_for_aggregator(self, paths: af.DirectoryPaths):
+        """
+        Save the statistics of the analysis's `Profiler` (if it has one) alongside the attributes saved by
+        `save_attributes_for_aggregator`, so that they can be loaded via the aggregator as `profiling`.
+
+        This is called every time the analysis is visualized, such that the saved statistics are updated throughout
+        the non-linear search.
+        """
+        if self.profiler is not None:
+            paths.save_object("profiling", self.profiler.summary)
+
+    def visualize(self, paths: af.DirectoryPaths, instance, during_analysis):
+        """
+        Visualize the maximum likelihood fit of a non-linear search, by passing its model instance to
+        `visualize_to_path`.
+
+        The fits of the instance are computed in the search's process, and are then plotted by a module-level
+        function of `visualizer` (see `visualize_via_function`). If the `asynchronous` entry of the [visualize]
+        section of the general.ini config is `True`, the fits are snapshotted and plotted in a background process
+        pool, such that the non-linear search continues sampling while their figures are written. At the end of the
+        search (`during_analysis=False`) this waits for every pending visualization to finish.
+
+        If the `incremental` entry of the [visualize] section is `True`, visualization is skipped when the instance
+        is unchanged since it was last visualized successfully in the same output folder. If visualization is
+        performed in the search's process only figures whose underlying arrays have changed are then rewritten,
+        whereas the background processes of the pool, whose recorded hashes are not shared, rewrite every figure.
+        """
+        self.save_profiling_for_aggregator(paths=paths)
+
+        instance_hash = None
+
+        if vis.incremental_from_config():
+
+            instance_hash = vis.hash_from(
+                values=[vis.values_of_instance_from(instance=instance), during_analysis]
+            )
+
+            if vis.is_unchanged_from(
+                visualize_path=paths.image_path,
+                name="instance",
+                value_hash=instance_hash,
+            ):
+                return
+
+        future = self.visualize_to_path(
+            visualize_path=paths.image_path,
+            instance=instance,
+            during_analysis=during_analysis,
+        )
+
+        if instance_hash is not None:
+            vis.record_hash(
+                visualize_path=paths.image_path,
+                name="instance",
+                value_hash=instance_hash,
+                future=future,
+            )
+
+    def visualize_to_path(self, visualize_path: str, instance, during_analysis):
+        """
+        Visualize the fit of a model instance in an output folder, returning the future of the visualization if it
+        is dispatched to the `VisualizerPool` and otherwise `None` (see `visualize_via_function`).
+        """
+        raise NotImplementedError()
+
+    @staticmethod
+    def visualize_via_function(func, visualize_path: str, during_analysis, **kwargs):
+        """
+        Call a module-level visualization function of `visualizer` (e.g. `visualize_fit_imaging_from`) with the fits
+        and arrays it plots, in a background process of the `VisualizerPool` if visualization is asynchronous and
+        otherwise in the search's process.
+
+        Returns the future of the visualization if it is dispatched to the pool, and otherwise `None`. Figures are
+        not skipped incrementally in the pool's processes, as the hashes they record are not shared between them.
+        """
+        visualizer_pool = vis.visualizer_pool_from_config()
+
+        if visualizer_pool is None:
+            func(
+                visualize_path=visualize_path, during_analysis=during_analysis, **kwargs
+            )
+            return None
+
+        future = visualizer_pool.submit(
+            func,
+            visualize_path=visualize_path,
+            during_analysis=during_analysis,
+            incremental=False,
+            **kwargs
+        )
+
+        if not during_analysis:
+            visualizer_pool.wait()
+
+        return future
+
 
 class AnalysisImaging(AnalysisDataset):
     def __init__(
@@ -134,7 +266,19 @@ class AnalysisImaging(AnalysisDataset):
         settings_pixelization=pix.SettingsPixelization(),
         settings_inversion=inv.SettingsInversion(),
         preloads=pload.Preloads(),
+        profiler: Optional[profiling.Profiler] = None,
+        use_linear_light_profiles: bool = False,
     ):
+        """
+        Fits a model of galaxies to imaging data.
+
+        Parameters
+        ----------
+        use_linear_light_profiles
+            If `True`, the intensities of the galaxies' light profiles are solved for via linear algebra in every
+            `FitImaging` instead of being taken from the model, such that they can be fixed in the model to reduce
+            its dimensionality. See `fit_imaging.linear_light_profile_intensities_from`.
+        """
 
         super().__init__(
             dataset=dataset,
@@ -143,9 +287,11 @@ class AnalysisImaging(AnalysisDataset):
             settings_pixelization=settings_pixelization,
             settings_inversion=settings_inversion,
             preloads=preloads,
+            profiler=profiler,
         )
 
         self.dataset = dataset
+        self.use_linear_light_profiles = use_linear_light_profiles
 
     @property
     def imaging(self):
@@ -166,26 +312,105 @@ class AnalysisImaging(AnalysisDataset):
             A fractional value indicating how well this model fit and the model imaging itself
         """
 
-        self.associate_hyper_images(instance=instance)
-        plane = self.plane_for_instance(instance=instance)
+        with self.profiling_for_instance(instance=instance):
 
-        hyper_image_sky = self.hyper_image_sky_for_instance(instance=instance)
+            with profiling_util.section(name="associate_hyper_images"):
+                self.associate_hyper_images(instance=instance)
 
-        hyper_background_noise = self.hyper_background_noise_for_instance(
-            instance=instance
-        )
+            with profiling_util.section(name="plane_for_instance"):
+                plane = self.plane_for_instance(instance=instance)
 
-        try:
-            fit = self.fit_imaging_for_plane(
-                plane=plane,
-                hyper_image_sky=hyper_image_sky,
-                hyper_background_noise=hyper_background_noise,
+            hyper_image_sky = self.hyper_image_sky_for_instance(instance=instance)
+
+            hyper_background_noise = self.hyper_background_noise_for_instance(
+                instance=instance
             )
 
-            return fit.figure_of_merit
-        except (PixelizationException, InversionException, GridException) as e:
+            try:
+                with profiling_util.section(name="fit"):
+                    fit = self.fit_imaging_for_plane(
+                        plane=plane,
+                        hyper_image_sky=hyper_image_sky,
+                        hyper_background_noise=hyper_background_noise,
+                    )
+
+                with profiling_util.section(name="figure_of_merit"):
+                    return fit.figure_of_merit
+            except (PixelizationException, InversionException, GridException) as e:
+                raise FitException from e
+
+    def figures_of_merit_from_instances(self, instances):
+        """
+        Determine the figure of merit of a list of model instances, returning one value per instance in the same
+        order as the input list.
+
+        The figures of merit are identical to calling `log_likelihood_function` on every instance, however the
+        per-instance Python overhead of creating a `FitImaging` is avoided where possible. For every instance whose
+        plane only contains light profiles (e.g. no pixelization, hyper galaxies, hyper image sky or hyper
+        background noise) the plane images are evaluated on the shared `grid` and `blurring_grid`, stacked and blurred
+        in a single pass of the `Convolver`, and their log likelihoods are computed as one NumPy calculation.
+
+        All other instances are fitted individually via `log_likelihood_function`.
+
+        Parameters
+        ----------
+        instances : [af.ModelInstance]
+            The model instances whose figures of merit are computed.
+
+        Returns
+        -------
+        np.ndarray
+            The figure of merit of every instance.
+        """
+
+        figures_of_merit = np.zeros(len(instances))
+
+        batch_indexes = []
+        batch_planes = []
+
+        for index, instance in enumerate(instances):
+
+            self.associate_hyper_images(instance=instance)
+            plane = self.plane_for_instance(instance=instance)
+
+            if (
+                self.use_linear_light_profiles
+                or plane.has_pixelization
+                or plane.has_hyper_galaxy
+                or self.hyper_image_sky_for_instance(instance=instance) is not None
+                or self.hyper_background_noise_for_instance(instance=instance)
+                is not None
+            ):
+                figures_of_merit[index] = self.log_likelihood_function(
+                    instance=instance
+                )
+            else:
+                batch_indexes.append(index)
+                batch_planes.append(plane)
+
+        if not batch_planes:
+            return figures_of_merit
+
+        try:
+            model_images = plane_util.blurred_images_of_planes_from(
+                planes=batch_planes,
+                grid=self.imaging.grid,
+                convolver=self.imaging.convolver,
+                blurring_grid=self.imaging.blurring_grid,
+            )
+        except GridException as e:
             raise FitException from e
 
+        figures_of_merit[
+            batch_indexes
+        ] = fit_imaging.log_likelihoods_from_image_noise_map_and_model_images(
+            image=self.imaging.image,
+            noise_map=self.imaging.noise_map,
+            model_images=model_images,
+        )
+
+        return figures_of_merit
+
     def fit_imaging_for_plane(
         self, plane, hyper_image_sky, hyper_background_noise, use_hyper_scalings=True
     ):
@@ -198,9 +423,10 @@ class AnalysisImaging(AnalysisDataset):
             use_hyper_scalings=use_hyper_scalings,
             settings_pixelization=self.settings_pixelization,
             settings_inversion=self.settings_inversion,
+            use_linear_light_profiles=self.use_linear_light_profiles,
         )
 
-    def visualize(self, paths: af.DirectoryPaths, instance, during_analysis):
+    def visualize_to_path(self, visualize_path: str, instance, during_analysis):
 
         instance = self.associate_hyper_images(instance=instance)
         plane = self.plane_for_instance(instance=instance)
@@ -215,33 +441,27 @@ class AnalysisImaging(AnalysisDataset):
             hyper_background_noise=hyper_background_noise,
         )
 
-        visualizer = vis.Visualizer(visualize_path=paths.image_path)
-        visualizer.visualize_imaging(imaging=self.imaging)
-        visualizer.visualize_fit_imaging(fit=fit, during_analysis=during_analysis)
+        fit_no_hyper = None
 
-        if fit.inversion is not None:
-            visualizer.visualize_inversion(
-                inversion=fit.inversion, during_analysis=during_analysis
-            )
+        if vis.plot_setting("hyper", "fit_no_hyper"):
 
-        visualizer.visualize_hyper_images(
-            hyper_galaxy_image_path_dict=self.hyper_galaxy_image_path_dict,
-            hyper_model_image=self.hyper_model_image,
-            plane=plane,
-        )
-
-        if visualizer.plot_fit_no_hyper:
-
-            fit = self.fit_imaging_for_plane(
+            fit_no_hyper = self.fit_imaging_for_plane(
                 plane=plane,
                 hyper_image_sky=None,
                 hyper_background_noise=None,
                 use_hyper_scalings=False,
             )
 
-            visualizer.visualize_fit_imaging(
-                fit=fit, during_analysis=during_analysis, subfolders="fit_no_hyper"
-            )
+        return self.visualize_via_function(
+            func=vis.visualize_fit_imaging_from,
+            visualize_path=visualize_path,
+            during_analysis=during_analysis,
+            imaging=self.imaging,
+            fit=fit,
+            fit_no_hyper=fit_no_hyper,
+            hyper_galaxy_image_path_dict=self.hyper_galaxy_image_path_dict,
+            hyper_model_image=self.hyper_model_image,
+        )
 
     def make_result(
         self, samples: af.PDFSamples, model: af.Collection, search: af.NonLinearSearch
@@ -267,6 +487,7 @@ class AnalysisInterferometer(AnalysisDataset):
         settings_pixelization=pix.SettingsPixelization(),
         settings_inversion=inv.SettingsInversion(),
         preloads=pload.Preloads(),
+        profiler: Optional[profiling.Profiler] = None,
     ):
 
         super().__init__(
@@ -276,6 +497,7 @@ class AnalysisInterferometer(AnalysisDataset):
             settings_pixelization=settings_pixelization,
             settings_inversion=settings_inversion,
             preloads=preloads,
+            profiler=profiler,
         )
 
         if self.hyper_result is not None:
@@ -315,21 +537,28 @@ class AnalysisInterferometer(AnalysisDataset):
             A fractional value indicating how well this model fit and the model interferometer itself
         """
 
-        self.associate_hyper_images(instance=instance)
-        plane = self.plane_for_instance(instance=instance)
+        with self.profiling_for_instance(instance=instance):
 
-        hyper_background_noise = self.hyper_background_noise_for_instance(
-            instance=instance
-        )
+            with profiling_util.section(name="associate_hyper_images"):
+                self.associate_hyper_images(instance=instance)
 
-        try:
-            fit = self.fit_interferometer_for_plane(
-                plane=plane, hyper_background_noise=hyper_background_noise
+            with profiling_util.section(name="plane_for_instance"):
+                plane = self.plane_for_instance(instance=instance)
+
+            hyper_background_noise = self.hyper_background_noise_for_instance(
+                instance=instance
             )
 
-            return fit.figure_of_merit
-        except (PixelizationException, InversionException, GridException) as e:
-            raise FitException from e
+            try:
+                with profiling_util.section(name="fit"):
+                    fit = self.fit_interferometer_for_plane(
+                        plane=plane, hyper_background_noise=hyper_background_noise
+                    )
+
+                with profiling_util.section(name="figure_of_merit"):
+                    return fit.figure_of_merit
+            except (PixelizationException, InversionException, GridException) as e:
+                raise FitException from e
 
     def associate_hyper_visibilities(
         self, instance: af.ModelInstance
@@ -382,7 +611,7 @@ class AnalysisInterferometer(AnalysisDataset):
             settings_inversion=self.settings_inversion,
         )
 
-    def visualize(self, paths: af.DirectoryPaths, instance, during_analysis):
+    def visualize_to_path(self, visualize_path: str, instance, during_analysis):
 
         self.associate_hyper_images(instance=instance)
         plane = self.plane_for_instance(instance=instance)
@@ -394,31 +623,24 @@ class AnalysisInterferometer(AnalysisDataset):
             plane=plane, hyper_background_noise=hyper_background_noise
         )
 
-        visualizer = vis.Visualizer(visualize_path=paths.image_path)
-        visualizer.visualize_interferometer(interferometer=self.interferometer)
-        visualizer.visualize_fit_interferometer(
-            fit=fit, during_analysis=during_analysis
-        )
-        if fit.inversion is not None:
-            visualizer.visualize_inversion(
-                inversion=fit.inversion, during_analysis=during_analysis
+        fit_no_hyper = None
+
+        if vis.plot_setting("hyper", "fit_no_hyper"):
+            fit_no_hyper = self.fit_interferometer_for_plane(
+                plane=plane, hyper_background_noise=None, use_hyper_scalings=False
             )
 
-        visualizer.visualize_hyper_images(
+        return self.visualize_via_function(
+            func=vis.visualize_fit_interferometer_from,
+            visualize_path=visualize_path,
+            during_analysis=during_analysis,
+            interferometer=self.interferometer,
+            fit=fit,
+            fit_no_hyper=fit_no_hyper,
             hyper_galaxy_image_path_dict=self.hyper_galaxy_image_path_dict,
             hyper_model_image=self.hyper_model_image,
-            plane=plane,
         )
 
-        if visualizer.plot_fit_no_hyper:
-            fit = self.fit_interferometer_for_plane(
-                plane=plane, hyper_background_noise=None, use_hyper_scalings=False
-            )
-
-            visualizer.visualize_fit_interferometer(
-                fit=fit, during_analysis=during_analysis, subfolders="fit_no_hyper"
-            )
-
     def make_result(
         self, samples: af.PDFSamples, model: af.Collection, search: af.NonLinearSearch
     ):
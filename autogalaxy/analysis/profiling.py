@@ -0,0 +1,132 @@
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+from autogalaxy.util.profiling_util import set_active_profiler
+
+
+class Profiler:
+    def __init__(self, trace_memory: bool = False):
+        """
+        Records the wall time and allocations of every step of a `log_likelihood_function` call (e.g. plane
+        construction, the image of every light profile of every galaxy, convolution, the inversion), aggregated over
+        every call made while it is passed to an `Analysis`.
+
+        Steps are timed using the `section` context manager, which the functions performing each step call via the
+        `section` function of `profiling_util`. This does nothing unless a profiler is active, which is only the case
+        inside the `evaluation` of a `log_likelihood_function` call, where the profiler sets itself as the active
+        profiler, so profiling is opt-in and has no cost if no profiler is used.
+
+        Every step records the number of memory blocks allocated by the Python interpreter (via
+        `sys.getallocatedblocks`) and, if `trace_memory` is `True`, the number of bytes allocated (via
+        `tracemalloc`, which includes NumPy arrays but slows down every allocation).
+
+        Parameters
+        ----------
+        trace_memory
+            If `True`, `tracemalloc` is started and the bytes allocated by every step are recorded.
+        """
+        self.trace_memory = trace_memory
+
+        self.evaluations = 0
+        self.stats = {}
+        self.galaxy_names = {}
+
+    @contextmanager
+    def evaluation(self, galaxy_names: dict = None):
+        """
+        Context manager which activates the profiler for one `log_likelihood_function` call, whose total time is
+        recorded under the `log_likelihood_function` section.
+
+        Parameters
+        ----------
+        galaxy_names
+            A dictionary mapping the `id` of every galaxy in the model instance to its name in the model (e.g.
+            `galaxies.lens`), which sections breaking their timings down by galaxy are labelled with.
+        """
+        if self.trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+        self.galaxy_names = galaxy_names or {}
+        set_active_profiler(profiler=self)
+
+        try:
+            with self.section(name="log_likelihood_function"):
+                yield
+        finally:
+            set_active_profiler(profiler=None)
+            self.galaxy_names = {}
+            self.evaluations += 1
+
+    def key_from(self, name: str, galaxy=None, profile=None) -> str:
+        """
+        Returns the key a section's statistics are stored under, which breaks the section down by galaxy and
+        profile class if they are input (e.g. `image_2d_from_grid/galaxies.lens/EllSersic`).
+        """
+        key = name
+
+        if galaxy is not None:
+            galaxy_name = self.galaxy_names.get(id(galaxy), f"galaxy_{galaxy.id}")
+            key = f"{key}/{galaxy_name}"
+
+        if profile is not None:
+            key = f"{key}/{profile.__class__.__name__}"
+
+        return key
+
+    @contextmanager
+    def section(self, name: str, galaxy=None, profile=None):
+        """
+        Context manager which records the wall time and allocations of the code it wraps under the section's key.
+
+        Sections may be nested, in which case the time of an outer section includes that of the sections inside it.
+        """
+        trace_memory = self.trace_memory and tracemalloc.is_tracing()
+
+        blocks = sys.getallocatedblocks()
+        traced_bytes = tracemalloc.get_traced_memory()[0] if trace_memory else 0
+        start = time.perf_counter()
+
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+
+            key = self.key_from(name=name, galaxy=galaxy, profile=profile)
+
+            stats = self.stats.setdefault(
+                key,
+                {
+                    "calls": 0,
+                    "total_time": 0.0,
+                    "max_time": 0.0,
+                    "allocated_blocks": 0,
+                    "allocated_bytes": 0,
+                },
+            )
+
+            stats["calls"] += 1
+            stats["total_time"] += elapsed
+            stats["max_time"] = max(stats["max_time"], elapsed)
+            stats["allocated_blocks"] += sys.getallocatedblocks() - blocks
+
+            if trace_memory:
+                stats["allocated_bytes"] += (
+                    tracemalloc.get_traced_memory()[0] - traced_bytes
+                )
+
+    @property
+    def summary(self) -> dict:
+        """
+        The aggregated statistics of every section, including the mean time per call, as a dictionary which can be
+        output to .json or saved for the aggregator.
+        """
+        return {
+            "evaluations": self.evaluations,
+            "trace_memory": self.trace_memory,
+            "sections": {
+                key: {**stats, "mean_time": stats["total_time"] / stats["calls"]}
+                for key, stats in sorted(self.stats.items())
+            },
+        }
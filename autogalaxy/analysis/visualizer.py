@@ -1,4 +1,11 @@
+import hashlib
+import multiprocessing
+import numpy as np
+import pickle
+import sys
+from concurrent.futures import ProcessPoolExecutor
 from os import path
+from typing import Optional
 
 from autoconf import conf
 from autoarray.plot.mat_wrap.wrap import wrap_base
@@ -20,15 +27,292 @@ def plot_setting(section, name):
     return setting(section, name)
 
 
-class Visualizer:
-    def __init__(self, visualize_path):
+def incremental_from_config() -> bool:
+    """
+    Returns the `incremental` entry of the [visualize] section of the general.ini config, which if `True` means
+    figures whose underlying arrays are unchanged since they were last visualized are not rewritten.
+    """
+    return conf.instance["general"]["visualize"]["incremental"]
+
+
+_visualization_hashes = {}
+
+
+def hash_from(values) -> str:
+    """
+    Returns a hash of a list of values (e.g. the arrays a figure plots), where NumPy arrays are hashed via their
+    shape and raw bytes and all other values via their pickled bytes.
+    """
+    sha = hashlib.sha1()
+
+    for value in values:
+
+        if isinstance(value, np.ndarray):
+            sha.update(str(value.shape).encode())
+            sha.update(np.ascontiguousarray(value).tobytes())
+        else:
+            sha.update(pickle.dumps(value))
+
+    return sha.hexdigest()
+
+
+def values_of_instance_from(instance, _ancestor_ids=()):
+    """
+    Returns the values of the public attributes of a model instance and (recursively) of the galaxies, profiles and
+    other objects it contains as nested tuples, which are passed to `hash_from` to hash the instance.
+
+    The `id` and `component_number` attributes are counters which differ between instances created from the same
+    parameters (e.g. every maximum likelihood instance of a non-linear search), so they are omitted such that equal
+    instances have the same hash.
+    """
+    if isinstance(instance, np.ndarray):
+        return (instance.shape, np.ascontiguousarray(instance).tobytes())
+
+    if id(instance) in _ancestor_ids:
+        return None
+
+    ancestor_ids = _ancestor_ids + (id(instance),)
+
+    if isinstance(instance, (list, tuple)):
+        return tuple(
+            values_of_instance_from(instance=value, _ancestor_ids=ancestor_ids)
+            for value in instance
+        )
+
+    if isinstance(instance, dict):
+        return tuple(
+            (
+                str(key),
+                values_of_instance_from(instance=value, _ancestor_ids=ancestor_ids),
+            )
+            for key, value in sorted(instance.items(), key=lambda item: str(item[0]))
+        )
+
+    if hasattr(instance, "__dict__"):
+        return (instance.__class__.__name__,) + values_of_instance_from(
+            instance={
+                key: value
+                for key, value in vars(instance).items()
+                if not key.startswith("_") and key not in ("id", "component_number")
+            },
+            _ancestor_ids=ancestor_ids,
+        )
+
+    return instance
+
+
+def is_unchanged_from(visualize_path: str, name: str, value_hash: str) -> bool:
+    """
+    Returns `True` if the hash of the values visualized under a name (e.g. `fit_imaging/model`) in an output folder
+    is the same as the hash recorded by `record_hash` the last time they were visualized there, in which case their
+    figures do not need rewriting.
+
+    Parameters
+    ----------
+    visualize_path
+        The output folder the figures are written to.
+    name
+        The name of the group of figures the values are plotted in.
+    value_hash
+        The hash of the values (e.g. arrays, a model instance) the group of figures is plotted from (see `hash_from`).
+    """
+    return _visualization_hashes.get((visualize_path, name)) == value_hash
+
+
+def record_hash(visualize_path: str, name: str, value_hash: str, future=None):
+    """
+    Record the hash of the values visualized under a name in an output folder, such that `is_unchanged_from` skips
+    the next visualization of the same values.
+
+    Hashes are only recorded once the figures have been written successfully, such that a visualization which fails
+    is not skipped the next time. If the visualization was dispatched to the `VisualizerPool`, its future is input
+    and the hash is recorded when it finishes without an exception, and is not recorded while it is pending.
+    """
+
+    def record(future=None):
+        if future is None or future.exception() is None:
+            _visualization_hashes[(visualize_path, name)] = value_hash
+
+    if future is None:
+        record()
+    else:
+        future.add_done_callback(record)
+
+
+def _call_from_snapshot(snapshot):
+    func, args, kwargs = pickle.loads(snapshot)
+    return func(*args, **kwargs)
+
+
+class VisualizerPool:
+    def __init__(self, processes: int = 1):
+        """
+        A pool of background processes which visualization is dispatched to, such that a non-linear search continues
+        sampling while figures are written.
+
+        The function and arguments of every visualization are pickled when it is submitted, which snapshots them so
+        that changes made by the search afterwards do not change what is plotted. Pickling is performed in the
+        search's process, so the function should be a module-level function whose arguments are only what is plotted
+        (e.g. `visualize_fit_imaging_from` and the fits of the maximum likelihood model), as opposed to a bound method
+        of the analysis, which would pickle its dataset, hyper images and preloads every time.
+
+        The processes are created by forking, so that they inherit the configs and matplotlib backend of the search.
+        The pool is therefore only used on platforms which support forking.
+
+        Parameters
+        ----------
+        processes
+            The number of background processes visualization is performed in.
+        """
+        self.processes = processes
+        self.executor = None
+        self.futures = []
+
+    def submit(self, func, *args, **kwargs):
+        """
+        Dispatch `func(*args, **kwargs)` to a background process, after waiting for the oldest pending visualization if there
+        are already twice as many pending visualizations as processes, such that visualization cannot fall
+        arbitrarily far behind the search.
+
+        An exception raised by a finished visualization is raised when it is collected by this method or `wait`.
+
+        Returns the future of the submitted visualization.
+        """
+        if self.executor is None:
+
+            if sys.version_info >= (3, 7):
+                self.executor = ProcessPoolExecutor(
+                    max_workers=self.processes,
+                    mp_context=multiprocessing.get_context("fork"),
+                )
+            else:
+                self.executor = ProcessPoolExecutor(max_workers=self.processes)
+
+        snapshot = pickle.dumps((func, args, kwargs))
+
+        self.futures = [future for future in self.futures if not self.collect(future)]
+
+        while len(self.futures) >= 2 * self.processes:
+            self.futures.pop(0).result()
 
+        future = self.executor.submit(_call_from_snapshot, snapshot)
+
+        self.futures.append(future)
+
+        return future
+
+    @staticmethod
+    def collect(future) -> bool:
+        """
+        Returns `True` if a visualization has finished, raising its exception if it failed, and `False` if it is
+        still pending.
+        """
+        if future.done():
+            future.result()
+            return True
+
+        return False
+
+    def wait(self):
+        """
+        Wait for every pending visualization to finish.
+        """
+        while self.futures:
+            self.futures.pop(0).result()
+
+
+_visualizer_pool = None
+
+
+def visualizer_pool_from_config():
+    """
+    Returns the `VisualizerPool` visualization is dispatched to if the `asynchronous` entry of the [visualize]
+    section of the general.ini config is `True`, or `None` if visualization is performed in the search's process.
+
+    Visualization is also performed in the search's process on platforms which cannot fork processes.
+    """
+    global _visualizer_pool
+
+    visualize_config = conf.instance["general"]["visualize"]
+
+    if not visualize_config["asynchronous"]:
+        return None
+
+    if "fork" not in multiprocessing.get_all_start_methods():
+        return None
+
+    if _visualizer_pool is None:
+        _visualizer_pool = VisualizerPool(processes=visualize_config["processes"])
+
+    return _visualizer_pool
+
+
+class Visualizer:
+    def __init__(self, visualize_path, incremental: Optional[bool] = None):
+        """
+        Visualizes datasets, fits and inversions by writing their figures to an output folder.
+
+        Parameters
+        ----------
+        visualize_path
+            The output folder the figures are written to.
+        incremental
+            Whether groups of figures whose underlying arrays are unchanged since they were last visualized are
+            skipped, where `None` uses the `incremental` entry of the [visualize] section of the general.ini config.
+            This is `False` in the background processes of the `VisualizerPool`, whose recorded hashes are not
+            shared with the search's process.
+        """
         self.visualize_path = visualize_path
 
         self.plot_fit_no_hyper = plot_setting("hyper", "fit_no_hyper")
 
         self.include_2d = lensing_include.Include2D()
 
+        self.incremental = (
+            incremental_from_config() if incremental is None else incremental
+        )
+
+        self._pending_hashes = {}
+
+    def is_unchanged(self, name: str, values, during_analysis: bool = True) -> bool:
+        """
+        Returns `True` if visualization is incremental and the values a group of figures is plotted from are
+        unchanged since they were last visualized in this visualizer's output folder, such that the figures can be
+        skipped.
+
+        If the values have changed their hash is pending until the figures are written, after which it is recorded
+        via `record_visualized`.
+
+        Figures are always written at the end of the analysis (`during_analysis=False`).
+        """
+        if not self.incremental or not during_analysis:
+            return False
+
+        value_hash = hash_from(values=values)
+
+        if is_unchanged_from(
+            visualize_path=self.visualize_path, name=name, value_hash=value_hash
+        ):
+            return True
+
+        self._pending_hashes[name] = value_hash
+
+        return False
+
+    def record_visualized(self, *names):
+        """
+        Record the pending hashes of groups of figures checked by `is_unchanged`, which is called once they have been
+        written successfully.
+        """
+        for name in names:
+
+            value_hash = self._pending_hashes.pop(name, None)
+
+            if value_hash is not None:
+                record_hash(
+                    visualize_path=self.visualize_path, name=name, value_hash=value_hash
+                )
+
     def mat_plot_1d_from(self, subfolders, format="png"):
         return lensing_mat_plot.MatPlot1D(
             output=wrap_base.Output(
@@ -47,6 +331,11 @@ class Visualizer:
         def should_plot(name):
             return plot_setting(section="dataset", name=name)
 
+        if self.is_unchanged(
+            name="imaging", values=[imaging.image, imaging.noise_map, imaging.psf]
+        ):
+            return
+
         mat_plot_2d = self.mat_plot_2d_from(subfolders="imaging")
 
         imaging_plotter = imaging_plotters.ImagingPlotter(
@@ -67,9 +356,23 @@ class Visualizer:
 
             imaging_plotter.subplot_imaging()
 
+        self.record_visualized("imaging")
+
     def visualize_fit_imaging(self, fit, during_analysis, subfolders="fit_imaging"):
-        def should_plot(name):
-            return plot_setting(section="fit", name=name)
+        plot_data = not self.is_unchanged(
+            name=f"{subfolders}/data",
+            values=[fit.data, fit.noise_map],
+            during_analysis=during_analysis,
+        )
+
+        plot_model = not self.is_unchanged(
+            name=f"{subfolders}/model",
+            values=[fit.data, fit.noise_map, fit.model_data],
+            during_analysis=during_analysis,
+        )
+
+        def should_plot(name, plot=plot_model):
+            return plot and plot_setting(section="fit", name=name)
 
         mat_plot_2d = self.mat_plot_2d_from(subfolders=subfolders)
 
@@ -78,9 +381,9 @@ class Visualizer:
         )
 
         fit_imaging_plotter.figures_2d(
-            image=should_plot("data"),
-            noise_map=should_plot("noise_map"),
-            signal_to_noise_map=should_plot("signal_to_noise_map"),
+            image=should_plot("data", plot=plot_data),
+            noise_map=should_plot("noise_map", plot=plot_data),
+            signal_to_noise_map=should_plot("signal_to_noise_map", plot=plot_data),
             model_image=should_plot("model_data"),
             residual_map=should_plot("residual_map"),
             chi_squared_map=should_plot("chi_squared_map"),
@@ -140,10 +443,22 @@ class Visualizer:
                     subtracted_image=True, model_image=True
                 )
 
+        self.record_visualized(f"{subfolders}/data", f"{subfolders}/model")
+
     def visualize_interferometer(self, interferometer):
         def should_plot(name):
             return plot_setting(section="dataset", name=name)
 
+        if self.is_unchanged(
+            name="interferometer",
+            values=[
+                interferometer.visibilities,
+                interferometer.noise_map,
+                interferometer.uv_wavelengths,
+            ],
+        ):
+            return
+
         mat_plot_2d = self.mat_plot_2d_from(subfolders="interferometer")
 
         interferometer_plotter = interferometer_plotters.InterferometerPlotter(
@@ -161,11 +476,25 @@ class Visualizer:
             v_wavelengths=should_plot("uv_wavelengths"),
         )
 
+        self.record_visualized("interferometer")
+
     def visualize_fit_interferometer(
         self, fit, during_analysis, subfolders="fit_interferometer"
     ):
-        def should_plot(name):
-            return plot_setting(section="fit", name=name)
+        plot_data = not self.is_unchanged(
+            name=f"{subfolders}/data",
+            values=[fit.data, fit.noise_map],
+            during_analysis=during_analysis,
+        )
+
+        plot_model = not self.is_unchanged(
+            name=f"{subfolders}/model",
+            values=[fit.data, fit.noise_map, fit.model_data],
+            during_analysis=during_analysis,
+        )
+
+        def should_plot(name, plot=plot_model):
+            return plot and plot_setting(section="fit", name=name)
 
         mat_plot_1d = self.mat_plot_1d_from(subfolders=subfolders)
         mat_plot_2d = self.mat_plot_2d_from(subfolders=subfolders)
@@ -182,9 +511,9 @@ class Visualizer:
             fit_interferometer_plotter.subplot_fit_real_space()
 
         fit_interferometer_plotter.figures_2d(
-            visibilities=should_plot("data"),
-            noise_map=should_plot("noise_map"),
-            signal_to_noise_map=should_plot("signal_to_noise_map"),
+            visibilities=should_plot("data", plot=plot_data),
+            noise_map=should_plot("noise_map", plot=plot_data),
+            signal_to_noise_map=should_plot("signal_to_noise_map", plot=plot_data),
             model_visibilities=should_plot("model_data"),
             residual_map_real=should_plot("residual_map"),
             residual_map_imag=should_plot("residual_map"),
@@ -234,10 +563,19 @@ class Visualizer:
                     normalized_residual_map_imag=True,
                 )
 
+        self.record_visualized(f"{subfolders}/data", f"{subfolders}/model")
+
     def visualize_inversion(self, inversion, during_analysis):
         def should_plot(name):
             return plot_setting(section="inversion", name=name)
 
+        if self.is_unchanged(
+            name="inversion",
+            values=[inversion.reconstruction, inversion.mapped_reconstructed_image],
+            during_analysis=during_analysis,
+        ):
+            return
+
         mat_plot_2d = self.mat_plot_2d_from(subfolders="inversion")
 
         inversion_plotter = inversion_plotters.InversionPlotter(
@@ -275,11 +613,18 @@ class Visualizer:
                     interpolated_errors=True,
                 )
 
+        self.record_visualized("inversion")
+
     def visualize_hyper_images(
         self, hyper_galaxy_image_path_dict, hyper_model_image, plane
     ):
-        def should_plot(name):
-            return plot_setting(section="hyper", name=name)
+        plot_hyper_images = not self.is_unchanged(
+            name="hyper/images",
+            values=[hyper_model_image, hyper_galaxy_image_path_dict],
+        )
+
+        def should_plot(name, plot=plot_hyper_images):
+            return plot and plot_setting(section="hyper", name=name)
 
         mat_plot_2d = self.mat_plot_2d_from(subfolders="hyper")
 
@@ -297,11 +642,21 @@ class Visualizer:
             )
 
         if hasattr(plane, "contribution_maps_of_galaxies"):
-            if should_plot("contribution_maps_of_galaxies"):
+
+            plot_contribution_maps = not self.is_unchanged(
+                name="hyper/contribution_maps",
+                values=[plane.contribution_maps_of_galaxies],
+            )
+
+            if should_plot(
+                "contribution_maps_of_galaxies", plot=plot_contribution_maps
+            ):
                 hyper_plotter.subplot_contribution_maps_of_galaxies(
                     contribution_maps_of_galaxies=plane.contribution_maps_of_galaxies
                 )
 
+        self.record_visualized("hyper/images", "hyper/contribution_maps")
+
     def visualize_galaxy_fit(self, fit, visuals_2d=None):
         def should_plot(name):
             return plot_setting(section="galaxy_fit", name=name)
@@ -334,3 +689,97 @@ class Visualizer:
             residual_map=should_plot("residual_map"),
             chi_squared_map=should_plot("chi_squared_map"),
         )
+
+
+def visualize_fit_imaging_from(
+    visualize_path: str,
+    during_analysis: bool,
+    imaging,
+    fit,
+    fit_no_hyper,
+    hyper_galaxy_image_path_dict,
+    hyper_model_image,
+    incremental: Optional[bool] = None,
+):
+    """
+    Visualize the imaging dataset and fit of the maximum likelihood model of an `AnalysisImaging`, which the analysis
+    computes before calling this function either directly or via the `VisualizerPool`.
+
+    This is a module-level function whose arguments are only what is plotted, such that the visualizer pool pickles
+    the fits and their arrays, as opposed to the analysis.
+
+    Parameters
+    ----------
+    visualize_path
+        The output folder the figures are written to.
+    during_analysis
+        Whether visualization is performed during the non-linear search, as opposed to at its end.
+    imaging
+        The masked imaging dataset which is fitted.
+    fit
+        The fit of the maximum likelihood model.
+    fit_no_hyper
+        The fit of the maximum likelihood model without hyper-scalings, or `None` if it is not visualized.
+    hyper_galaxy_image_path_dict
+        The hyper images of every galaxy of the analysis.
+    hyper_model_image
+        The hyper model image of the analysis.
+    incremental
+        Whether unchanged groups of figures are skipped (see `Visualizer`).
+    """
+    visualizer = Visualizer(visualize_path=visualize_path, incremental=incremental)
+    visualizer.visualize_imaging(imaging=imaging)
+    visualizer.visualize_fit_imaging(fit=fit, during_analysis=during_analysis)
+
+    if fit.inversion is not None:
+        visualizer.visualize_inversion(
+            inversion=fit.inversion, during_analysis=during_analysis
+        )
+
+    visualizer.visualize_hyper_images(
+        hyper_galaxy_image_path_dict=hyper_galaxy_image_path_dict,
+        hyper_model_image=hyper_model_image,
+        plane=fit.plane,
+    )
+
+    if fit_no_hyper is not None:
+        visualizer.visualize_fit_imaging(
+            fit=fit_no_hyper, during_analysis=during_analysis, subfolders="fit_no_hyper"
+        )
+
+
+def visualize_fit_interferometer_from(
+    visualize_path: str,
+    during_analysis: bool,
+    interferometer,
+    fit,
+    fit_no_hyper,
+    hyper_galaxy_image_path_dict,
+    hyper_model_image,
+    incremental: Optional[bool] = None,
+):
+    """
+    Visualize the interferometer dataset and fit of the maximum likelihood model of an `AnalysisInterferometer`,
+    which the analysis computes before calling this function either directly or via the `VisualizerPool`.
+
+    See `visualize_fit_imaging_from` for a description of the parameters.
+    """
+    visualizer = Visualizer(visualize_path=visualize_path, incremental=incremental)
+    visualizer.visualize_interferometer(interferometer=interferometer)
+    visualizer.visualize_fit_interferometer(fit=fit, during_analysis=during_analysis)
+
+    if fit.inversion is not None:
+        visualizer.visualize_inversion(
+            inversion=fit.inversion, during_analysis=during_analysis
+        )
+
+    visualizer.visualize_hyper_images(
+        hyper_galaxy_image_path_dict=hyper_galaxy_image_path_dict,
+        hyper_model_image=hyper_model_image,
+        plane=fit.plane,
+    )
+
+    if fit_no_hyper is not None:
+        visualizer.visualize_fit_interferometer(
+            fit=fit_no_hyper, during_analysis=during_analysis, subfolders="fit_no_hyper"
+        )
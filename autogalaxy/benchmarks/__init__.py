@@ -0,0 +1,7 @@
+from .benchmarks import (
+    run,
+    time_from,
+    regressions_from,
+    output_to_json,
+    from_json,
+)
@@ -0,0 +1,116 @@
+"""
+Run the autogalaxy benchmarks from the command line, for example:
+
+    python -m autogalaxy.benchmarks --baseline baseline.json --instruments euclid hst --output benchmarks.json
+
+The results are compared to the baseline .json file input via `--baseline` and the process exits with a non-zero
+status if any benchmark is slower than the baseline by more than the tolerance, or if the baseline does not exist.
+Timings are machine specific, so no baseline is shipped with autogalaxy and one is created on the machine the
+benchmarks are run on using `--save-baseline`.
+
+The results are output as .json to stdout (or to the file input via `--output`), and all other messages are output
+to stderr, so that stdout can be parsed.
+"""
+
+import argparse
+import json
+import sys
+from os import path
+
+from autogalaxy.benchmarks import benchmarks
+
+
+def main(args=None):
+
+    parser = argparse.ArgumentParser(
+        prog="python -m autogalaxy.benchmarks",
+        description="Time the profile, plane, fit and analysis hot paths of autogalaxy.",
+    )
+    parser.add_argument(
+        "--instruments",
+        nargs="+",
+        choices=list(benchmarks.instrument_pixel_scales.keys()),
+        default=None,
+        help="The instruments (and therefore pixel scales) benchmarked, default all.",
+    )
+    parser.add_argument(
+        "--sub-sizes",
+        nargs="+",
+        type=int,
+        default=list(benchmarks.sub_sizes),
+        help="The sub-sizes of the grids every benchmark is run at.",
+    )
+    parser.add_argument(
+        "--repeats",
+        type=int,
+        default=5,
+        help="The number of timed calls per benchmark.",
+    )
+    parser.add_argument(
+        "--filter",
+        default=None,
+        help="Only run benchmarks whose key contains this string (e.g. EllSersic).",
+    )
+    parser.add_argument(
+        "--output", default=None, help="The .json file the results are output to."
+    )
+    parser.add_argument(
+        "--baseline",
+        required=True,
+        help="The .json file of baseline results the benchmarks are compared to (or saved to).",
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.2,
+        help="The fractional slow-down of a benchmark above which it is a regression.",
+    )
+    parser.add_argument(
+        "--save-baseline",
+        action="store_true",
+        help="Output the results to the baseline file instead of comparing to it.",
+    )
+
+    args = parser.parse_args(args=args)
+
+    results = benchmarks.run(
+        instruments=args.instruments,
+        sub_sizes=args.sub_sizes,
+        repeats=args.repeats,
+        name_filter=args.filter,
+    )
+
+    if args.output is not None:
+        benchmarks.output_to_json(benchmarks=results, file_path=args.output)
+    else:
+        print(json.dumps(results, indent=4, sort_keys=True))
+
+    if args.save_baseline:
+        benchmarks.output_to_json(benchmarks=results, file_path=args.baseline)
+        return 0
+
+    if not path.exists(args.baseline):
+        print(
+            f"No baseline found at {args.baseline}, run with --save-baseline to create one.",
+            file=sys.stderr,
+        )
+        return 2
+
+    regressions = benchmarks.regressions_from(
+        benchmarks=results,
+        baseline=benchmarks.from_json(file_path=args.baseline),
+        tolerance=args.tolerance,
+    )
+
+    for key, regression in regressions.items():
+        print(
+            f"REGRESSION {key}: {regression['baseline']:.6f}s -> {regression['time']:.6f}s "
+            f"({regression['ratio']:.2f}x)",
+            file=sys.stderr,
+        )
+
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
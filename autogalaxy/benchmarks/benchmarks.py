@@ -0,0 +1,381 @@
+import datetime
+import inspect
+import json
+import platform
+import time
+
+import numpy as np
+
+import autofit as af
+import autogalaxy as ag
+from autogalaxy.profiles import light_profiles as lp
+from autogalaxy.profiles import mass_profiles as mp
+
+"""
+The pixel scales of the standard instruments every benchmark is run for, which combined with the circular mask of
+radius `mask_radius` sets the number of unmasked image pixels each benchmark evaluates.
+"""
+instrument_pixel_scales = {"lsst": 0.2, "euclid": 0.1, "hst": 0.05, "hst_up": 0.03}
+
+mask_radius = 3.0
+
+sub_sizes = (1, 4)
+
+total_visibilities = 1000
+
+
+def time_from(func, repeats: int = 5) -> dict:
+    """
+    Time a function by calling it once to warm up (e.g. compile its numba functions and fill its caches) and then
+    `repeats` times, returning the minimum and median run times in seconds.
+
+    Parameters
+    ----------
+    func
+        The function which is timed, which takes no arguments.
+    repeats
+        The number of timed calls of the function.
+    """
+    func()
+
+    times = []
+
+    for _ in range(repeats):
+
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+
+    return {"min": min(times), "median": float(np.median(times)), "repeats": repeats}
+
+
+def profile_classes_from(module, cls) -> list:
+    """
+    Returns every concrete class in a profile module which is a subclass of the input class (e.g. every light profile
+    in `light_profiles`), excluding the input base class itself and abstract classes.
+    """
+    return [
+        profile_cls
+        for name, profile_cls in inspect.getmembers(module, inspect.isclass)
+        if issubclass(profile_cls, cls)
+        and profile_cls is not cls
+        and not inspect.isabstract(profile_cls)
+        and not name.startswith("Abstract")
+    ]
+
+
+def mask_from(pixel_scales: float, sub_size: int) -> ag.Mask2D:
+    """
+    Returns the circular mask of radius `mask_radius` used by every benchmark, for an instrument with the input pixel
+    scale.
+    """
+    shape = 2 * int(np.ceil(mask_radius / pixel_scales)) + 11
+
+    return ag.Mask2D.circular(
+        shape_native=(shape, shape),
+        pixel_scales=pixel_scales,
+        sub_size=sub_size,
+        radius=mask_radius,
+    )
+
+
+def galaxies_from() -> list:
+    """
+    The galaxies used by the plane, fit and analysis benchmarks, which combine light and mass profiles representative
+    of a typical model-fit.
+    """
+    return [
+        ag.Galaxy(
+            redshift=0.5,
+            bulge=ag.lp.EllSersic(
+                centre=(0.0, 0.0),
+                elliptical_comps=(0.1, 0.05),
+                intensity=1.0,
+                effective_radius=0.8,
+                sersic_index=4.0,
+            ),
+            disk=ag.lp.EllExponential(
+                centre=(0.0, 0.0),
+                elliptical_comps=(0.2, 0.1),
+                intensity=0.5,
+                effective_radius=1.6,
+            ),
+            mass=ag.mp.EllIsothermal(
+                centre=(0.0, 0.0), elliptical_comps=(0.1, 0.05), einstein_radius=1.0
+            ),
+        )
+    ]
+
+
+def imaging_from(pixel_scales: float, sub_size: int) -> ag.Imaging:
+    """
+    Returns masked imaging of the benchmark galaxies for an instrument with the input pixel scale, with a Gaussian PSF
+    whose FWHM spans a few pixels.
+    """
+    mask = mask_from(pixel_scales=pixel_scales, sub_size=sub_size)
+
+    grid = ag.Grid2D.uniform(
+        shape_native=mask.shape_native, pixel_scales=pixel_scales, sub_size=1
+    )
+
+    psf = ag.Kernel2D.from_gaussian(
+        shape_native=(11, 11),
+        pixel_scales=pixel_scales,
+        sigma=2.0 * pixel_scales,
+        normalize=True,
+    )
+
+    simulator = ag.SimulatorImaging(
+        exposure_time=300.0, psf=psf, add_poisson_noise=False
+    )
+
+    imaging = simulator.from_plane_and_grid(
+        plane=ag.Plane(galaxies=galaxies_from()), grid=grid
+    )
+
+    imaging = imaging.apply_mask(mask=mask)
+
+    return imaging.apply_settings(
+        settings=ag.SettingsImaging(grid_class=ag.Grid2D, sub_size=sub_size)
+    )
+
+
+def interferometer_from(pixel_scales: float, sub_size: int) -> ag.Interferometer:
+    """
+    Returns an interferometer dataset of the benchmark galaxies for an instrument with the input pixel scale, whose
+    `total_visibilities` baselines are drawn from a fixed random seed.
+
+    The visibilities are simulated on an unmasked grid (the simulator adds the image to a full background sky) and
+    the real-space mask is applied when the `Interferometer` is created.
+    """
+    real_space_mask = mask_from(pixel_scales=pixel_scales, sub_size=sub_size)
+
+    uv_wavelengths = np.random.RandomState(seed=1).uniform(
+        low=-1.0e5, high=1.0e5, size=(total_visibilities, 2)
+    )
+
+    simulator = ag.SimulatorInterferometer(
+        uv_wavelengths=uv_wavelengths,
+        transformer_class=ag.TransformerDFT,
+        exposure_time=300.0,
+        noise_if_add_noise_false=1.0,
+        noise_sigma=None,
+    )
+
+    grid = ag.Grid2D.uniform(
+        shape_native=real_space_mask.shape_native,
+        pixel_scales=pixel_scales,
+        sub_size=sub_size,
+    )
+
+    interferometer = simulator.from_plane_and_grid(
+        plane=ag.Plane(galaxies=galaxies_from()), grid=grid
+    )
+
+    return ag.Interferometer(
+        visibilities=interferometer.visibilities,
+        noise_map=interferometer.noise_map,
+        uv_wavelengths=uv_wavelengths,
+        real_space_mask=real_space_mask,
+        settings=ag.SettingsInterferometer(
+            grid_class=ag.Grid2D,
+            sub_size=sub_size,
+            transformer_class=ag.TransformerDFT,
+        ),
+    )
+
+
+def benchmark_functions_from(pixel_scales: float, sub_size: int) -> dict:
+    """
+    Returns a dictionary mapping the name of every benchmark to the function it times, for an instrument with the
+    input pixel scale and sub-size.
+
+    The datasets, grids and profiles are all set up here, so that only the calculation being benchmarked is timed.
+    """
+    functions = {}
+
+    grid = ag.Grid2D.from_mask(
+        mask=mask_from(pixel_scales=pixel_scales, sub_size=sub_size)
+    )
+
+    for profile_cls in profile_classes_from(module=mp, cls=mp.MassProfile):
+        name = f"deflections_2d_from_grid/{profile_cls.__name__}"
+        functions[name] = _profile_function_from(
+            profile_cls=profile_cls, method="deflections_2d_from_grid", grid=grid
+        )
+
+    for profile_cls in profile_classes_from(module=lp, cls=lp.LightProfile):
+        name = f"image_2d_from_grid/{profile_cls.__name__}"
+        functions[name] = _profile_function_from(
+            profile_cls=profile_cls, method="image_2d_from_grid", grid=grid
+        )
+
+    imaging = imaging_from(pixel_scales=pixel_scales, sub_size=sub_size)
+    interferometer = interferometer_from(pixel_scales=pixel_scales, sub_size=sub_size)
+
+    plane = ag.Plane(galaxies=galaxies_from())
+
+    functions["Plane.blurred_image_2d_from_grid_and_convolver"] = lambda: (
+        plane.blurred_image_2d_from_grid_and_convolver(
+            grid=imaging.grid,
+            convolver=imaging.convolver,
+            blurring_grid=imaging.blurring_grid,
+        )
+    )
+
+    functions["FitImaging"] = lambda: ag.FitImaging(imaging=imaging, plane=plane)
+
+    functions["FitInterferometer"] = lambda: ag.FitInterferometer(
+        interferometer=interferometer, plane=plane
+    )
+
+    analysis = ag.AnalysisImaging(dataset=imaging)
+
+    instance = af.Collection(
+        galaxies=af.Collection(
+            **{f"galaxy_{i}": galaxy for i, galaxy in enumerate(galaxies_from())}
+        )
+    ).instance_from_unit_vector([])
+
+    functions["AnalysisImaging.log_likelihood_function"] = lambda: (
+        analysis.log_likelihood_function(instance=instance)
+    )
+
+    return functions
+
+
+def _profile_function_from(profile_cls, method: str, grid):
+    """
+    Returns a function calling the input method of a profile created using its default parameters, or the exception
+    raised creating it, which the benchmark then records instead of a timing.
+    """
+    try:
+        profile = profile_cls()
+    except Exception as e:
+        return e
+
+    return lambda: getattr(profile, method)(grid=grid)
+
+
+def run(
+    instruments=None,
+    sub_sizes=sub_sizes,
+    repeats: int = 5,
+    name_filter: str = None,
+) -> dict:
+    """
+    Run every benchmark for every combination of the input instruments and sub-sizes, returning a dictionary with a
+    `metadata` entry describing the environment the benchmarks were run in and a `results` entry mapping every
+    benchmark key (e.g. `deflections_2d_from_grid/EllIsothermal/euclid/sub_4`) to its timings.
+
+    A benchmark which raises an exception records its error message instead of its timings, so that one broken
+    profile does not prevent the others from being benchmarked.
+
+    Parameters
+    ----------
+    instruments
+        The names of the instruments in `instrument_pixel_scales` which are benchmarked, where `None` uses them all.
+    sub_sizes
+        The sub-sizes of the grids every benchmark is run at.
+    repeats
+        The number of timed calls of every benchmark.
+    name_filter
+        If input, only benchmarks whose key contains this string are run.
+    """
+    instruments = instruments or list(instrument_pixel_scales.keys())
+
+    results = {}
+
+    for instrument in instruments:
+
+        pixel_scales = instrument_pixel_scales[instrument]
+
+        for sub_size in sub_sizes:
+
+            functions = benchmark_functions_from(
+                pixel_scales=pixel_scales, sub_size=sub_size
+            )
+
+            for name, func in functions.items():
+
+                key = f"{name}/{instrument}/sub_{sub_size}"
+
+                if name_filter is not None and name_filter not in key:
+                    continue
+
+                if isinstance(func, Exception):
+                    results[key] = {"error": repr(func)}
+                    continue
+
+                try:
+                    results[key] = time_from(func=func, repeats=repeats)
+                except Exception as e:
+                    results[key] = {"error": repr(e)}
+
+    return {
+        "metadata": {
+            "autogalaxy_version": ag.__version__,
+            "python_version": platform.python_version(),
+            "platform": platform.platform(),
+            "repeats": repeats,
+            "date": datetime.datetime.now().isoformat(),
+        },
+        "results": results,
+    }
+
+
+def output_to_json(benchmarks: dict, file_path: str):
+    """
+    Output the results of `run` to a .json file.
+    """
+    with open(file_path, "w") as f:
+        json.dump(benchmarks, f, indent=4, sort_keys=True)
+
+
+def from_json(file_path: str) -> dict:
+    """
+    Load the results of `run` from a .json file output by `output_to_json`.
+    """
+    with open(file_path) as f:
+        return json.load(f)
+
+
+def regressions_from(benchmarks: dict, baseline: dict, tolerance: float = 0.2) -> dict:
+    """
+    Compare benchmark results to a stored baseline, returning every benchmark whose minimum run time is more than a
+    fraction `tolerance` slower than the baseline's, mapped to its baseline time, new time and ratio of the two.
+
+    The minimum run time is compared, as opposed to the median, because it is the least sensitive to other processes
+    running on the machine. Benchmarks missing from the baseline, or that errored in either run, are not compared.
+
+    Parameters
+    ----------
+    benchmarks
+        The results of `run`, which are checked for regressions.
+    baseline
+        The results of a previous call to `run`, which the benchmarks are compared to.
+    tolerance
+        The fractional slow-down of a benchmark above which it is a regression (e.g. 0.2 is 20% slower).
+    """
+    regressions = {}
+
+    baseline_results = baseline["results"]
+
+    for key, result in benchmarks["results"].items():
+
+        if key not in baseline_results:
+            continue
+
+        if "min" not in result or "min" not in baseline_results[key]:
+            continue
+
+        ratio = result["min"] / baseline_results[key]["min"]
+
+        if ratio > 1.0 + tolerance:
+            regressions[key] = {
+                "baseline": baseline_results[key]["min"],
+                "time": result["min"],
+                "ratio": ratio,
+            }
+
+    return regressions
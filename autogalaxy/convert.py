@@ -43,6 +43,29 @@ def axis_ratio_and_phi_from(elliptical_comps):
     return axis_ratio, angle
 
 
+def axis_ratios_and_phis_from(elliptical_comps):
+    """
+    Convert an array of ellipitical components e1 and e2 of shape [total_profiles, 2] to arrays of axis ratios
+    (0.0 > q > 1.0) and rotation position angles defined counter clockwise from the positive x-axis
+    (0.0 > angle > 180), using the same calculation as `axis_ratio_and_phi_from` for every row.
+
+    Parameters
+    ----------
+    elliptical_comps : np.ndarray
+        The first and second ellipticity components of every elliptical coordinate system, where
+        fac = (1 - axis_ratio) / (1 + axis_ratio), ellip_y = fac * sin(2*angle) and ellip_x = fac * cos(2*angle).
+    """
+    elliptical_comps = np.reshape(
+        np.asarray(elliptical_comps, dtype="float64"), (-1, 2)
+    )
+    angles = np.arctan2(elliptical_comps[:, 0], elliptical_comps[:, 1]) / 2
+    angles *= 180.0 / np.pi
+    fac = np.sqrt(elliptical_comps[:, 1] ** 2 + elliptical_comps[:, 0] ** 2)
+    fac = np.minimum(fac, 0.999)  # avoid unphysical solution
+    axis_ratios = (1 - fac) / (1 + fac)
+    return axis_ratios, angles
+
+
 def axis_ratio_from(elliptical_comps):
     """
     Convert the ellipitical components e1 and e2 to an axis ratio (0.0 > q > 1.0) and rotation position angle
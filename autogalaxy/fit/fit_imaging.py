@@ -1,9 +1,12 @@
+import copy
 import numpy as np
+from scipy import optimize
 
 from autoconf import conf
 from autoarray.fit import fit as aa_fit
 from autoarray.inversion import pixelizations as pix, inversions as inv
 from autogalaxy.galaxy import galaxy as g
+from autogalaxy.util import convolver_util
 
 
 class FitImaging(aa_fit.FitImaging):
@@ -16,6 +19,7 @@ class FitImaging(aa_fit.FitImaging):
         use_hyper_scalings=True,
         settings_pixelization=pix.SettingsPixelization(),
         settings_inversion=inv.SettingsInversion(),
+        use_linear_light_profiles=False,
     ):
         """ An  lens fitter, which contains the plane's used to perform the fit and functions to manipulate \
         the lens dataset's hyper_galaxies.
@@ -26,6 +30,11 @@ class FitImaging(aa_fit.FitImaging):
             The plane, which describes the ray-tracing and strong lens configuration.
         scaled_array_2d_from_array_1d : func
             A function which maps the 1D lens hyper_galaxies to its unmasked 2D arrays.
+        use_linear_light_profiles
+            If `True`, the intensities of the plane's light profiles are not taken from the plane but solved for as
+            a non-negative linear least-squares problem (see `linear_light_profile_intensities_from`). The fit's
+            `plane` is then a copy of the input plane whose light profiles have the solved intensities, which are
+            also stored in `linear_light_profile_intensities`.
         """
 
         self.plane = plane
@@ -57,6 +66,25 @@ class FitImaging(aa_fit.FitImaging):
             image = imaging.image
             noise_map = imaging.noise_map
 
+        self.linear_light_profile_intensities = None
+
+        if use_linear_light_profiles and plane.has_light_profile:
+
+            self.linear_light_profile_intensities = linear_light_profile_intensities_from(
+                plane=plane,
+                image=image,
+                noise_map=noise_map,
+                grid=imaging.grid,
+                blurring_grid=imaging.blurring_grid,
+                convolver=imaging.convolver,
+            )
+
+            plane = plane_with_light_profile_intensities_from(
+                plane=plane, intensities=self.linear_light_profile_intensities
+            )
+
+            self.plane = plane
+
         self.blurred_image = plane.blurred_image_2d_from_grid_and_convolver(
             grid=imaging.grid,
             convolver=imaging.convolver,
@@ -202,3 +230,140 @@ def hyper_noise_map_from_noise_map_plane_and_hyper_background_noise(
         noise_map[noise_map > noise_map_limit] = noise_map_limit
 
     return noise_map
+
+
+def light_profile_with_intensity_from(light_profile, intensity):
+    """
+    Returns a copy of a light profile with its intensity changed to the input value. For profiles whose image is
+    normalized by a different parameter (e.g. the `intensity_break` of a cored Sersic) that parameter is changed
+    too.
+    """
+    light_profile = copy.copy(light_profile)
+    light_profile.intensity = intensity
+
+    if hasattr(light_profile, "intensity_break"):
+        light_profile.intensity_break = intensity
+
+    return light_profile
+
+
+def linear_light_profile_intensities_from(
+    plane, image, noise_map, grid, blurring_grid, convolver
+):
+    """
+    Returns the intensities of every light profile in a plane which best fit an image, in the order of the plane's
+    galaxies and their `light_profiles`.
+
+    Every light profile is evaluated at unit intensity and blurred with the PSF of the `Convolver` (in one pass via
+    `convolver_util.convolved_images_from`). Because a profile's image is linear in its intensity, the model image is
+    the sum of these blurred images weighted by the intensities, which are solved for by minimizing the chi-squared
+    of the fit subject to every intensity being non-negative (via `scipy.optimize.nnls`).
+
+    Parameters
+    ----------
+    plane : Plane
+        The plane whose light profiles' intensities are solved for.
+    image : Array2D
+        The (masked) image which the light profiles are fitted to.
+    noise_map : Array2D
+        The (masked) noise-map of the image.
+    grid : Grid2D
+        The (sub) grid the light profiles are evaluated on.
+    blurring_grid : Grid2D
+        The grid of pixels outside the mask whose light blurs into the image after PSF convolution.
+    convolver : Convolver
+        The convolver which blurs the light profile images with the PSF.
+    """
+    light_profiles = [
+        light_profile_with_intensity_from(light_profile=light_profile, intensity=1.0)
+        for galaxy in plane.galaxies
+        for light_profile in galaxy.light_profiles
+    ]
+
+    images = np.array(
+        [
+            light_profile.image_2d_from_grid(grid=grid).binned.slim
+            for light_profile in light_profiles
+        ]
+    )
+
+    blurring_images = np.array(
+        [
+            light_profile.image_2d_from_grid(grid=blurring_grid).binned.slim
+            for light_profile in light_profiles
+        ]
+    )
+
+    blurred_images = convolver_util.convolved_images_from(
+        images=images, blurring_images=blurring_images, convolver=convolver
+    )
+
+    noise_map = np.asarray(noise_map.slim)
+
+    intensities, _ = optimize.nnls(
+        np.divide(blurred_images, noise_map).T,
+        np.divide(np.asarray(image.slim), noise_map),
+    )
+
+    return intensities
+
+
+def plane_with_light_profile_intensities_from(plane, intensities):
+    """
+    Returns a copy of a plane whose light profiles have the input intensities, which are in the order of the plane's
+    galaxies and their `light_profiles` (e.g. as returned by `linear_light_profile_intensities_from`). The input
+    plane, its galaxies and their light profiles are not changed.
+    """
+    intensities = iter(intensities)
+
+    galaxies = []
+
+    for galaxy in plane.galaxies:
+
+        galaxy = copy.copy(galaxy)
+
+        for name, value in list(galaxy.__dict__.items()):
+            if g.is_light_profile(value):
+                setattr(
+                    galaxy,
+                    name,
+                    light_profile_with_intensity_from(
+                        light_profile=value, intensity=next(intensities)
+                    ),
+                )
+
+        galaxies.append(galaxy)
+
+    return plane.__class__(redshift=plane.redshift, galaxies=galaxies)
+
+
+def log_likelihoods_from_image_noise_map_and_model_images(
+    image, noise_map, model_images
+):
+    """
+    Returns the log likelihood of a stack of model images fitted to the same image and noise-map, where
+    `model_images` has shape [total_model_images, total_unmasked_pixels].
+
+    Every value is identical to the `log_likelihood` of a `FitImaging` whose model image is the corresponding row
+    (and which does not use an inversion), but the chi-squared of all model images is computed in one NumPy pass and
+    the noise normalization is computed only once.
+
+    Parameters
+    ----------
+    image : Array2D
+        The (masked) image that every model image is fitted to.
+    noise_map : Array2D
+        The (masked) noise-map of the image.
+    model_images : np.ndarray
+        The stack of 1D model images.
+    """
+    image = np.asarray(image.slim)
+    noise_map = np.asarray(noise_map.slim)
+
+    chi_squareds = np.sum(
+        np.square(np.divide(np.subtract(image, model_images), noise_map)), axis=1
+    )
+
+    noise_normalization = np.sum(np.log(2 * np.pi * noise_map ** 2.0))
+
+    return -0.5 * (chi_squareds + noise_normalization)
@@ -1,6 +1,8 @@
+from collections import OrderedDict
 from itertools import count
 
 import numpy as np
+from autoconf import conf
 from autoarray.inversion import pixelizations as pix, regularization as reg
 from autoarray.structures.arrays import values
 from autoarray.structures.grids.two_d import grid_2d_irregular
@@ -15,6 +17,7 @@ from autogalaxy.profiles.mass_profiles import (
     dark_mass_profiles as dmp,
     stellar_mass_profiles as smp,
 )
+from autogalaxy.util import profiling_util
 
 from typing import Optional
 
@@ -31,6 +34,120 @@ def is_mass_profile(obj):
     return isinstance(obj, mp.MassProfile)
 
 
+class GalaxyImageCache:
+    def __init__(self):
+        """
+        A least-recently-used cache of galaxy images, which is content-addressed by the parameters of a galaxy's
+        light profiles and the identity of the grid (and any other structures, e.g. a convolver) the image is
+        computed using.
+
+        Galaxies whose light profiles are unchanged between likelihood evaluations (e.g. a fixed lens light with a
+        varying companion) then reuse their image instead of recomputing it, even though every evaluation creates
+        new galaxy and profile objects. Every entry holds a reference to its structures so that their identities
+        cannot be reused while the entry is cached.
+
+        The total memory of the cached images is capped, with the least recently used images evicted first.
+        """
+        self.cache_dict = OrderedDict()
+        self.nbytes = 0
+
+    def image_from(self, key: tuple, structures: tuple, func, memory_cap: float):
+        """
+        Returns the image of `func()` for an input key and structures, reusing the image of a previous call with
+        the same key and structures if it is cached.
+
+        Parameters
+        ----------
+        key
+            The name of the image (e.g. `image_2d_from_grid`) and the parameters of the light profiles it depends on.
+        structures
+            The grids and other objects the image is computed using, whose identities are part of the key.
+        func : () -> np.ndarray
+            The function computing the image if it is not cached.
+        memory_cap
+            The maximum total number of bytes of the cached images.
+        """
+        cache_key = key + tuple(id(structure) for structure in structures)
+
+        if cache_key in self.cache_dict:
+
+            cached_structures, image = self.cache_dict[cache_key]
+
+            if all(
+                cached is structure
+                for cached, structure in zip(cached_structures, structures)
+            ):
+                self.cache_dict.move_to_end(cache_key)
+                return image.copy()
+
+            self.remove(cache_key=cache_key)
+
+        image = func()
+
+        if image.nbytes <= memory_cap:
+
+            self.cache_dict[cache_key] = (structures, image.copy())
+            self.nbytes += image.nbytes
+
+            while self.nbytes > memory_cap:
+                self.remove(cache_key=next(iter(self.cache_dict)))
+
+        return image
+
+    def remove(self, cache_key):
+        structures, image = self.cache_dict.pop(cache_key)
+        self.nbytes -= image.nbytes
+
+    def clear(self):
+        self.cache_dict.clear()
+        self.nbytes = 0
+
+
+_image_cache = GalaxyImageCache()
+
+
+def image_cache_enabled() -> bool:
+    """
+    Whether galaxy images are cached, as set by the `enabled` entry of the [galaxy_image_cache] section of the
+    general.ini config.
+    """
+    return conf.instance["general"]["galaxy_image_cache"]["enabled"]
+
+
+def image_via_cache_from(galaxy, name: str, structures: tuple, func):
+    """
+    Returns the image of a galaxy computed by `func()`, via the galaxy image cache if it is enabled and the
+    parameters of all of the galaxy's light profiles can be used as a key (e.g. none of them are arrays).
+
+    Parameters
+    ----------
+    galaxy
+        The galaxy whose image is computed.
+    name
+        The name of the image (e.g. `image_2d_from_grid`), so that different images of a galaxy are cached
+        separately.
+    structures
+        The grids and other objects the image is computed using, whose identities are part of the key.
+    func : () -> np.ndarray
+        The function computing the image if it is not cached.
+    """
+    if not image_cache_enabled():
+        return func()
+
+    light_profile_key = galaxy.light_profile_key
+
+    if light_profile_key is None:
+        return func()
+
+    return _image_cache.image_from(
+        key=(name,) + light_profile_key,
+        structures=structures,
+        func=func,
+        memory_cap=conf.instance["general"]["galaxy_image_cache"]["memory_cap_mb"]
+        * 1.0e6,
+    )
+
+
 class Galaxy(ModelObject, lensing.LensingObject):
     """
     @DynamicAttrs
@@ -107,6 +224,35 @@ class Galaxy(ModelObject, lensing.LensingObject):
     def mass_profiles(self):
         return [value for value in self.__dict__.values() if is_mass_profile(value)]
 
+    @property
+    def light_profile_key(self) -> Optional[tuple]:
+        """
+        A hashable key of the class and parameters of every light profile of the galaxy, which is the same for any
+        two galaxies whose light profiles have identical parameters and therefore identical images.
+
+        Returns `None` if a parameter cannot be hashed (e.g. it is an array).
+        """
+        light_profile_key = []
+
+        for light_profile in self.light_profiles:
+
+            parameters = tuple(
+                sorted(
+                    (name, value)
+                    for name, value in light_profile.__dict__.items()
+                    if name != "id"
+                )
+            )
+
+            try:
+                hash(parameters)
+            except TypeError:
+                return None
+
+            light_profile_key.append((light_profile.__class__.__name__, parameters))
+
+        return tuple(light_profile_key)
+
     @property
     def has_redshift(self):
         return self.redshift is not None
@@ -314,11 +460,41 @@ class Galaxy(ModelObject, lensing.LensingObject):
 
         """
         if self.has_light_profile:
-            return sum(
-                map(lambda p: p.image_2d_from_grid(grid=grid), self.light_profiles)
+
+            def image_2d_from(profile):
+                with profiling_util.section(
+                    name="image_2d_from_grid", galaxy=self, profile=profile
+                ):
+                    return profile.image_2d_from_grid(grid=grid)
+
+            return image_via_cache_from(
+                galaxy=self,
+                name="image_2d_from_grid",
+                structures=(grid,),
+                func=lambda: sum(map(image_2d_from, self.light_profiles)),
             )
         return np.zeros((grid.shape[0],))
 
+    def image_2d_via_adaptive_oversampling_from(
+        self, grid, fractional_accuracy=0.9999, sub_steps=None
+    ):
+        """
+        Returns the summed image of all of the galaxy's light profiles in every pixel of a `Grid2D`, where every
+        profile is adaptively oversampled independently of the others.
+
+        See `LightProfile.image_2d_via_adaptive_oversampling_from` for a description of the adaptive oversampling.
+        """
+        if self.has_light_profile:
+            return sum(
+                light_profile.image_2d_via_adaptive_oversampling_from(
+                    grid=grid,
+                    fractional_accuracy=fractional_accuracy,
+                    sub_steps=sub_steps,
+                )
+                for light_profile in self.light_profiles
+            )
+        return np.zeros((grid.binned.shape[0],))
+
     def blurred_image_2d_from_grid_and_psf(self, grid, psf, blurring_grid=None):
 
         image = self.image_2d_from_grid(grid=grid)
@@ -330,13 +506,27 @@ class Galaxy(ModelObject, lensing.LensingObject):
         )
 
     def blurred_image_2d_from_grid_and_convolver(self, grid, convolver, blurring_grid):
+        """
+        Returns the galaxy's image blurred with the PSF of a `Convolver`, which is reused from the galaxy image cache
+        (if it is enabled) for galaxies whose light profiles are unchanged.
+        """
 
-        image = self.image_2d_from_grid(grid=grid)
+        def blurred_image_2d_from():
 
-        blurring_image = self.image_2d_from_grid(grid=blurring_grid)
+            image = self.image_2d_from_grid(grid=grid)
+
+            blurring_image = self.image_2d_from_grid(grid=blurring_grid)
+
+            with profiling_util.section(name="convolution", galaxy=self):
+                return convolver.convolve_image(
+                    image=image.binned.slim, blurring_image=blurring_image.binned.slim
+                )
 
-        return convolver.convolve_image(
-            image=image.binned.slim, blurring_image=blurring_image.binned.slim
+        return image_via_cache_from(
+            galaxy=self,
+            name="blurred_image_2d_from_grid_and_convolver",
+            structures=(grid, convolver, blurring_grid),
+            func=blurred_image_2d_from,
         )
 
     def profile_visibilities_from_grid_and_transformer(self, grid, transformer):
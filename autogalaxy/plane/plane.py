@@ -10,7 +10,9 @@ from autoarray.structures import visibilities as vis
 from autogalaxy import exc
 from autogalaxy import lensing
 from autogalaxy.galaxy import galaxy as g
+from autogalaxy.profiles import geometry_profiles
 from autogalaxy.util import plane_util
+from autogalaxy.util import profiling_util
 
 
 class AbstractPlane(lensing.LensingObject):
@@ -234,6 +236,7 @@ class AbstractPlaneLensing(AbstractPlane):
         super().__init__(redshift=redshift, galaxies=galaxies)
 
     @grid_decorators.grid_2d_to_structure
+    @geometry_profiles.cache_geometry
     def image_2d_from_grid(self, grid):
         """
         Returns the profile-image plane image of the list of galaxies of the plane's sub-grid, by summing the
@@ -255,6 +258,7 @@ class AbstractPlaneLensing(AbstractPlane):
             )
         return np.zeros((grid.shape[0],))
 
+    @geometry_profiles.cache_geometry
     def images_of_galaxies_from_grid(self, grid):
         return list(
             map(lambda galaxy: galaxy.image_2d_from_grid(grid=grid), self.galaxies)
@@ -269,6 +273,7 @@ class AbstractPlaneLensing(AbstractPlane):
         return self.image_2d_from_grid(grid=padded_grid)
 
     @grid_decorators.grid_2d_to_structure
+    @geometry_profiles.cache_geometry
     def convergence_2d_from_grid(self, grid):
         """
         Returns the convergence of the list of galaxies of the plane's sub-grid, by summing the individual convergences \
@@ -295,6 +300,7 @@ class AbstractPlaneLensing(AbstractPlane):
         return np.zeros(shape=(grid.shape[0],))
 
     @grid_decorators.grid_2d_to_structure
+    @geometry_profiles.cache_geometry
     def potential_2d_from_grid(self, grid):
         """
         Returns the potential of the list of galaxies of the plane's sub-grid, by summing the individual potentials \
@@ -321,6 +327,7 @@ class AbstractPlaneLensing(AbstractPlane):
         return np.zeros((grid.shape[0]))
 
     @grid_decorators.grid_2d_to_structure
+    @geometry_profiles.cache_geometry
     def deflections_2d_from_grid(self, grid):
         if self.galaxies:
             return sum(
@@ -358,12 +365,26 @@ class AbstractPlaneData(AbstractPlaneLensing):
         ]
 
     def blurred_image_2d_from_grid_and_convolver(self, grid, convolver, blurring_grid):
+        """
+        Returns the image of the plane's galaxies blurred with the PSF of a `Convolver`.
+
+        If the galaxy image cache is enabled every galaxy is blurred separately and the blurred images are summed,
+        such that the blurred images of galaxies whose light profiles are unchanged since a previous evaluation are
+        reused instead of recomputed.
+        """
+        if self.galaxies and g.image_cache_enabled():
+            return sum(
+                self.blurred_images_of_galaxies_from_grid_and_convolver(
+                    grid=grid, convolver=convolver, blurring_grid=blurring_grid
+                )
+            )
 
         image = self.image_2d_from_grid(grid=grid)
 
         blurring_image = self.image_2d_from_grid(grid=blurring_grid)
 
-        return convolver.convolve_image(image=image, blurring_image=blurring_image)
+        with profiling_util.section(name="convolution"):
+            return convolver.convolve_image(image=image, blurring_image=blurring_image)
 
     def blurred_images_of_galaxies_from_grid_and_convolver(
         self, grid, convolver, blurring_grid
@@ -411,7 +432,8 @@ class AbstractPlaneData(AbstractPlaneLensing):
 
         if self.galaxies:
             image = self.image_2d_from_grid(grid=grid)
-            return transformer.visibilities_from_image(image=image)
+            with profiling_util.section(name="transform"):
+                return transformer.visibilities_from_image(image=image)
         else:
             return vis.Visibilities.zeros(
                 shape_slim=(transformer.uv_wavelengths.shape[0],)
@@ -481,22 +503,24 @@ class AbstractPlaneData(AbstractPlaneLensing):
         settings_inversion=inv.SettingsInversion(),
     ):
 
-        sparse_grid = self.sparse_image_plane_grid_from_grid(grid=grid)
+        with profiling_util.section(name="inversion"):
 
-        mapper = self.mapper_from_grid_and_sparse_grid(
-            grid=grid,
-            sparse_grid=sparse_grid,
-            settings_pixelization=settings_pixelization,
-        )
+            sparse_grid = self.sparse_image_plane_grid_from_grid(grid=grid)
 
-        return inv.InversionImagingMatrix.from_data_mapper_and_regularization(
-            image=image,
-            noise_map=noise_map,
-            convolver=convolver,
-            mapper=mapper,
-            regularization=self.regularization,
-            settings=settings_inversion,
-        )
+            mapper = self.mapper_from_grid_and_sparse_grid(
+                grid=grid,
+                sparse_grid=sparse_grid,
+                settings_pixelization=settings_pixelization,
+            )
+
+            return inv.InversionImagingMatrix.from_data_mapper_and_regularization(
+                image=image,
+                noise_map=noise_map,
+                convolver=convolver,
+                mapper=mapper,
+                regularization=self.regularization,
+                settings=settings_inversion,
+            )
 
     def inversion_interferometer_from_grid_and_data(
         self,
@@ -508,22 +532,24 @@ class AbstractPlaneData(AbstractPlaneLensing):
         settings_inversion=inv.SettingsInversion(),
     ):
 
-        sparse_grid = self.sparse_image_plane_grid_from_grid(grid=grid)
+        with profiling_util.section(name="inversion"):
 
-        mapper = self.mapper_from_grid_and_sparse_grid(
-            grid=grid,
-            sparse_grid=sparse_grid,
-            settings_pixelization=settings_pixelization,
-        )
+            sparse_grid = self.sparse_image_plane_grid_from_grid(grid=grid)
 
-        return inv.AbstractInversionInterferometer.from_data_mapper_and_regularization(
-            visibilities=visibilities,
-            noise_map=noise_map,
-            transformer=transformer,
-            mapper=mapper,
-            regularization=self.regularization,
-            settings=settings_inversion,
-        )
+            mapper = self.mapper_from_grid_and_sparse_grid(
+                grid=grid,
+                sparse_grid=sparse_grid,
+                settings_pixelization=settings_pixelization,
+            )
+
+            return inv.AbstractInversionInterferometer.from_data_mapper_and_regularization(
+                visibilities=visibilities,
+                noise_map=noise_map,
+                transformer=transformer,
+                mapper=mapper,
+                regularization=self.regularization,
+                settings=settings_inversion,
+            )
 
     def plane_image_2d_from_grid(self, grid):
         return plane_util.plane_image_of_galaxies_from(
@@ -532,74 +558,119 @@ class AbstractPlaneData(AbstractPlaneLensing):
             galaxies=self.galaxies,
         )
 
+    @property
+    def galaxies_with_hyper_galaxy(self):
+        return list(filter(lambda galaxy: galaxy.has_hyper_galaxy, self.galaxies))
+
     def hyper_noise_map_from_noise_map(self, noise_map):
-        hyper_noise_maps = self.hyper_noise_maps_of_galaxies_from_noise_map(
-            noise_map=noise_map
+        """
+        Returns the sum of the hyper noise-maps of every galaxy with a `HyperGalaxy`, which are computed as a single
+        stacked array (see `plane_util.hyper_noise_maps_of_galaxies_from`).
+
+        Parameters
+        -----------
+        noise_map : imaging.NoiseMap or ndarray
+            An arrays describing the RMS standard deviation error in each pixel, preferably in units of electrons per
+            second.
+        """
+        galaxies = self.galaxies_with_hyper_galaxy
+
+        if not galaxies:
+            return array_2d.Array2D.manual_mask(
+                array=np.zeros(noise_map.mask.mask_sub_1.pixels_in_mask),
+                mask=noise_map.mask.mask_sub_1,
+            )
+
+        hyper_noise_maps = plane_util.hyper_noise_maps_of_galaxies_from(
+            galaxies=galaxies, noise_map=noise_map
+        )
+
+        return array_2d.Array2D.manual_mask(
+            array=np.sum(hyper_noise_maps, axis=0), mask=noise_map.mask.mask_sub_1
         )
-        return sum(hyper_noise_maps)
 
     def hyper_noise_maps_of_galaxies_from_noise_map(self, noise_map):
         """For a contribution map and noise-map, use the model hyper_galaxy galaxies to compute a hyper noise-map.
 
+        The hyper noise-maps of all galaxies with a `HyperGalaxy` are computed as a single stacked array (see
+        `plane_util.hyper_noise_maps_of_galaxies_from`), and galaxies without one are given a hyper noise-map of
+        zeros.
+
         Parameters
         -----------
         noise_map : imaging.NoiseMap or ndarray
             An arrays describing the RMS standard deviation error in each pixel, preferably in units of electrons per
             second.
         """
-        hyper_noise_maps = []
-
-        for galaxy in self.galaxies:
-
-            if galaxy.has_hyper_galaxy:
+        galaxies = self.galaxies_with_hyper_galaxy
 
-                hyper_noise_map_1d = galaxy.hyper_galaxy.hyper_noise_map_from_hyper_images_and_noise_map(
-                    noise_map=noise_map,
-                    hyper_model_image=galaxy.hyper_model_image,
-                    hyper_galaxy_image=galaxy.hyper_galaxy_image,
-                )
-
-                hyper_noise_maps.append(hyper_noise_map_1d)
+        hyper_noise_maps = np.zeros(
+            (len(self.galaxies), noise_map.mask.mask_sub_1.pixels_in_mask)
+        )
 
-            else:
+        if galaxies:
 
-                hyper_noise_map = array_2d.Array2D.manual_mask(
-                    array=np.zeros(noise_map.mask.mask_sub_1.pixels_in_mask),
-                    mask=noise_map.mask.mask_sub_1,
-                )
+            hyper_galaxy_indexes = [
+                index
+                for index, galaxy in enumerate(self.galaxies)
+                if galaxy.has_hyper_galaxy
+            ]
 
-                hyper_noise_maps.append(hyper_noise_map)
+            hyper_noise_maps[
+                hyper_galaxy_indexes
+            ] = plane_util.hyper_noise_maps_of_galaxies_from(
+                galaxies=galaxies, noise_map=noise_map
+            )
 
-        return hyper_noise_maps
+        return [
+            array_2d.Array2D.manual_mask(
+                array=hyper_noise_map, mask=noise_map.mask.mask_sub_1
+            )
+            for hyper_noise_map in hyper_noise_maps
+        ]
 
     @property
     def contribution_map(self):
 
-        contribution_maps = self.contribution_maps_of_galaxies
+        galaxies = self.galaxies_with_hyper_galaxy
 
-        contribution_maps = [i for i in contribution_maps if i is not None]
-
-        if contribution_maps:
-            return sum(contribution_maps)
-        else:
+        if not galaxies:
             return None
 
-    @property
-    def contribution_maps_of_galaxies(self):
-
-        contribution_maps = []
+        contribution_maps = plane_util.contribution_maps_of_galaxies_from(
+            galaxies=galaxies
+        )
 
-        for galaxy in self.galaxies:
+        return array_2d.Array2D.manual_mask(
+            array=np.sum(contribution_maps, axis=0),
+            mask=galaxies[0].hyper_galaxy_image.mask,
+        )
 
-            if galaxy.hyper_galaxy is not None:
+    @property
+    def contribution_maps_of_galaxies(self):
+        """
+        The contribution map of every galaxy, which is `None` for galaxies without a `HyperGalaxy`.
 
-                contribution_maps.append(galaxy.contribution_map)
+        The contribution maps of all galaxies with a `HyperGalaxy` are computed as a single stacked array (see
+        `plane_util.contribution_maps_of_galaxies_from`).
+        """
+        galaxies = self.galaxies_with_hyper_galaxy
 
-            else:
+        if not galaxies:
+            return [None for galaxy in self.galaxies]
 
-                contribution_maps.append(None)
+        contribution_maps = iter(
+            plane_util.contribution_maps_of_galaxies_from(galaxies=galaxies)
+        )
 
-        return contribution_maps
+        return [
+            array_2d.Array2D.manual_mask(
+                array=next(contribution_maps), mask=galaxy.hyper_galaxy_image.mask
+            )
+            if galaxy.has_hyper_galaxy
+            else None
+            for galaxy in self.galaxies
+        ]
 
     def galaxy_image_dict_from_grid(self, grid) -> {g.Galaxy: np.ndarray}:
         """
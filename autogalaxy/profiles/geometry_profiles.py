@@ -1,11 +1,236 @@
 import numpy as np
+import threading
+from contextlib import contextmanager
+from functools import wraps
+from autoconf import conf
+from autoarray import decorator_util
 from autoarray.geometry import geometry_util
 from autoarray.structures.grids.two_d import grid_2d
+from autoarray.structures.grids.two_d import grid_2d_irregular
 from autoarray.structures.grids import grid_decorators
 from autogalaxy import convert
 
 from typing import Tuple
 
+_geometry_cache = threading.local()
+
+
+@contextmanager
+def geometry_cache():
+    """
+    Context manager which caches the profile-frame grids and elliptical radii computed by profiles for the duration
+    of one evaluation (e.g. the image or deflections of a `Plane`).
+
+    Profiles that share the same geometry (e.g. a bulge and disk `LightProfile` tied to the same centre and
+    elliptical_comps as a `MassProfile`) then reuse the transformed grid and elliptical radii computed by the first
+    profile instead of recomputing them. Entries are keyed on the identity of the input grid and the geometric
+    parameters of the profile, and every entry holds a reference to its grid so that its identity cannot be reused
+    while the cache is active.
+
+    Nested uses of the context manager share the outermost cache, which is cleared when it exits.
+    """
+    if getattr(_geometry_cache, "cache_dict", None) is not None:
+        yield
+        return
+
+    _geometry_cache.cache_dict = {}
+
+    try:
+        yield
+    finally:
+        _geometry_cache.cache_dict = None
+
+
+def cache_geometry(func):
+    """
+    Evaluate a function (e.g. a `Plane` method which sums the images of its galaxies) inside a `geometry_cache`, so
+    that all profiles it evaluates share the cached profile-frame grids and elliptical radii.
+
+    Parameters
+    ----------
+    func : (obj, grid, *args, **kwargs) -> Object
+        A function which evaluates one or more profiles on a grid.
+    """
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+
+        with geometry_cache():
+            return func(*args, **kwargs)
+
+    return wrapper
+
+
+def cached_geometry_from(grid, key, func):
+    """
+    Returns the result of `func()` for an input grid and key, reusing the result of a previous call with the same
+    grid and key if a `geometry_cache` is active. If no cache is active `func()` is always called.
+
+    Parameters
+    ----------
+    grid
+        The grid whose identity the cached result is tied to.
+    key : tuple
+        The geometric parameters of the profile which the result depends on.
+    func : () -> np.ndarray
+        The function computing the result if it is not cached.
+    """
+    cache_dict = getattr(_geometry_cache, "cache_dict", None)
+
+    if cache_dict is None:
+        return func()
+
+    cache_key = (id(grid),) + key
+
+    if cache_key in cache_dict:
+        cached_grid, result = cache_dict[cache_key]
+        if cached_grid is grid:
+            return result
+
+    result = func()
+    cache_dict[cache_key] = (grid, result)
+
+    return result
+
+
+def transform_and_relocate_to_radial_minimum(func):
+    """
+    A fused version of the decorators `grid_decorators.transform` and `grid_decorators.relocate_to_radial_minimum`,
+    which must be applied in that order inside `grid_decorators.grid_2d_to_structure`.
+
+    The unfused decorators each allocate at least one copy of the grid, as does the call to `grid_to_grid_radii` used
+    to relocate it. This decorator instead translates the grid to the profile's centre, rotates it to the profile's
+    orientation and relocates coordinates within the radial minimum to it in a single pass over the grid, writing the
+    result into one preallocated buffer (see `transform_grid_2d_to_reference_frame_and_relocate_jit`).
+
+    If the input grid has already been transformed to the profile's reference frame, only the relocation is
+    performed.
+
+    The value the (y,x) coordinates are relocated to is set in the 'radial_minimum.ini' config.
+
+    Parameters
+    ----------
+    func : (profile, grid *args, **kwargs) -> Object
+        A function which takes a grid of coordinates in the profile's reference frame which may have a singularity at
+        (0.0, 0.0).
+
+    Returns
+    -------
+        A function that can accept cartesian or transformed coordinates
+    """
+
+    @wraps(func)
+    def wrapper(cls, grid, *args, **kwargs):
+        """
+
+        Parameters
+        ----------
+        cls : Profile
+            The class that owns the function.
+        grid
+            The (y, x) coordinates in the original reference frame of the grid or in the reference frame of the
+            profile.
+
+        Returns
+        -------
+            The function evaluated on the transformed and relocated grid.
+        """
+
+        grid_radial_minimum = conf.instance["grids"]["radial_minimum"][
+            "radial_minimum"
+        ][cls.__class__.__name__]
+
+        if isinstance(
+            grid,
+            (
+                grid_2d.Grid2DTransformed,
+                grid_2d.Grid2DTransformedNumpy,
+                grid_2d_irregular.Grid2DIrregularTransformed,
+            ),
+        ):
+            centre = (0.0, 0.0)
+            angle = 0.0
+        else:
+            centre = cls.centre
+            angle = 0.0 if cls.__class__.__name__.startswith("Sph") else cls.angle
+
+        centre = (float(centre[0]), float(centre[1]))
+        phi_radians = np.radians(angle)
+
+        def transformed_grid_from():
+            return grid_2d.Grid2DTransformedNumpy(
+                grid=transform_grid_2d_to_reference_frame_and_relocate_jit(
+                    grid_2d=np.asarray(grid, dtype="float64"),
+                    centre=centre,
+                    cos_phi=float(np.cos(phi_radians)),
+                    sin_phi=float(np.sin(phi_radians)),
+                    grid_radial_minimum=float(grid_radial_minimum),
+                )
+            )
+
+        transformed_grid = cached_geometry_from(
+            grid=grid,
+            key=("transform_and_relocate", centre, float(angle), grid_radial_minimum),
+            func=transformed_grid_from,
+        )
+
+        return func(cls, transformed_grid, *args, **kwargs)
+
+    return wrapper
+
+
+@decorator_util.jit()
+def transform_grid_2d_to_reference_frame_and_relocate_jit(
+    grid_2d, centre, cos_phi, sin_phi, grid_radial_minimum
+):
+    """
+    Transform a 2D grid of (y,x) coordinates to the reference frame of a profile and relocate all coordinates within
+    the radial minimum of its centre to the radial minimum, in a single pass over the grid.
+
+    This transformation includes:
+
+    1) A translation to a new (y,x) centre value, by subtracting the centre from every coordinate on the grid.
+    2) A rotation of the grid around this new centre, which is performed clockwise from an input angle.
+    3) A radial rescaling of every coordinate whose radius is below the radial minimum to the radial minimum. A
+    coordinate exactly at the centre is moved to (radial_minimum, radial_minimum).
+
+    Parameters
+    ----------
+    grid_2d : ndarray
+        The 2d grid of (y, x) coordinates which are transformed to a new reference frame.
+    centre : (float, float)
+        The (y,x) centre of the reference frame.
+    cos_phi : float
+        The cosine of the rotation angle of the reference frame.
+    sin_phi : float
+        The sine of the rotation angle of the reference frame.
+    grid_radial_minimum : float
+        The radial minimum coordinates are relocated to.
+    """
+    transformed_grid_2d = np.zeros(grid_2d.shape)
+
+    for index in range(grid_2d.shape[0]):
+
+        shifted_y = grid_2d[index, 0] - centre[0]
+        shifted_x = grid_2d[index, 1] - centre[1]
+
+        y = shifted_y * cos_phi - shifted_x * sin_phi
+        x = shifted_x * cos_phi + shifted_y * sin_phi
+
+        radius = np.sqrt(y ** 2 + x ** 2)
+
+        if radius == 0.0:
+            y = grid_radial_minimum
+            x = grid_radial_minimum
+        elif radius < grid_radial_minimum:
+            y *= grid_radial_minimum / radius
+            x *= grid_radial_minimum / radius
+
+        transformed_grid_2d[index, 0] = y
+        transformed_grid_2d[index, 1] = x
+
+    return transformed_grid_2d
+
 
 class GeometryProfile:
     def __init__(self, centre: Tuple[float, float] = (0.0, 0.0)):
@@ -213,8 +438,7 @@ class EllProfile(SphProfile):
         )
 
     @grid_decorators.grid_2d_to_structure
-    @grid_decorators.transform
-    @grid_decorators.relocate_to_radial_minimum
+    @transform_and_relocate_to_radial_minimum
     def grid_to_elliptical_radii(self, grid):
         """
         Convert a grid of (y,x) coordinates to an elliptical radius.
@@ -226,15 +450,19 @@ class EllProfile(SphProfile):
         grid
             The (y, x) coordinates in the reference frame of the elliptical profile.
         """
-        return np.sqrt(
-            np.add(
-                np.square(grid[:, 1]), np.square(np.divide(grid[:, 0], self.axis_ratio))
-            )
+        return cached_geometry_from(
+            grid=grid,
+            key=("elliptical_radii", float(self.axis_ratio)),
+            func=lambda: np.sqrt(
+                np.add(
+                    np.square(grid[:, 1]),
+                    np.square(np.divide(grid[:, 0], self.axis_ratio)),
+                )
+            ),
         )
 
     @grid_decorators.grid_2d_to_structure
-    @grid_decorators.transform
-    @grid_decorators.relocate_to_radial_minimum
+    @transform_and_relocate_to_radial_minimum
     def grid_to_eccentric_radii(self, grid):
         """
         Convert a grid of (y,x) coordinates to an eccentric radius, which is (1.0/axis_ratio) * elliptical radius \
@@ -251,6 +479,59 @@ class EllProfile(SphProfile):
             np.sqrt(self.axis_ratio), self.grid_to_elliptical_radii(grid)
         ).view(np.ndarray)
 
+    def grid_to_elliptical_radii_stack(self, grid):
+        """
+        Convert a grid of (y,x) coordinates to the elliptical radii of a stack of profiles, returning an ndarray of
+        shape [total_profiles, total_coordinates].
+
+        The profile's `centre`, `axis_ratio` and `angle` may be arrays with one entry per profile (see
+        `LightProfile.stack_from`), in which case the translation, rotation, relocation to the radial minimum and
+        elliptical radii of every profile are computed as a single set of NumPy operations. For a profile with
+        scalar parameters the returned ndarray has shape [1, total_coordinates] and its row is identical to the
+        output of `grid_to_elliptical_radii`.
+
+        Parameters
+        ----------
+        grid
+            The 1D (y, x) coordinates in the original reference frame of the grid.
+        """
+        grid = np.asarray(grid)
+
+        centres = np.reshape(self.centre, (-1, 2))
+        axis_ratios = np.reshape(self.axis_ratio, (-1, 1))
+        phi_radians = np.radians(np.reshape(self.angle, (-1, 1)))
+
+        cos_phi = np.cos(phi_radians)
+        sin_phi = np.sin(phi_radians)
+
+        shifted_y = np.subtract(grid[:, 0], centres[:, 0:1])
+        shifted_x = np.subtract(grid[:, 1], centres[:, 1:2])
+
+        grid_y = shifted_y * cos_phi - shifted_x * sin_phi
+        grid_x = shifted_x * cos_phi + shifted_y * sin_phi
+
+        grid_radial_minimum = conf.instance["grids"]["radial_minimum"][
+            "radial_minimum"
+        ][self.__class__.__name__]
+
+        with np.errstate(all="ignore"):  # Division by zero fixed via isnan
+
+            grid_radii = np.sqrt(np.add(np.square(grid_y), np.square(grid_x)))
+
+            grid_radial_scale = np.where(
+                grid_radii < grid_radial_minimum, grid_radial_minimum / grid_radii, 1.0
+            )
+
+            grid_y = np.multiply(grid_y, grid_radial_scale)
+            grid_x = np.multiply(grid_x, grid_radial_scale)
+
+        grid_y[np.isnan(grid_y)] = grid_radial_minimum
+        grid_x[np.isnan(grid_x)] = grid_radial_minimum
+
+        return np.sqrt(
+            np.add(np.square(grid_x), np.square(np.divide(grid_y, axis_ratios)))
+        )
+
     @grid_decorators.grid_2d_to_structure
     def transform_grid_to_reference_frame(self, grid):
         """
@@ -266,10 +547,20 @@ class EllProfile(SphProfile):
             return super().transform_grid_to_reference_frame(
                 grid=grid_2d.Grid2DTransformedNumpy(grid=grid)
             )
-        transformed = geometry_util.transform_grid_2d_to_reference_frame(
-            grid_2d=grid, centre=self.centre, angle=self.angle
+
+        return cached_geometry_from(
+            grid=grid,
+            key=(
+                "reference_frame",
+                (float(self.centre[0]), float(self.centre[1])),
+                float(self.angle),
+            ),
+            func=lambda: grid_2d.Grid2DTransformedNumpy(
+                grid=geometry_util.transform_grid_2d_to_reference_frame(
+                    grid_2d=grid, centre=self.centre, angle=self.angle
+                )
+            ),
         )
-        return grid_2d.Grid2DTransformedNumpy(grid=transformed)
 
     @grid_decorators.grid_2d_to_structure
     def transform_grid_from_reference_frame(self, grid):
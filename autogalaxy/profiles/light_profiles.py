@@ -1,7 +1,11 @@
 import numpy as np
 from autoarray.structures.arrays.two_d import array_2d
 from autoarray.structures.grids import grid_decorators
+from autoarray.structures.grids.two_d import grid_2d_irregular
+from autogalaxy import convert
+from autogalaxy import exc
 from autogalaxy.profiles import geometry_profiles
+from autogalaxy.util import oversampling_util
 from scipy.integrate import quad
 
 from typing import Tuple
@@ -54,10 +58,113 @@ class LightProfile(geometry_profiles.EllProfile):
         """
         raise NotImplementedError()
 
+    @classmethod
+    def stack_from(cls, centres, elliptical_comps=None, **parameters):
+        """
+        Create a stack of light profiles of this class, where every parameter is an array with one entry per profile
+        (a struct-of-arrays), such that `image_2d_stack_from_grid` evaluates the image of every profile in a single
+        set of NumPy operations.
+
+        For example, `EllSersic.stack_from(centres=centres, elliptical_comps=elliptical_comps,
+        intensity=intensities, effective_radius=effective_radii, sersic_index=sersic_indexes)` returns a stack of
+        `len(centres)` Sersic profiles. Any parameter that is not input takes the default value of the class's
+        constructor for every profile.
+
+        The returned object is an instance of the light profile class whose attributes are arrays of shape
+        [total_profiles, 1] and is only intended for calling `image_2d_stack_from_grid`.
+
+        Parameters
+        ----------
+        centres : np.ndarray
+            The (y,x) arc-second coordinates of every profile centre, with shape [total_profiles, 2].
+        elliptical_comps : np.ndarray or None
+            The first and second ellipticity components of every profile, with shape [total_profiles, 2]. If `None`
+            every profile is spherical.
+        parameters : np.ndarray
+            Arrays of shape [total_profiles] of the light profile's other constructor parameters (e.g. `intensity`).
+        """
+        centres = np.reshape(np.asarray(centres, dtype="float64"), (-1, 2))
+
+        if elliptical_comps is None:
+            elliptical_comps = np.zeros(centres.shape)
+
+        elliptical_comps = np.reshape(
+            np.asarray(elliptical_comps, dtype="float64"), (-1, 2)
+        )
+
+        axis_ratios, angles = convert.axis_ratios_and_phis_from(
+            elliptical_comps=elliptical_comps
+        )
+
+        profile = cls()
+
+        profile.centre = centres
+        profile.elliptical_comps = elliptical_comps
+        profile.axis_ratio = axis_ratios[:, None]
+        profile.angle = angles[:, None]
+
+        for name, value in parameters.items():
+
+            if not hasattr(profile, name):
+                raise exc.ProfileException(
+                    f"The parameter {name} is not a parameter of the light profile {cls.__name__}."
+                )
+
+            setattr(
+                profile, name, np.reshape(np.asarray(value, dtype="float64"), (-1, 1))
+            )
+
+        return profile
+
+    def image_2d_stack_from_grid(self, grid) -> np.ndarray:
+        """
+        Abstract method for obtaining the images of a stack of light profiles (see `stack_from`) at a grid of
+        Cartesian (y,x) coordinates, returned as an ndarray of shape [total_profiles, total_coordinates].
+
+        Parameters
+        ----------
+        grid
+            The 1D (y, x) coordinates in the original reference frame of the grid.
+        """
+        raise NotImplementedError()
+
     @grid_decorators.grid_1d_to_structure
     def image_1d_from_grid(self, grid):
         return self.image_2d_from_grid(grid=grid)
 
+    def image_2d_via_adaptive_oversampling_from(
+        self, grid, fractional_accuracy=0.9999, sub_steps=None
+    ) -> array_2d.Array2D:
+        """
+        Returns the image of the light profile in every pixel of a `Grid2D`, where every pixel is oversampled only
+        as much as is required for its value to converge to the input fractional accuracy.
+
+        Unlike a `Grid2DIterate`, whose sub-sizes are chosen using the image of all profiles combined, the sub-size of
+        every pixel is chosen for this profile alone (see `oversampling_util.image_2d_via_adaptive_oversampling_from`).
+        The high sub-sizes required by a compact core are therefore only used near it, and the pixels of an extended
+        profile's outskirts are evaluated at their centre.
+
+        Parameters
+        ----------
+        grid : Grid2D
+            The grid whose pixels the image is evaluated in, whose sub-size is not used.
+        fractional_accuracy
+            The fractional accuracy the value of a pixel must be converged to before it is no longer oversampled.
+        sub_steps : [int]
+            The increasing sub-sizes pixels are oversampled at, which default to [2, 4, 8, 16].
+        """
+        image = oversampling_util.image_2d_via_adaptive_oversampling_from(
+            func=lambda grid_2d: self.image_2d_from_grid(
+                grid=grid_2d_irregular.Grid2DIrregular(grid=grid_2d)
+            ),
+            grid_2d=grid.binned.slim,
+            pixel_scales=grid.pixel_scales,
+            fractional_accuracy=fractional_accuracy,
+            sub_steps=sub_steps,
+        )
+
+        return array_2d.Array2D.manual_mask(array=image, mask=grid.mask.mask_sub_1)
+
     def blurred_image_2d_from_grid_and_psf(self, grid, psf, blurring_grid):
         """
         Evaluate the light profile image on an input `Grid2D` of coordinates and then convolve it with a PSF.
@@ -206,8 +313,7 @@ class EllGaussian(LightProfile):
         )
 
     @grid_decorators.grid_2d_to_structure
-    @grid_decorators.transform
-    @grid_decorators.relocate_to_radial_minimum
+    @geometry_profiles.transform_and_relocate_to_radial_minimum
     def image_2d_from_grid(self, grid, grid_radial_minimum=None):
         """
         Calculate the intensity of the light profile on a grid of Cartesian (y,x) coordinates.
@@ -222,6 +328,22 @@ class EllGaussian(LightProfile):
 
         return self.image_2d_from_grid_radii(self.grid_to_eccentric_radii(grid))
 
+    def image_2d_stack_from_grid(self, grid) -> np.ndarray:
+        """
+        Calculate the intensity of a stack of light profiles (see `stack_from`) on a grid of Cartesian (y,x)
+        coordinates, returning an ndarray of shape [total_profiles, total_coordinates].
+
+        Parameters
+        ----------
+        grid
+            The 1D (y, x) coordinates in the original reference frame of the grid.
+        """
+        return self.image_2d_from_grid_radii(
+            np.multiply(
+                np.sqrt(self.axis_ratio), self.grid_to_elliptical_radii_stack(grid)
+            )
+        )
+
 
 class SphGaussian(EllGaussian):
     def __init__(
@@ -381,8 +503,7 @@ class EllSersic(AbstractEllSersic, LightProfile):
         )
 
     @grid_decorators.grid_2d_to_structure
-    @grid_decorators.transform
-    @grid_decorators.relocate_to_radial_minimum
+    @geometry_profiles.transform_and_relocate_to_radial_minimum
     def image_2d_from_grid(self, grid, grid_radial_minimum=None):
         """Calculate the intensity of the light profile on a grid of Cartesian (y,x) coordinates.
 
@@ -395,6 +516,22 @@ class EllSersic(AbstractEllSersic, LightProfile):
         """
         return self.image_2d_from_grid_radii(self.grid_to_eccentric_radii(grid))
 
+    def image_2d_stack_from_grid(self, grid) -> np.ndarray:
+        """
+        Calculate the intensity of a stack of light profiles (see `stack_from`) on a grid of Cartesian (y,x)
+        coordinates, returning an ndarray of shape [total_profiles, total_coordinates].
+
+        Parameters
+        ----------
+        grid
+            The 1D (y, x) coordinates in the original reference frame of the grid.
+        """
+        return self.image_2d_from_grid_radii(
+            np.multiply(
+                np.sqrt(self.axis_ratio), self.grid_to_elliptical_radii_stack(grid)
+            )
+        )
+
 
 class SphSersic(EllSersic):
     def __init__(
@@ -738,6 +875,20 @@ class EllChameleon(LightProfile):
         if self.axis_ratio > 0.99999:
             self.axis_ratio = 0.99999
 
+    @classmethod
+    def stack_from(cls, centres, elliptical_comps=None, **parameters):
+        """
+        Create a stack of Chameleon light profiles, where every parameter is an array with one entry per profile (see
+        `LightProfile.stack_from`).
+
+        The axis-ratio of every profile is limited to 0.99999, as for an individual Chameleon profile.
+        """
+        profile = super().stack_from(
+            centres=centres, elliptical_comps=elliptical_comps, **parameters
+        )
+        profile.axis_ratio = np.minimum(profile.axis_ratio, 0.99999)
+        return profile
+
     def image_2d_from_grid_radii(self, grid_radii):
         """Calculate the intensity of the Chamelon light profile on a grid of radial coordinates.
 
@@ -774,8 +925,7 @@ class EllChameleon(LightProfile):
         )
 
     @grid_decorators.grid_2d_to_structure
-    @grid_decorators.transform
-    @grid_decorators.relocate_to_radial_minimum
+    @geometry_profiles.transform_and_relocate_to_radial_minimum
     def image_2d_from_grid(self, grid, grid_radial_minimum=None):
         """
         Calculate the intensity of the light profile on a grid of Cartesian (y,x) coordinates.
@@ -787,6 +937,18 @@ class EllChameleon(LightProfile):
         """
         return self.image_2d_from_grid_radii(self.grid_to_elliptical_radii(grid))
 
+    def image_2d_stack_from_grid(self, grid) -> np.ndarray:
+        """
+        Calculate the intensity of a stack of Chameleon light profiles (see `stack_from`) on a grid of Cartesian (y,x)
+        coordinates, returning an ndarray of shape [total_profiles, total_coordinates].
+
+        Parameters
+        ----------
+        grid
+            The 1D (y, x) coordinates in the original reference frame of the grid.
+        """
+        return self.image_2d_from_grid_radii(self.grid_to_elliptical_radii_stack(grid))
+
 
 class SphChameleon(EllChameleon):
     def __init__(
@@ -1,6 +1,7 @@
-from .mass_profiles import MassProfile, MassProfile
+from .mass_profiles import MassProfile, MassProfileCollection
 from .total_mass_profiles import (
     PointMass,
+    PointMassCollection,
     EllPowerLawCored,
     SphPowerLawCored,
     EllPowerLawBroken,
@@ -18,6 +19,7 @@ from .dark_mass_profiles import (
     SphNFWTruncated,
     SphNFWTruncatedMCRDuffy,
     SphNFWTruncatedMCRLudlow,
+    SphNFWTruncatedCollection,
     EllNFW,
     SphNFW,
     SphNFWMCRDuffy,
@@ -1,28 +1,33 @@
 import inspect
+import json
+import os
+from functools import lru_cache
+from os import path
 
 import numpy as np
 from astropy import cosmology as cosmo
-from astropy import units
+from autoconf import conf
 from autoarray import decorator_util
 from autoarray.structures.grids import grid_decorators
+from autogalaxy.profiles import geometry_profiles
 from autogalaxy import exc
 from autogalaxy.profiles import mass_profiles as mp
 from autogalaxy.util import cosmology_util
+from autogalaxy.util import mass_collection_util
 from colossus.cosmology import cosmology as col_cosmology
 from colossus.halo.concentration import concentration as col_concentration
 from numba import cfunc
 from numba.types import intc, CPointer, float64
 
-from pyquad import quad_grid
 from scipy import LowLevelCallable
 from scipy import special
 from scipy.integrate import quad
-from scipy.optimize import fsolve
+from autogalaxy.profiles.mass_profiles.mass_profiles import MassProfileCollection
 from autogalaxy.profiles.mass_profiles.mass_profiles import MassProfileMGE
 
 import warnings
 import copy
-from typing import Tuple
+from typing import Optional, Tuple
 
 
 def jit_integrand(integrand_function):
@@ -95,6 +100,467 @@ def jit_integrand(integrand_function):
     return LowLevelCallable(cf(wrapped).ctypes)
 
 
+@lru_cache(maxsize=None)
+def low_level_integrand_from(integrand_function):
+    """
+    Returns the `LowLevelCallable` of an integrand (see `jit_integrand`), which is compiled once and reused for every
+    subsequent integral, as opposed to being recompiled every time a profile tabulates its integrals.
+    """
+    return jit_integrand(integrand_function)
+
+
+def surface_density_integrand(x, kappa_radius, scale_radius, inner_slope):
+    return (
+        (3 - inner_slope)
+        * (x + kappa_radius / scale_radius) ** (inner_slope - 4)
+        * (1 - np.sqrt(1 - x * x))
+    )
+
+
+def potential_integrand(x, kappa_radius, scale_radius, inner_slope):
+    return (x + kappa_radius / scale_radius) ** (inner_slope - 3) * (
+        (1 - np.sqrt(1 - x ** 2)) / x
+    )
+
+
+def surface_density_integral_via_integrator_from(
+    eta_over_scale_radius, inner_slope, epsrel
+):
+    """
+    Compute the dimensionless surface density integral of the generalized NFW profile, which is tabulated over the
+    elliptical radii eta to compute its deflection angles, using the `quad` integrator.
+
+    The integral only depends on the ratio of eta and the profile's `scale_radius` and on its `inner_slope`.
+
+    Parameters
+    ----------
+    eta_over_scale_radius : np.ndarray
+        The elliptical radii the integral is computed at, divided by the profile's scale radius.
+    inner_slope : float
+        The inner slope of the generalized NFW profile.
+    epsrel : float
+        The relative tolerance of the `quad` integrator.
+
+    Returns
+    -------
+    (np.ndarray, np.ndarray)
+        The integral at every input radius and the absolute error estimate of the integrator.
+    """
+    integrand = low_level_integrand_from(surface_density_integrand)
+
+    surface_density_integral = np.zeros(len(eta_over_scale_radius))
+    surface_density_integral_error = np.zeros(len(eta_over_scale_radius))
+
+    for i, x in enumerate(eta_over_scale_radius):
+
+        integral, integral_error = quad(
+            integrand, a=0.0, b=1.0, args=(x, 1.0, inner_slope), epsrel=epsrel
+        )
+
+        surface_density_integral[i] = (x ** (1 - inner_slope)) * (
+            ((1 + x) ** (inner_slope - 3)) + integral
+        )
+        surface_density_integral_error[i] = (x ** (1 - inner_slope)) * integral_error
+
+    return surface_density_integral, surface_density_integral_error
+
+
+def potential_integral_via_integrator_from(eta_over_scale_radius, inner_slope, epsrel):
+    """
+    Compute the dimensionless deflection integral of the generalized NFW profile, which is tabulated over the
+    elliptical radii eta to compute its potential, using the `quad` integrator.
+
+    The integral only depends on the ratio of eta and the profile's `scale_radius` and on its `inner_slope`.
+
+    Parameters
+    ----------
+    eta_over_scale_radius : np.ndarray
+        The elliptical radii the integral is computed at, divided by the profile's scale radius.
+    inner_slope : float
+        The inner slope of the generalized NFW profile.
+    epsrel : float
+        The relative tolerance of the `quad` integrator.
+
+    Returns
+    -------
+    (np.ndarray, np.ndarray)
+        The integral at every input radius and the absolute error estimate of the integrator.
+    """
+    integrand = low_level_integrand_from(potential_integrand)
+
+    potential_integral = np.zeros(len(eta_over_scale_radius))
+    potential_integral_error = np.zeros(len(eta_over_scale_radius))
+
+    for i, x in enumerate(eta_over_scale_radius):
+
+        integral, integral_error = quad(
+            integrand, a=0.0, b=1.0, args=(x, 1.0, inner_slope), epsrel=epsrel
+        )
+
+        potential_integral[i] = (x ** (2 - inner_slope)) * (
+            (1.0 / (3 - inner_slope))
+            * special.hyp2f1(3 - inner_slope, 3 - inner_slope, 4 - inner_slope, -x)
+            + integral
+        )
+        potential_integral_error[i] = (x ** (2 - inner_slope)) * integral_error
+
+    return potential_integral, potential_integral_error
+
+
+class NFWGeneralizedLookupTable:
+
+    files = (
+        "log_eta_over_scale_radius",
+        "inner_slopes",
+        "surface_density_integral",
+        "potential_integral",
+    )
+
+    def __init__(
+        self,
+        log_eta_over_scale_radius,
+        inner_slopes,
+        surface_density_integral,
+        potential_integral,
+        max_relative_error=None,
+    ):
+        """
+        A lookup table of the dimensionless surface density and deflection integrals of the generalized NFW profile,
+        tabulated on a uniform grid of log10(eta / scale_radius) values and inner slopes.
+
+        The integrals are otherwise computed with the `quad` integrator every time the potential or deflection
+        angles of a generalized NFW profile are computed. The table is built once, stored on disk as .npy files and
+        memory-mapped when loaded, with values interpolated from it at runtime.
+
+        Parameters
+        ----------
+        log_eta_over_scale_radius : np.ndarray
+            The uniformly spaced log10(eta / scale_radius) values the integrals are tabulated at.
+        inner_slopes : np.ndarray
+            The uniformly spaced inner slopes the integrals are tabulated at.
+        surface_density_integral : np.ndarray
+            The surface density integral of shape [total_inner_slopes, total_log_eta_over_scale_radius].
+        potential_integral : np.ndarray
+            The deflection integral used to compute the potential, of shape
+            [total_inner_slopes, total_log_eta_over_scale_radius].
+        max_relative_error : float
+            The maximum relative difference between the interpolated integrals and the integrator, as measured when
+            the table was made.
+        """
+        self.log_eta_over_scale_radius = log_eta_over_scale_radius
+        self.inner_slopes = inner_slopes
+        self.surface_density_integral = surface_density_integral
+        self.potential_integral = potential_integral
+        self.max_relative_error = max_relative_error
+
+    @classmethod
+    def from_path(cls, file_path):
+        """
+        Load a lookup table output by `make`, memory-mapping its tabulated integrals.
+
+        Parameters
+        ----------
+        file_path : str
+            The directory the lookup table is stored in.
+        """
+        arrays = [
+            np.load(path.join(file_path, f"{file}.npy"), mmap_mode="r")
+            for file in cls.files
+        ]
+
+        with open(path.join(file_path, "lookup_table.json")) as f:
+            max_relative_error = json.load(f)["max_relative_error"]
+
+        return cls(*arrays, max_relative_error=max_relative_error)
+
+    @classmethod
+    def make(
+        cls,
+        file_path,
+        log_eta_over_scale_radius,
+        inner_slopes,
+        tolerance,
+        epsrel=1.49e-5,
+    ):
+        """
+        Make a lookup table by computing the integrals at every tabulated value with the `quad` integrator, check
+        its interpolated values agree with the integrator to the input tolerance (see `max_relative_error_from`) and
+        output it to the input directory.
+
+        Parameters
+        ----------
+        file_path : str
+            The directory the lookup table is output to.
+        log_eta_over_scale_radius : np.ndarray
+            The uniformly spaced log10(eta / scale_radius) values the integrals are tabulated at.
+        inner_slopes : np.ndarray
+            The uniformly spaced inner slopes the integrals are tabulated at.
+        tolerance : float
+            The maximum relative difference between the interpolated integrals and the integrator, above which an
+            exception is raised and the table is not output.
+        epsrel : float
+            The relative tolerance of the `quad` integrator.
+        """
+        log_eta_over_scale_radius = np.asarray(
+            log_eta_over_scale_radius, dtype="float64"
+        )
+        inner_slopes = np.asarray(inner_slopes, dtype="float64")
+
+        eta_over_scale_radius = 10.0 ** log_eta_over_scale_radius
+
+        surface_density_integral = np.zeros(
+            (inner_slopes.shape[0], log_eta_over_scale_radius.shape[0])
+        )
+        potential_integral = np.zeros(
+            (inner_slopes.shape[0], log_eta_over_scale_radius.shape[0])
+        )
+
+        for i, inner_slope in enumerate(inner_slopes):
+
+            surface_density_integral[i] = surface_density_integral_via_integrator_from(
+                eta_over_scale_radius=eta_over_scale_radius,
+                inner_slope=inner_slope,
+                epsrel=epsrel,
+            )[0]
+            potential_integral[i] = potential_integral_via_integrator_from(
+                eta_over_scale_radius=eta_over_scale_radius,
+                inner_slope=inner_slope,
+                epsrel=epsrel,
+            )[0]
+
+        lookup_table = cls(
+            log_eta_over_scale_radius=log_eta_over_scale_radius,
+            inner_slopes=inner_slopes,
+            surface_density_integral=surface_density_integral,
+            potential_integral=potential_integral,
+        )
+
+        lookup_table.max_relative_error = lookup_table.max_relative_error_from(
+            tolerance=tolerance, epsrel=epsrel
+        )
+
+        if lookup_table.max_relative_error > tolerance:
+            raise exc.ProfileException(
+                f"The generalized NFW lookup table differs from the integrator by a relative error of "
+                f"{lookup_table.max_relative_error}, which is above the tolerance of {tolerance}. Increase the "
+                f"number of tabulated values."
+            )
+
+        os.makedirs(file_path, exist_ok=True)
+
+        for file in cls.files:
+            np.save(path.join(file_path, f"{file}.npy"), getattr(lookup_table, file))
+
+        with open(path.join(file_path, "lookup_table.json"), "w") as f:
+            json.dump({"max_relative_error": lookup_table.max_relative_error}, f)
+
+        return cls.from_path(file_path=file_path)
+
+    def max_relative_error_from(self, tolerance, epsrel=1.49e-5, stride=10):
+        """
+        Compute the maximum relative difference between the interpolated integrals and the integrator at the centre
+        of every `stride`'th cell of the table, which is where the interpolation error is largest.
+
+        Values where the integrator's own error estimate is above the tolerance, or where it returns a non-positive
+        value for these positive integrals, are omitted, as the integrator itself does not converge there.
+
+        Parameters
+        ----------
+        tolerance : float
+            The relative tolerance the integrator's own error estimate must be below for a value to be compared.
+        epsrel : float
+            The relative tolerance of the `quad` integrator.
+        stride : int
+            The interval of cells in each dimension whose centres are compared.
+        """
+        log_eta_over_scale_radius = 0.5 * (
+            self.log_eta_over_scale_radius[1:] + self.log_eta_over_scale_radius[:-1]
+        )
+        inner_slopes = 0.5 * (self.inner_slopes[1:] + self.inner_slopes[:-1])
+
+        eta_over_scale_radius = 10.0 ** log_eta_over_scale_radius[::stride]
+
+        max_relative_error = 0.0
+
+        for inner_slope in inner_slopes[::stride]:
+
+            for integral_via_integrator_from, integral_from in (
+                (
+                    surface_density_integral_via_integrator_from,
+                    self.surface_density_integral_from,
+                ),
+                (potential_integral_via_integrator_from, self.potential_integral_from),
+            ):
+
+                integral, integral_error = integral_via_integrator_from(
+                    eta_over_scale_radius=eta_over_scale_radius,
+                    inner_slope=inner_slope,
+                    epsrel=epsrel,
+                )
+
+                converged = (integral > 0.0) & (
+                    integral_error <= tolerance * np.abs(integral)
+                )
+
+                relative_error = np.abs(
+                    integral_from(
+                        eta_over_scale_radius=eta_over_scale_radius,
+                        inner_slope=inner_slope,
+                    )
+                    - integral
+                ) / np.abs(integral)
+
+                if np.any(converged):
+                    max_relative_error = max(
+                        max_relative_error, float(np.max(relative_error[converged]))
+                    )
+
+        return max_relative_error
+
+    def covers_from(self, eta_over_scale_radius, inner_slope):
+        """
+        Returns a boolean array which is `True` for every input radius which, for the input inner slope, is within the
+        range of the lookup table.
+        """
+        if not self.inner_slopes[0] <= inner_slope <= self.inner_slopes[-1]:
+            return np.full(eta_over_scale_radius.shape[0], False)
+
+        log_eta_over_scale_radius = np.log10(eta_over_scale_radius)
+
+        return (log_eta_over_scale_radius >= self.log_eta_over_scale_radius[0]) & (
+            log_eta_over_scale_radius <= self.log_eta_over_scale_radius[-1]
+        )
+
+    def surface_density_integral_from(self, eta_over_scale_radius, inner_slope):
+        return self.interpolated_integral_from(
+            integral=self.surface_density_integral,
+            eta_over_scale_radius=eta_over_scale_radius,
+            inner_slope=inner_slope,
+        )
+
+    def potential_integral_from(self, eta_over_scale_radius, inner_slope):
+        return self.interpolated_integral_from(
+            integral=self.potential_integral,
+            eta_over_scale_radius=eta_over_scale_radius,
+            inner_slope=inner_slope,
+        )
+
+    def interpolated_integral_from(self, integral, eta_over_scale_radius, inner_slope):
+        """
+        Bilinearly interpolate a tabulated integral in log10(eta / scale_radius) and inner slope.
+
+        The integrals follow power-laws in eta, therefore the logarithm of the integral is interpolated where the
+        surrounding tabulated values are all positive, with the integral itself interpolated elsewhere.
+
+        Parameters
+        ----------
+        integral : np.ndarray
+            The tabulated integral which is interpolated.
+        eta_over_scale_radius : np.ndarray
+            The elliptical radii the integral is interpolated at, divided by the profile's scale radius.
+        inner_slope : float
+            The inner slope of the generalized NFW profile.
+        """
+        x_index = (
+            np.log10(eta_over_scale_radius) - self.log_eta_over_scale_radius[0]
+        ) / (self.log_eta_over_scale_radius[1] - self.log_eta_over_scale_radius[0])
+        x_lower = np.clip(
+            np.floor(x_index).astype("int"),
+            0,
+            self.log_eta_over_scale_radius.shape[0] - 2,
+        )
+        x_weight = x_index - x_lower
+
+        slope_index = (inner_slope - self.inner_slopes[0]) / (
+            self.inner_slopes[1] - self.inner_slopes[0]
+        )
+        slope_lower = int(
+            np.clip(np.floor(slope_index), 0, self.inner_slopes.shape[0] - 2)
+        )
+        slope_weight = slope_index - slope_lower
+
+        corners = (
+            (1.0 - slope_weight) * (1.0 - x_weight),
+            (1.0 - slope_weight) * x_weight,
+            slope_weight * (1.0 - x_weight),
+            slope_weight * x_weight,
+        )
+
+        values = (
+            integral[slope_lower][x_lower],
+            integral[slope_lower][x_lower + 1],
+            integral[slope_lower + 1][x_lower],
+            integral[slope_lower + 1][x_lower + 1],
+        )
+
+        positive = np.all([value > 0.0 for value in values], axis=0)
+
+        linear = sum(weight * value for weight, value in zip(corners, values))
+
+        log_values = [np.log(np.where(positive, value, 1.0)) for value in values]
+
+        logarithmic = np.exp(
+            sum(weight * value for weight, value in zip(corners, log_values))
+        )
+
+        return np.where(positive, logarithmic, linear)
+
+
+_lookup_tables = {}
+
+
+def lookup_table_from_config():
+    """
+    Returns the generalized NFW lookup table specified by the [gnfw] section of the general.ini config, or None if
+    the lookup table is not used.
+
+    The table is loaded from `lookup_table_path` if it has already been made there, or else it is made and output
+    there, after which it is stored in memory for all subsequent profiles.
+    """
+    gnfw_config = conf.instance["general"]["gnfw"]
+
+    if not gnfw_config["lookup_table"]:
+        return None
+
+    file_path = path.expanduser(gnfw_config["lookup_table_path"])
+
+    if file_path not in _lookup_tables:
+
+        tolerance = gnfw_config["lookup_table_tolerance"]
+
+        if path.exists(path.join(file_path, "lookup_table.json")):
+
+            lookup_table = NFWGeneralizedLookupTable.from_path(file_path=file_path)
+
+            if lookup_table.max_relative_error > tolerance:
+                raise exc.ProfileException(
+                    f"The generalized NFW lookup table at {file_path} differs from the integrator by a relative error "
+                    f"of {lookup_table.max_relative_error}, which is above the tolerance of {tolerance}."
+                )
+
+        else:
+
+            lookup_table = NFWGeneralizedLookupTable.make(
+                file_path=file_path,
+                log_eta_over_scale_radius=np.linspace(
+                    gnfw_config["log_eta_over_scale_radius_min"],
+                    gnfw_config["log_eta_over_scale_radius_max"],
+                    gnfw_config["log_eta_over_scale_radius_bins"],
+                ),
+                inner_slopes=np.linspace(
+                    gnfw_config["inner_slope_min"],
+                    gnfw_config["inner_slope_max"],
+                    gnfw_config["inner_slope_bins"],
+                ),
+                tolerance=tolerance,
+                epsrel=AbstractEllNFWGeneralized.epsrel,
+            )
+
+        _lookup_tables[file_path] = lookup_table
+
+    return _lookup_tables[file_path]
+
+
 class DarkProfile:
 
     pass
@@ -159,9 +625,87 @@ class AbstractEllNFWGeneralized(mp.MassProfile, DarkProfile, MassProfileMGE):
 
         return eta_min, eta_max, minimum_log_eta, maximum_log_eta, bin_size
 
+    def tabulated_surface_density_integral_from(self, eta):
+        """
+        Compute the surface density integral used to compute the deflection angles at the tabulated elliptical radii
+        eta (see `tabulated_integral_from`).
+
+        Parameters
+        ----------
+        eta : np.ndarray
+            The tabulated elliptical radii the integral is computed at.
+        """
+        return self.tabulated_integral_from(
+            eta=eta,
+            lookup_table_integral="surface_density_integral",
+            integral_via_integrator_from=surface_density_integral_via_integrator_from,
+        )
+
+    def tabulated_potential_integral_from(self, eta):
+        """
+        Compute the deflection integral used to compute the potential at the tabulated elliptical radii eta (see
+        `tabulated_integral_from`).
+
+        Parameters
+        ----------
+        eta : np.ndarray
+            The tabulated elliptical radii the integral is computed at.
+        """
+        return self.tabulated_integral_from(
+            eta=eta,
+            lookup_table_integral="potential_integral",
+            integral_via_integrator_from=potential_integral_via_integrator_from,
+        )
+
+    def tabulated_integral_from(
+        self, eta, lookup_table_integral, integral_via_integrator_from
+    ):
+        """
+        Compute an integral at the tabulated elliptical radii eta, interpolating it from the generalized NFW lookup
+        table if it is enabled in the general.ini config and computing it with the `quad` integrator for all radii
+        the lookup table does not cover.
+
+        Parameters
+        ----------
+        eta : np.ndarray
+            The tabulated elliptical radii the integral is computed at.
+        lookup_table_integral : str
+            The name of the tabulated integral of the lookup table.
+        integral_via_integrator_from : func
+            The function which computes the integral using the `quad` integrator.
+        """
+        eta_over_scale_radius = eta / self.scale_radius
+
+        lookup_table = lookup_table_from_config()
+
+        if lookup_table is None:
+            covered = np.full(eta.shape[0], False)
+        else:
+            covered = lookup_table.covers_from(
+                eta_over_scale_radius=eta_over_scale_radius,
+                inner_slope=self.inner_slope,
+            )
+
+        integral = np.zeros(eta.shape[0])
+
+        if np.any(covered):
+            integral[covered] = lookup_table.interpolated_integral_from(
+                integral=getattr(lookup_table, lookup_table_integral),
+                eta_over_scale_radius=eta_over_scale_radius[covered],
+                inner_slope=self.inner_slope,
+            )
+
+        if not np.all(covered):
+            integral[~covered] = integral_via_integrator_from(
+                eta_over_scale_radius=eta_over_scale_radius[~covered],
+                inner_slope=self.inner_slope,
+                epsrel=self.epsrel,
+            )[0]
+
+        return integral
+
     @grid_decorators.grid_2d_to_structure
-    @grid_decorators.transform
-    @grid_decorators.relocate_to_radial_minimum
+    @geometry_profiles.transform_and_relocate_to_radial_minimum
     def convergence_2d_from_grid(self, grid):
         """Calculate the projected convergence at a given set of arc-second gridded coordinates.
 
@@ -177,8 +721,7 @@ class AbstractEllNFWGeneralized(mp.MassProfile, DarkProfile, MassProfileMGE):
         return self.convergence_func(grid_radius=grid_eta)
 
     @grid_decorators.grid_2d_to_structure
-    @grid_decorators.transform
-    @grid_decorators.relocate_to_radial_minimum
+    @geometry_profiles.transform_and_relocate_to_radial_minimum
     def convergence_2d_from_grid_via_gaussians(self, grid):
         """Calculate the projected convergence at a given set of arc-second gridded coordinates.
 
@@ -342,9 +885,7 @@ class AbstractEllNFWGeneralized(mp.MassProfile, DarkProfile, MassProfileMGE):
             cosmology=cosmology,
         )
 
-        return fsolve(
-            func=self.concentration_func, x0=10.0, args=(delta_concentration,)
-        )[0]
+        return float(concentration_from(delta_concentration=delta_concentration))
 
     @staticmethod
     def concentration_func(concentration, delta_concentration):
@@ -422,8 +963,8 @@ class AbstractEllNFWGeneralized(mp.MassProfile, DarkProfile, MassProfileMGE):
     def decompose_convergence_into_gaussians(self):
 
         rho_at_scale_radius = (
-            self.kappa_s / self.scale_radius
-        )  # density parameter of 3D gNFW
+            1.0 / self.scale_radius
+        )  # density parameter of 3D gNFW, with kappa_s applied as the normalization
 
         radii_min = self.scale_radius / 2000.0
         radii_max = self.scale_radius * 30.0
@@ -436,8 +977,12 @@ class AbstractEllNFWGeneralized(mp.MassProfile, DarkProfile, MassProfileMGE):
                 * (1.0 + x) ** (self.inner_slope - 3.0)
             )
 
-        amps, sigmas = self._decompose_convergence_into_gaussians(
-            func=gnfw_3d, radii_min=radii_min, radii_max=radii_max
+        amps, sigmas = self._decompose_convergence_into_gaussians_via_cache(
+            func=gnfw_3d,
+            radii_min=radii_min,
+            radii_max=radii_max,
+            shape_key=(self.scale_radius, self.inner_slope),
+            normalization=self.kappa_s,
         )
         amps *= np.sqrt(2.0 * np.pi) * sigmas
         return amps, sigmas
@@ -451,8 +996,7 @@ class AbstractEllNFWGeneralized(mp.MassProfile, DarkProfile, MassProfileMGE):
 
 class EllNFWGeneralized(AbstractEllNFWGeneralized):
     @grid_decorators.grid_2d_to_structure
-    @grid_decorators.transform
-    @grid_decorators.relocate_to_radial_minimum
+    @geometry_profiles.transform_and_relocate_to_radial_minimum
     def potential_2d_from_grid(self, grid, tabulate_bins=1000):
         """
         Calculate the potential at a given set of arc-second gridded coordinates.
@@ -466,12 +1010,6 @@ class EllNFWGeneralized(AbstractEllNFWGeneralized):
 
         """
 
-        @jit_integrand
-        def deflection_integrand(x, kappa_radius, scale_radius, inner_slope):
-            return (x + kappa_radius / scale_radius) ** (inner_slope - 3) * (
-                (1 - np.sqrt(1 - x ** 2)) / x
-            )
-
         (
             eta_min,
             eta_max,
@@ -482,31 +1020,9 @@ class EllNFWGeneralized(AbstractEllNFWGeneralized):
 
         potential_grid = np.zeros(grid.shape[0])
 
-        deflection_integral = np.zeros((tabulate_bins,))
-
-        for i in range(tabulate_bins):
-            eta = 10.0 ** (minimum_log_eta + (i - 1) * bin_size)
-
-            integral = quad(
-                deflection_integrand,
-                a=0.0,
-                b=1.0,
-                args=(eta, self.scale_radius, self.inner_slope),
-                epsrel=EllNFWGeneralized.epsrel,
-            )[0]
+        eta = 10.0 ** (minimum_log_eta + (np.arange(tabulate_bins) - 1) * bin_size)
 
-            deflection_integral[i] = (
-                (eta / self.scale_radius) ** (2 - self.inner_slope)
-            ) * (
-                (1.0 / (3 - self.inner_slope))
-                * special.hyp2f1(
-                    3 - self.inner_slope,
-                    3 - self.inner_slope,
-                    4 - self.inner_slope,
-                    -(eta / self.scale_radius),
-                )
-                + integral
-            )
+        deflection_integral = self.tabulated_potential_integral_from(eta=eta)
 
         for i in range(grid.shape[0]):
 
@@ -529,8 +1045,7 @@ class EllNFWGeneralized(AbstractEllNFWGeneralized):
         return potential_grid
 
     @grid_decorators.grid_2d_to_structure
-    @grid_decorators.transform
-    @grid_decorators.relocate_to_radial_minimum
+    @geometry_profiles.transform_and_relocate_to_radial_minimum
     def deflections_2d_from_grid(self, grid):
 
         return self._deflections_2d_from_grid_via_gaussians(
@@ -538,8 +1053,7 @@ class EllNFWGeneralized(AbstractEllNFWGeneralized):
         )
 
     @grid_decorators.grid_2d_to_structure
-    @grid_decorators.transform
-    @grid_decorators.relocate_to_radial_minimum
+    @geometry_profiles.transform_and_relocate_to_radial_minimum
     def deflections_2d_from_grid_via_integrator(self, grid, tabulate_bins=1000):
         """
         Calculate the deflection angles at a given set of arc-second gridded coordinates.
@@ -553,14 +1067,6 @@ class EllNFWGeneralized(AbstractEllNFWGeneralized):
 
         """
 
-        @jit_integrand
-        def surface_density_integrand(x, kappa_radius, scale_radius, inner_slope):
-            return (
-                (3 - inner_slope)
-                * (x + kappa_radius / scale_radius) ** (inner_slope - 4)
-                * (1 - np.sqrt(1 - x * x))
-            )
-
         def calculate_deflection_component(npow, yx_index):
 
             deflection_grid = np.zeros(grid.shape[0])
@@ -600,22 +1106,9 @@ class EllNFWGeneralized(AbstractEllNFWGeneralized):
             bin_size,
         ) = self.tabulate_integral(grid, tabulate_bins)
 
-        surface_density_integral = np.zeros((tabulate_bins,))
-
-        for i in range(tabulate_bins):
-            eta = 10.0 ** (minimum_log_eta + (i - 1) * bin_size)
-
-            integral = quad(
-                surface_density_integrand,
-                a=0.0,
-                b=1.0,
-                args=(eta, self.scale_radius, self.inner_slope),
-                epsrel=EllNFWGeneralized.epsrel,
-            )[0]
+        eta = 10.0 ** (minimum_log_eta + (np.arange(tabulate_bins) - 1) * bin_size)
 
-            surface_density_integral[i] = (
-                (eta / self.scale_radius) ** (1 - self.inner_slope)
-            ) * (((1 + eta / self.scale_radius) ** (self.inner_slope - 3)) + integral)
+        surface_density_integral = self.tabulated_surface_density_integral_from(eta=eta)
 
         deflection_y = calculate_deflection_component(npow=1.0, yx_index=0)
         deflection_x = calculate_deflection_component(npow=0.0, yx_index=1)
@@ -731,8 +1224,7 @@ class SphNFWGeneralized(EllNFWGeneralized):
         )
 
     @grid_decorators.grid_2d_to_structure
-    @grid_decorators.transform
-    @grid_decorators.relocate_to_radial_minimum
+    @geometry_profiles.transform_and_relocate_to_radial_minimum
     def deflections_2d_from_grid_via_integrator(self, grid, **kwargs):
         """
         Calculate the deflection angles at a given set of arc-second gridded coordinates.
@@ -848,8 +1340,7 @@ class SphNFWTruncated(AbstractEllNFWGeneralized):
         return np.zeros(shape=grid.shape[0])
 
     @grid_decorators.grid_2d_to_structure
-    @grid_decorators.transform
-    @grid_decorators.relocate_to_radial_minimum
+    @geometry_profiles.transform_and_relocate_to_radial_minimum
     def deflections_2d_from_grid(self, grid, **kwargs):
         """
         Calculate the deflection angles at a given set of arc-second gridded coordinates.
@@ -961,6 +1452,246 @@ class SphNFWTruncatedMCRLudlow(SphNFWTruncated):
         )
 
 
+class SphNFWTruncatedCollection(MassProfileCollection):
+    def __init__(
+        self,
+        centres=((0.0, 0.0),),
+        kappa_s=(0.05,),
+        scale_radius=(1.0,),
+        truncation_radius=(2.0,),
+        tolerance: Optional[float] = None,
+    ):
+        """
+        A collection of spherical truncated NFW halos (see `SphNFWTruncated`) whose parameters are stored in
+        contiguous arrays, such that the summed convergence and deflection angles of every halo are computed in a
+        single compiled loop, skipping halos whose deflection angle at a coordinate is below `tolerance` (see
+        `MassProfileCollection`).
+
+        This represents populations of hundreds or thousands of halos (e.g. the subhalos of a lens galaxy or the
+        line-of-sight halos of a simulation), which are slow to set up and evaluate as individual `SphNFWTruncated`
+        profiles. Populations are usually created from the masses of their halos using the `from_mcr_duffy` or
+        `from_mcr_ludlow` class methods.
+
+        Parameters
+        ----------
+        centres
+            The (y,x) arc-second coordinates of every halo centre, of shape [total_halos, 2].
+        kappa_s
+            The overall normalization of every halo's dark matter profile.
+        scale_radius
+            The arc-second scale radius of every halo.
+        truncation_radius
+            The arc-second truncation radius of every halo.
+        tolerance
+            The arc-second deflection angle below which a halo is skipped, where `None` uses the general config.
+        """
+        super().__init__(centres=centres, tolerance=tolerance)
+
+        self.parameters = self.parameters_from(
+            kappa_s,
+            scale_radius,
+            np.asarray(truncation_radius, dtype="float64")
+            / np.asarray(scale_radius, dtype="float64"),
+        )
+
+        self.kappa_s = self.parameters[:, 0]
+        self.scale_radius = self.parameters[:, 1]
+        self.tau = self.parameters[:, 2]
+        self.truncation_radius = self.tau * self.scale_radius
+
+    @classmethod
+    def from_profiles(cls, profiles, tolerance: Optional[float] = None):
+        """
+        Create a collection from a list of `SphNFWTruncated` profiles (including the mass-concentration relation
+        profiles `SphNFWTruncatedMCRDuffy` and `SphNFWTruncatedMCRLudlow`).
+        """
+        return cls(
+            centres=[profile.centre for profile in profiles],
+            kappa_s=[profile.kappa_s for profile in profiles],
+            scale_radius=[profile.scale_radius for profile in profiles],
+            truncation_radius=[profile.truncation_radius for profile in profiles],
+            tolerance=tolerance,
+        )
+
+    @classmethod
+    def from_mcr_duffy(
+        cls,
+        centres,
+        mass_at_200,
+        redshift_object=0.5,
+        redshift_source=1.0,
+        tolerance: Optional[float] = None,
+    ):
+        """
+        Create a collection of truncated NFW halos from their masses using the Duffy et al. (2008)
+        mass-concentration relation, giving the same halos as creating a `SphNFWTruncatedMCRDuffy` profile for every
+        mass but with the conversion performed on arrays of all halos at once.
+
+        Parameters
+        ----------
+        centres
+            The (y,x) arc-second coordinates of every halo centre, of shape [total_halos, 2].
+        mass_at_200
+            The mass of every halo within the radius at which its average density is 200 times the critical density,
+            in solar masses.
+        redshift_object
+            The redshift of every halo, which is a float if all halos are at the same redshift.
+        redshift_source
+            The redshift of the source, or of the source of every halo.
+        tolerance
+            The arc-second deflection angle below which a halo is skipped (see `MassProfileCollection`).
+        """
+        mass_at_200 = np.asarray(mass_at_200, dtype="float64")
+
+        kappa_s, scale_radius, radius_at_200 = kappa_s_and_scale_radius_for_duffy(
+            mass_at_200=mass_at_200,
+            redshift_object=np.asarray(redshift_object, dtype="float64"),
+            redshift_source=np.asarray(redshift_source, dtype="float64"),
+        )
+
+        collection = cls(
+            centres=centres,
+            kappa_s=kappa_s,
+            scale_radius=scale_radius,
+            truncation_radius=2.0 * radius_at_200,
+            tolerance=tolerance,
+        )
+        collection.mass_at_200 = mass_at_200
+
+        return collection
+
+    @classmethod
+    def from_mcr_ludlow(
+        cls,
+        centres,
+        mass_at_200,
+        redshift_object=0.5,
+        redshift_source=1.0,
+        tolerance: Optional[float] = None,
+    ):
+        """
+        Create a collection of truncated NFW halos from their masses using the Ludlow et al. (2016)
+        mass-concentration relation, giving the same halos as creating a `SphNFWTruncatedMCRLudlow` profile for
+        every mass.
+
+        Colossus computes the concentrations of many masses in one call only if they are at the same redshift, thus
+        the halos are converted in one call for every unique pair of object and source redshifts.
+
+        Parameters
+        ----------
+        centres
+            The (y,x) arc-second coordinates of every halo centre, of shape [total_halos, 2].
+        mass_at_200
+            The mass of every halo within the radius at which its average density is 200 times the critical density,
+            in solar masses.
+        redshift_object
+            The redshift of every halo, which is a float if all halos are at the same redshift.
+        redshift_source
+            The redshift of the source, or of the source of every halo.
+        tolerance
+            The arc-second deflection angle below which a halo is skipped (see `MassProfileCollection`).
+        """
+        mass_at_200, redshift_object, redshift_source = np.broadcast_arrays(
+            np.asarray(mass_at_200, dtype="float64").ravel(),
+            np.asarray(redshift_object, dtype="float64").ravel(),
+            np.asarray(redshift_source, dtype="float64").ravel(),
+        )
+
+        kappa_s = np.zeros(mass_at_200.shape)
+        scale_radius = np.zeros(mass_at_200.shape)
+        radius_at_200 = np.zeros(mass_at_200.shape)
+
+        redshifts = np.stack((redshift_object, redshift_source), axis=-1)
+
+        for redshift_pair in np.unique(redshifts, axis=0):
+
+            halos = np.all(redshifts == redshift_pair, axis=-1)
+
+            (
+                kappa_s[halos],
+                scale_radius[halos],
+                radius_at_200[halos],
+            ) = kappa_s_and_scale_radius_for_ludlow(
+                mass_at_200=mass_at_200[halos],
+                redshift_object=float(redshift_pair[0]),
+                redshift_source=float(redshift_pair[1]),
+            )
+
+        collection = cls(
+            centres=centres,
+            kappa_s=kappa_s,
+            scale_radius=scale_radius,
+            truncation_radius=2.0 * radius_at_200,
+            tolerance=tolerance,
+        )
+        collection.mass_at_200 = mass_at_200
+
+        return collection
+
+    @property
+    def cut_radii(self) -> np.ndarray:
+        """
+        The deflection angle of a truncated NFW halo at radius r is below that of a point mass of its total mass,
+        4 * kappa_s * scale_radius^2 * m(tau) / r, such that it is below the tolerance beyond this radius.
+        """
+        tau_squared = self.tau ** 2
+
+        total_mass_func = (tau_squared / (tau_squared + 1.0) ** 2) * (
+            ((tau_squared - 1.0) * np.log(self.tau))
+            + (self.tau * np.pi)
+            - (tau_squared + 1.0)
+        )
+
+        return (
+            4.0
+            * self.kappa_s
+            * self.scale_radius ** 2
+            * total_mass_func
+            / self.tolerance
+        )
+
+    @grid_decorators.grid_2d_to_structure
+    def convergence_2d_from_grid(self, grid):
+        """
+        Calculate the summed convergence of every halo at a given set of arc-second gridded coordinates.
+
+        The `cut_radii` bound the deflection angles and can lie within the truncation radius, where the convergence
+        is not negligible, so no halos are skipped.
+
+        Parameters
+        ----------
+        grid : aa.Grid2D
+            The grid of (y,x) arc-second coordinates the convergence is computed on.
+        """
+        return self.values_from_grid(
+            func=mass_collection_util.sph_nfw_truncated_convergence_jit,
+            grid=grid,
+            parameters=self.parameters,
+            deflections=False,
+            cut=False,
+        )
+
+    @grid_decorators.grid_2d_to_structure
+    def potential_2d_from_grid(self, grid):
+        return np.zeros(shape=grid.shape[0])
+
+    @grid_decorators.grid_2d_to_structure
+    def deflections_2d_from_grid(self, grid):
+        """
+        Calculate the summed deflection angles of every halo at a given set of arc-second gridded coordinates.
+
+        Parameters
+        ----------
+        grid : aa.Grid2D
+            The grid of (y,x) arc-second coordinates the deflection angles are computed on.
+        """
+        return self.values_from_grid(
+            func=mass_collection_util.sph_nfw_truncated_deflection_jit,
+            grid=grid,
+            parameters=self.parameters,
+            deflections=True,
+        )
+
 class EllNFW(EllNFWGeneralized):
     def __init__(
         self,
@@ -1005,8 +1736,7 @@ class EllNFW(EllNFWGeneralized):
             return 1
 
     @grid_decorators.grid_2d_to_structure
-    @grid_decorators.transform
-    @grid_decorators.relocate_to_radial_minimum
+    @geometry_profiles.transform_and_relocate_to_radial_minimum
     def potential_2d_from_grid(self, grid):
         """
         Calculate the potential at a given set of arc-second gridded coordinates.
@@ -1017,20 +1747,17 @@ class EllNFW(EllNFWGeneralized):
             The grid of (y,x) arc-second coordinates the deflection angles are computed on.
 
         """
-        potential_grid = quad_grid(
-            self.potential_func,
-            0.0,
-            1.0,
-            grid,
+        potential_grid = self.quad_grid_from(
+            func=self.potential_func,
+            grid=grid,
             args=(self.axis_ratio, self.kappa_s, self.scale_radius),
             epsrel=1.49e-5,
-        )[0]
+        )
 
         return potential_grid
 
     @grid_decorators.grid_2d_to_structure
-    @grid_decorators.transform
-    @grid_decorators.relocate_to_radial_minimum
+    @geometry_profiles.transform_and_relocate_to_radial_minimum
     def deflections_2d_from_grid_via_integrator(self, grid):
         """
         Calculate the deflection angles at a given set of arc-second gridded coordinates.
@@ -1046,13 +1773,11 @@ class EllNFW(EllNFWGeneralized):
             deflection_grid = self.axis_ratio * grid[:, index]
             deflection_grid *= (
                 self.kappa_s
-                * quad_grid(
-                    self.deflection_func,
-                    0.0,
-                    1.0,
-                    grid,
+                * self.quad_grid_from(
+                    func=self.deflection_func,
+                    grid=grid,
                     args=(npow, self.axis_ratio, self.scale_radius),
-                )[0]
+                )
             )
 
             return deflection_grid
@@ -1150,8 +1875,7 @@ class SphNFW(EllNFW):
         )
 
     @grid_decorators.grid_2d_to_structure
-    @grid_decorators.transform
-    @grid_decorators.relocate_to_radial_minimum
+    @geometry_profiles.transform_and_relocate_to_radial_minimum
     def potential_2d_from_grid(self, grid):
         """
         Calculate the potential at a given set of arc-second gridded coordinates.
@@ -1176,8 +1900,7 @@ class SphNFW(EllNFW):
         return ((np.log(eta / 2.0)) ** 2) - (np.arctanh(np.sqrt(1 - eta ** 2))) ** 2
 
     @grid_decorators.grid_2d_to_structure
-    @grid_decorators.transform
-    @grid_decorators.relocate_to_radial_minimum
+    @geometry_profiles.transform_and_relocate_to_radial_minimum
     def deflections_2d_from_grid(self, grid, **kwargs):
         """
         Calculate the deflection angles at a given set of arc-second gridded coordinates.
@@ -1316,9 +2039,9 @@ def kappa_s_and_scale_radius_for_duffy(mass_at_200, redshift_object, redshift_so
 
     cosmology = cosmo.Planck15
 
-    cosmic_average_density = (
-        cosmology.critical_density(redshift_object).to(units.solMass / units.kpc ** 3)
-    ).value
+    cosmic_average_density = cosmology_util.cosmic_average_density_solar_mass_per_kpc3_from(
+        redshift=redshift_object, cosmology=cosmology
+    )
 
     critical_surface_density = cosmology_util.critical_surface_density_between_redshifts_solar_mass_per_kpc2_from(
         redshift_0=redshift_object, redshift_1=redshift_source, cosmology=cosmology
@@ -1368,9 +2091,9 @@ def kappa_s_and_scale_radius_for_ludlow(mass_at_200, redshift_object, redshift_s
         m_input, "200c", redshift_object, model="ludlow16"
     )
 
-    cosmic_average_density = (
-        cosmology.critical_density(redshift_object).to(units.solMass / units.kpc ** 3)
-    ).value
+    cosmic_average_density = cosmology_util.cosmic_average_density_solar_mass_per_kpc3_from(
+        redshift=redshift_object, cosmology=cosmology
+    )
 
     critical_surface_density = cosmology_util.critical_surface_density_between_redshifts_solar_mass_per_kpc2_from(
         redshift_0=redshift_object, redshift_1=redshift_source, cosmology=cosmology
@@ -1401,3 +2124,142 @@ def kappa_s_and_scale_radius_for_ludlow(mass_at_200, redshift_object, redshift_s
     scale_radius = scale_radius_kpc / kpc_per_arcsec  # scale radius in arcsec
 
     return kappa_s, scale_radius, radius_at_200
+
+
+def concentration_from(delta_concentration, iterations=50, tolerance=1.0e-12):
+    """
+    Solve for the concentrations of NFW halos given their characteristic overdensities `delta_concentration`
+    (see `AbstractEllNFWGeneralized.delta_concentration`), where the two are related by:
+
+    delta_c = (200 / 3) * c^3 / (ln(1 + c) - c / (1 + c))
+
+    The relation is solved for every halo simultaneously by Newton iteration on arrays in ln(c), in which it is close
+    to linear, such that an ndarray of any shape is solved in a handful of iterations. The denominator is computed via
+    its Taylor series for c < 1e-3, where evaluating it directly loses precision to cancellation.
+
+    Parameters
+    ----------
+    delta_concentration : float or np.ndarray
+        The characteristic overdensity of every halo relative to the cosmic average density.
+    iterations
+        The maximum number of Newton iterations performed.
+    tolerance
+        The iterations stop once the largest change in ln(c) of any halo is below this value.
+    """
+    log_delta_concentration = np.log(np.asarray(delta_concentration, dtype="float64"))
+
+    log_concentration = np.full(log_delta_concentration.shape, np.log(10.0))
+
+    for _ in range(iterations):
+
+        concentration = np.exp(log_concentration)
+
+        denominator = np.where(
+            concentration < 1.0e-3,
+            concentration ** 2
+            * (
+                0.5
+                - concentration * (2.0 / 3.0)
+                + 0.75 * concentration ** 2
+                - 0.8 * concentration ** 3
+            ),
+            np.log1p(concentration) - concentration / (1.0 + concentration),
+        )
+
+        residual = (
+            np.log(200.0 / 3.0)
+            + 3.0 * log_concentration
+            - np.log(denominator)
+            - log_delta_concentration
+        )
+
+        gradient = 3.0 - concentration ** 2 / (
+            (1.0 + concentration) ** 2 * denominator
+        )
+
+        step = residual / gradient
+
+        log_concentration = log_concentration - step
+
+        if np.max(np.abs(step), initial=0.0) < tolerance:
+            break
+
+    return np.exp(log_concentration)
+
+
+def concentration_radius_at_200_and_mass_at_200_from(
+    kappa_s,
+    scale_radius,
+    redshift_object,
+    redshift_source,
+    redshift_of_cosmic_average_density="profile",
+    cosmology=cosmo.Planck15,
+):
+    """
+    Compute the concentration, radius at 200 times the cosmic average density (in arc-seconds) and mass within that
+    radius (in solar masses) of many NFW halos in one call, which gives the same values as the `concentration`,
+    `radius_at_200` and `mass_at_200_solar_masses` methods of every halo's `AbstractEllNFWGeneralized` profile.
+
+    Every input may be a float or an ndarray, where the inputs are broadcast against one another, such that (for
+    example) a population of halos at different redshifts behind a single source is converted using arrays of
+    `kappa_s`, `scale_radius` and `redshift_object` and a float `redshift_source`.
+
+    Parameters
+    ----------
+    kappa_s : float or np.ndarray
+        The overall normalization of every halo's dark matter profile.
+    scale_radius : float or np.ndarray
+        The arc-second radius where the average density within this radius is 200 times the critical density.
+    redshift_object : float or np.ndarray
+        The redshift of every halo.
+    redshift_source : float or np.ndarray
+        The redshift of the source every halo's convergence is defined relative to.
+    redshift_of_cosmic_average_density
+        Whether the cosmic average density is evaluated at the redshift of every halo (`profile`) or at redshift zero
+        (`local`).
+    cosmology
+        The cosmology the distances and densities are computed in.
+    """
+    if redshift_of_cosmic_average_density == "profile":
+        redshift_calc = redshift_object
+    elif redshift_of_cosmic_average_density == "local":
+        redshift_calc = 0.0
+    else:
+        raise exc.UnitsException(
+            "The redshift of the cosmic average density haas been specified as an invalid "
+            "string. Must be {local, profile}"
+        )
+
+    kappa_s = np.asarray(kappa_s, dtype="float64")
+    scale_radius = np.asarray(scale_radius, dtype="float64")
+
+    cosmic_average_density = cosmology_util.cosmic_average_density_solar_mass_per_kpc3_from(
+        redshift=redshift_calc, cosmology=cosmology
+    )
+
+    critical_surface_density = cosmology_util.critical_surface_density_between_redshifts_solar_mass_per_kpc2_from(
+        redshift_0=redshift_object, redshift_1=redshift_source, cosmology=cosmology
+    )
+
+    kpc_per_arcsec = cosmology_util.kpc_per_arcsec_from(
+        redshift=redshift_object, cosmology=cosmology
+    )
+
+    rho_at_scale_radius = (
+        kappa_s * critical_surface_density / (scale_radius * kpc_per_arcsec)
+    )
+
+    concentration = concentration_from(
+        delta_concentration=rho_at_scale_radius / cosmic_average_density
+    )
+
+    radius_at_200 = concentration * scale_radius
+
+    mass_at_200 = (
+        200.0
+        * ((4.0 / 3.0) * np.pi)
+        * cosmic_average_density
+        * ((radius_at_200 * kpc_per_arcsec) ** 3.0)
+    )
+
+    return concentration, radius_at_200, mass_at_200
@@ -1,5 +1,6 @@
 import numpy as np
 from autoarray.structures.grids import grid_decorators
+from autogalaxy.profiles import geometry_profiles
 from autogalaxy.profiles import mass_profiles as mp
 from autogalaxy import convert
 
@@ -36,8 +37,7 @@ class MassSheet(mp.MassProfile):
         return np.zeros(shape=grid.shape[0])
 
     @grid_decorators.grid_2d_to_structure
-    @grid_decorators.transform
-    @grid_decorators.relocate_to_radial_minimum
+    @geometry_profiles.transform_and_relocate_to_radial_minimum
     def deflections_2d_from_grid(self, grid):
         grid_radii = self.grid_to_grid_radii(grid=grid)
         return self.grid_to_grid_cartesian(grid=grid, radius=self.kappa * grid_radii)
@@ -84,8 +84,7 @@ class ExternalShear(mp.MassProfile):
         return np.zeros(shape=grid.shape[0])
 
     @grid_decorators.grid_2d_to_structure
-    @grid_decorators.transform
-    @grid_decorators.relocate_to_radial_minimum
+    @geometry_profiles.transform_and_relocate_to_radial_minimum
     def deflections_2d_from_grid(self, grid):
         """
         Calculate the deflection angles at a given set of arc-second gridded coordinates.
@@ -1,9 +1,9 @@
 from autogalaxy.profiles.mass_profiles.mass_profiles import psi_from
 import numpy as np
 from autoarray.structures.grids import grid_decorators
+from autogalaxy.profiles import geometry_profiles
 from autogalaxy.profiles import mass_profiles as mp
 
-from pyquad import quad_grid
 from scipy.special import wofz
 from typing import Tuple
 import copy
@@ -83,8 +83,7 @@ class EllGaussian(mp.MassProfile, StellarProfile):
         return output_grid
 
     @grid_decorators.grid_2d_to_structure
-    @grid_decorators.transform
-    @grid_decorators.relocate_to_radial_minimum
+    @geometry_profiles.transform_and_relocate_to_radial_minimum
     def deflections_2d_from_grid(self, grid):
         """
         Calculate the deflection angles at a given set of arc-second gridded coordinates.
@@ -111,8 +110,7 @@ class EllGaussian(mp.MassProfile, StellarProfile):
         )
 
     @grid_decorators.grid_2d_to_structure
-    @grid_decorators.transform
-    @grid_decorators.relocate_to_radial_minimum
+    @geometry_profiles.transform_and_relocate_to_radial_minimum
     def deflections_2d_from_grid_via_integrator(self, grid):
         """
         Calculate the deflection angles at a given set of arc-second gridded coordinates.
@@ -131,13 +129,11 @@ class EllGaussian(mp.MassProfile, StellarProfile):
             deflection_grid *= (
                 self.intensity
                 * self.mass_to_light_ratio
-                * quad_grid(
-                    self.deflection_func,
-                    0.0,
-                    1.0,
-                    grid,
+                * self.quad_grid_from(
+                    func=self.deflection_func,
+                    grid=grid,
                     args=(npow, self.axis_ratio, self.sigma / np.sqrt(self.axis_ratio)),
-                )[0]
+                )
             )
 
             return deflection_grid
@@ -160,8 +156,7 @@ class EllGaussian(mp.MassProfile, StellarProfile):
         )
 
     @grid_decorators.grid_2d_to_structure
-    @grid_decorators.transform
-    @grid_decorators.relocate_to_radial_minimum
+    @geometry_profiles.transform_and_relocate_to_radial_minimum
     def convergence_2d_from_grid(self, grid):
         """Calculate the projected convergence at a given set of arc-second gridded coordinates.
 
@@ -248,8 +243,7 @@ class AbstractEllSersic(mp.MassProfile, MassProfileMGE, StellarProfile):
         self.sersic_index = sersic_index
 
     @grid_decorators.grid_2d_to_structure
-    @grid_decorators.transform
-    @grid_decorators.relocate_to_radial_minimum
+    @geometry_profiles.transform_and_relocate_to_radial_minimum
     def convergence_2d_from_grid(self, grid):
         """Calculate the projected convergence at a given set of arc-second gridded coordinates.
 
@@ -265,8 +259,7 @@ class AbstractEllSersic(mp.MassProfile, MassProfileMGE, StellarProfile):
         return self.mass_to_light_ratio * self.image_2d_from_grid_radii(grid_radius)
 
     @grid_decorators.grid_2d_to_structure
-    @grid_decorators.transform
-    @grid_decorators.relocate_to_radial_minimum
+    @geometry_profiles.transform_and_relocate_to_radial_minimum
     def convergence_2d_from_grid_via_gaussians(self, grid):
         """Calculate the projected convergence at a given set of arc-second gridded coordinates.
 
@@ -286,8 +279,7 @@ class AbstractEllSersic(mp.MassProfile, MassProfileMGE, StellarProfile):
         return np.zeros(shape=grid.shape[0])
 
     @grid_decorators.grid_2d_to_structure
-    @grid_decorators.transform
-    @grid_decorators.relocate_to_radial_minimum
+    @geometry_profiles.transform_and_relocate_to_radial_minimum
     def deflections_2d_from_grid(self, grid):
         return self._deflections_2d_from_grid_via_gaussians(
             grid=grid, sigmas_factor=np.sqrt(self.axis_ratio)
@@ -340,17 +332,17 @@ class AbstractEllSersic(mp.MassProfile, MassProfileMGE, StellarProfile):
         radii_max = self.effective_radius * 20.0
 
         def sersic_2d(r):
-            return (
-                self.mass_to_light_ratio
-                * self.intensity
-                * np.exp(
-                    -self.sersic_constant
-                    * (((r / self.effective_radius) ** (1.0 / self.sersic_index)) - 1.0)
-                )
+            return np.exp(
+                -self.sersic_constant
+                * (((r / self.effective_radius) ** (1.0 / self.sersic_index)) - 1.0)
             )
 
-        return self._decompose_convergence_into_gaussians(
-            func=sersic_2d, radii_min=radii_min, radii_max=radii_max
+        return self._decompose_convergence_into_gaussians_via_cache(
+            func=sersic_2d,
+            radii_min=radii_min,
+            radii_max=radii_max,
+            shape_key=(self.sersic_index, self.effective_radius),
+            normalization=self.mass_to_light_ratio * self.intensity,
         )
 
     def with_new_normalization(self, normalization):
@@ -362,8 +354,7 @@ class AbstractEllSersic(mp.MassProfile, MassProfileMGE, StellarProfile):
 
 class EllSersic(AbstractEllSersic, MassProfileMGE):
     @grid_decorators.grid_2d_to_structure
-    @grid_decorators.transform
-    @grid_decorators.relocate_to_radial_minimum
+    @geometry_profiles.transform_and_relocate_to_radial_minimum
     def deflections_2d_from_grid_via_integrator(self, grid):
         """
         Calculate the deflection angles at a given set of arc-second gridded coordinates.
@@ -382,11 +373,9 @@ class EllSersic(AbstractEllSersic, MassProfileMGE):
             deflection_grid *= (
                 self.intensity
                 * self.mass_to_light_ratio
-                * quad_grid(
-                    self.deflection_func,
-                    0.0,
-                    1.0,
-                    grid,
+                * self.quad_grid_from(
+                    func=self.deflection_func,
+                    grid=grid,
                     args=(
                         npow,
                         self.axis_ratio,
@@ -394,7 +383,7 @@ class EllSersic(AbstractEllSersic, MassProfileMGE):
                         self.effective_radius,
                         sersic_constant,
                     ),
-                )[0]
+                )
             )
 
             return deflection_grid
@@ -639,8 +628,7 @@ class EllSersicRadialGradient(AbstractEllSersic):
         self.mass_to_light_gradient = mass_to_light_gradient
 
     @grid_decorators.grid_2d_to_structure
-    @grid_decorators.transform
-    @grid_decorators.relocate_to_radial_minimum
+    @geometry_profiles.transform_and_relocate_to_radial_minimum
     def convergence_2d_from_grid(self, grid):
         """Calculate the projected convergence at a given set of arc-second gridded coordinates.
 
@@ -653,8 +641,7 @@ class EllSersicRadialGradient(AbstractEllSersic):
         return self.convergence_func(self.grid_to_eccentric_radii(grid))
 
     @grid_decorators.grid_2d_to_structure
-    @grid_decorators.transform
-    @grid_decorators.relocate_to_radial_minimum
+    @geometry_profiles.transform_and_relocate_to_radial_minimum
     def deflections_via_integrator_from_grid(self, grid):
         """
         Calculate the deflection angles at a given set of arc-second gridded coordinates.
@@ -673,11 +660,9 @@ class EllSersicRadialGradient(AbstractEllSersic):
             deflection_grid *= (
                 self.intensity
                 * self.mass_to_light_ratio
-                * quad_grid(
-                    self.deflection_func,
-                    0.0,
-                    1.0,
-                    grid,
+                * self.quad_grid_from(
+                    func=self.deflection_func,
+                    grid=grid,
                     args=(
                         npow,
                         self.axis_ratio,
@@ -686,7 +671,7 @@ class EllSersicRadialGradient(AbstractEllSersic):
                         self.mass_to_light_gradient,
                         sersic_constant,
                     ),
-                )[0]
+                )
             )
             return deflection_grid
 
@@ -738,20 +723,24 @@ class EllSersicRadialGradient(AbstractEllSersic):
 
         def sersic_radial_gradient_2D(r):
             return (
-                self.mass_to_light_ratio
-                * self.intensity
-                * (
-                    ((self.axis_ratio * r) / self.effective_radius)
-                    ** -self.mass_to_light_gradient
-                )
-                * np.exp(
-                    -self.sersic_constant
-                    * (((r / self.effective_radius) ** (1.0 / self.sersic_index)) - 1.0)
-                )
+                ((self.axis_ratio * r) / self.effective_radius)
+                ** -self.mass_to_light_gradient
+            ) * np.exp(
+                -self.sersic_constant
+                * (((r / self.effective_radius) ** (1.0 / self.sersic_index)) - 1.0)
             )
 
-        return self._decompose_convergence_into_gaussians(
-            func=sersic_radial_gradient_2D, radii_min=radii_min, radii_max=radii_max
+        return self._decompose_convergence_into_gaussians_via_cache(
+            func=sersic_radial_gradient_2D,
+            radii_min=radii_min,
+            radii_max=radii_max,
+            shape_key=(
+                self.sersic_index,
+                self.effective_radius,
+                self.axis_ratio,
+                self.mass_to_light_gradient,
+            ),
+            normalization=self.mass_to_light_ratio * self.intensity,
         )
 
 
@@ -909,23 +898,29 @@ class EllSersicCore(EllSersic):
         radii_max = self.effective_radius * 20.0
 
         def core_sersic_2D(r):
-            return (
-                self.mass_to_light_ratio
-                * self.intensity_prime
-                * (1.0 + (self.radius_break / r) ** self.alpha)
-                ** (self.gamma / self.alpha)
-                * np.exp(
-                    -self.sersic_constant
-                    * (
-                        (r ** self.alpha + self.radius_break ** self.alpha)
-                        / self.effective_radius ** self.alpha
-                    )
-                    ** (1.0 / (self.sersic_index * self.alpha))
+            return (1.0 + (self.radius_break / r) ** self.alpha) ** (
+                self.gamma / self.alpha
+            ) * np.exp(
+                -self.sersic_constant
+                * (
+                    (r ** self.alpha + self.radius_break ** self.alpha)
+                    / self.effective_radius ** self.alpha
                 )
+                ** (1.0 / (self.sersic_index * self.alpha))
             )
 
-        return self._decompose_convergence_into_gaussians(
-            func=core_sersic_2D, radii_min=radii_min, radii_max=radii_max
+        return self._decompose_convergence_into_gaussians_via_cache(
+            func=core_sersic_2D,
+            radii_min=radii_min,
+            radii_max=radii_max,
+            shape_key=(
+                self.effective_radius,
+                self.sersic_index,
+                self.radius_break,
+                self.gamma,
+                self.alpha,
+            ),
+            normalization=self.mass_to_light_ratio * self.intensity_prime,
         )
 
 
@@ -1022,8 +1017,7 @@ class EllChameleon(mp.MassProfile, StellarProfile):
             self.axis_ratio = 0.99999
 
     @grid_decorators.grid_2d_to_structure
-    @grid_decorators.transform
-    @grid_decorators.relocate_to_radial_minimum
+    @geometry_profiles.transform_and_relocate_to_radial_minimum
     def deflections_2d_from_grid(self, grid):
         """
         Calculate the deflection angles at a given set of arc-second gridded coordinates.
@@ -1095,8 +1089,7 @@ class EllChameleon(mp.MassProfile, StellarProfile):
         )
 
     @grid_decorators.grid_2d_to_structure
-    @grid_decorators.transform
-    @grid_decorators.relocate_to_radial_minimum
+    @geometry_profiles.transform_and_relocate_to_radial_minimum
     def convergence_2d_from_grid(self, grid):
         """Calculate the projected convergence at a given set of arc-second gridded coordinates.
         Parameters
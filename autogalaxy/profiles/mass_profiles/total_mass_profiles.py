@@ -1,12 +1,16 @@
 import numpy as np
+from autoconf import conf
 from autoarray.structures.grids import grid_decorators
+from autogalaxy import exc
+from autogalaxy.profiles import geometry_profiles
 from autoarray.structures.vector_fields import vector_field_irregular
 from autogalaxy.profiles import mass_profiles as mp
+from autogalaxy.profiles.mass_profiles.mass_profiles import MassProfileCollection
 from autogalaxy.profiles.mass_profiles.mass_profiles import psi_from
+from autogalaxy.util import mass_collection_util
 
-from pyquad import quad_grid
 from scipy import special
-from typing import Tuple
+from typing import Optional, Tuple
 import copy
 
 
@@ -43,8 +47,7 @@ class PointMass(mp.MassProfile):
         return np.zeros(shape=grid.shape[0])
 
     @grid_decorators.grid_2d_to_structure
-    @grid_decorators.transform
-    @grid_decorators.relocate_to_radial_minimum
+    @geometry_profiles.transform_and_relocate_to_radial_minimum
     def deflections_2d_from_grid(self, grid):
         grid_radii = self.grid_to_grid_radii(grid=grid)
         return self.grid_to_grid_cartesian(
@@ -62,6 +65,145 @@ class PointMass(mp.MassProfile):
         return mass_profile
 
 
+class PointMassCollection(MassProfileCollection):
+    def __init__(
+        self,
+        centres=((0.0, 0.0),),
+        einstein_radius=(1.0,),
+        tolerance: Optional[float] = None,
+        opening_angle: Optional[float] = None,
+    ):
+        """
+        A collection of point-masses (see `PointMass`) whose centres and Einstein radii are stored in contiguous
+        arrays, such that their summed deflection angles are computed in a single compiled loop, skipping point-masses
+        whose deflection angle at a coordinate is below `tolerance` (see `MassProfileCollection`).
+
+        If `opening_angle` is above zero the deflection angles are instead computed using a Barnes-Hut tree of the
+        point-masses (see `mass_collection_util.BarnesHutTree`), which scales to collections of 10^5 or more
+        point-masses, for example the stars of a microlensing model. The error of the tree relative to direct
+        summation is set by the opening angle (see `mass_collection_util.deflections_2d_via_barnes_hut_from`).
+
+        Parameters
+        ----------
+        centres
+            The (y,x) arc-second coordinates of every point-mass, of shape [total_point_masses, 2].
+        einstein_radius
+            The arc-second Einstein radius of every point-mass.
+        tolerance
+            The arc-second deflection angle below which a point-mass is skipped, where `None` uses the general config.
+        opening_angle
+            The opening angle of the Barnes-Hut tree, which must be below 1.0, where zero uses direct summation and
+            `None` uses the general config.
+        """
+        super().__init__(centres=centres, tolerance=tolerance)
+
+        self.parameters = self.parameters_from(einstein_radius)
+
+        self.einstein_radius = self.parameters[:, 0]
+
+        if opening_angle is None:
+            opening_angle = conf.instance["general"]["mass_profile_collection"][
+                "opening_angle"
+            ]
+
+        if not 0.0 <= opening_angle < 1.0:
+            raise exc.ProfileException(
+                f"The opening angle of a PointMassCollection must be between 0.0 and 1.0, but is {opening_angle}."
+            )
+
+        self.opening_angle = opening_angle
+
+        self._barnes_hut_tree = None
+
+    @classmethod
+    def from_profiles(
+        cls,
+        profiles,
+        tolerance: Optional[float] = None,
+        opening_angle: Optional[float] = None,
+    ):
+        """
+        Create a collection from a list of `PointMass` profiles.
+        """
+        return cls(
+            centres=[profile.centre for profile in profiles],
+            einstein_radius=[profile.einstein_radius for profile in profiles],
+            tolerance=tolerance,
+            opening_angle=opening_angle,
+        )
+
+    @property
+    def cut_radii(self) -> np.ndarray:
+        """
+        The deflection angle of a point-mass at radius r is einstein_radius^2 / r, such that it is below the tolerance
+        beyond the radius einstein_radius^2 / tolerance.
+        """
+        return self.einstein_radius ** 2 / self.tolerance
+
+    @property
+    def barnes_hut_tree(self) -> mass_collection_util.BarnesHutTree:
+        """
+        The Barnes-Hut tree of the point-masses, whose masses are the squares of their Einstein radii, which is
+        created the first time it is used.
+        """
+        if self._barnes_hut_tree is None:
+            self._barnes_hut_tree = mass_collection_util.BarnesHutTree(
+                centres=self.centres,
+                masses=self.einstein_radius ** 2,
+                expansion_order=int(
+                    conf.instance["general"]["mass_profile_collection"][
+                        "expansion_order"
+                    ]
+                ),
+            )
+
+        return self._barnes_hut_tree
+
+    @grid_decorators.grid_2d_to_structure
+    def convergence_2d_from_grid(self, grid):
+        return np.zeros(shape=grid.shape[0])
+
+    @grid_decorators.grid_2d_to_structure
+    def potential_2d_from_grid(self, grid):
+        return np.zeros(shape=grid.shape[0])
+
+    @grid_decorators.grid_2d_to_structure
+    def deflections_2d_from_grid(self, grid):
+        """
+        Calculate the summed deflection angles of every point-mass at a given set of arc-second gridded coordinates,
+        using the Barnes-Hut tree if the opening angle is above zero.
+
+        Parameters
+        ----------
+        grid : aa.Grid2D
+            The grid of (y,x) arc-second coordinates the deflection angles are computed on.
+        """
+        if self.opening_angle > 0.0:
+            return mass_collection_util.deflections_2d_via_barnes_hut_from(
+                grid=grid,
+                tree=self.barnes_hut_tree,
+                opening_angle=self.opening_angle,
+                grid_radial_minimum=conf.instance["grids"]["radial_minimum"][
+                    "radial_minimum"
+                ][self.__class__.__name__],
+            )
+
+        return self.values_from_grid(
+            func=mass_collection_util.point_mass_deflection_jit,
+            grid=grid,
+            parameters=self.parameters,
+            deflections=True,
+        )
+
+    @property
+    def is_point_mass(self):
+        """
+        A collection is not a single point-mass at its `centre` (which is a placeholder) with a scalar Einstein
+        radius, so it is not treated as one.
+        """
+        return False
+
+
 class EllPowerLawBroken(mp.MassProfile):
     def __init__(
         self,
@@ -104,8 +246,7 @@ class EllPowerLawBroken(mp.MassProfile):
             self.kB = (2 - self.inner_slope) / (2 * self.nu ** 2)
 
     @grid_decorators.grid_2d_to_structure
-    @grid_decorators.transform
-    @grid_decorators.relocate_to_radial_minimum
+    @geometry_profiles.transform_and_relocate_to_radial_minimum
     def convergence_2d_from_grid(self, grid):
         """
         Returns the dimensionless density kappa=Sigma/Sigma_c (eq. 1)
@@ -129,8 +270,7 @@ class EllPowerLawBroken(mp.MassProfile):
         return np.zeros(shape=grid.shape[0])
 
     @grid_decorators.grid_2d_to_structure
-    @grid_decorators.transform
-    @grid_decorators.relocate_to_radial_minimum
+    @geometry_profiles.transform_and_relocate_to_radial_minimum
     def deflections_2d_from_grid(self, grid, max_terms=20):
         """
         Returns the complex deflection angle from eq. 18 and 19
@@ -287,8 +427,7 @@ class EllPowerLawCored(mp.MassProfile):
         )
 
     @grid_decorators.grid_2d_to_structure
-    @grid_decorators.transform
-    @grid_decorators.relocate_to_radial_minimum
+    @geometry_profiles.transform_and_relocate_to_radial_minimum
     def convergence_2d_from_grid(self, grid):
         """ Calculate the projected convergence on a grid of (y,x) arc-second coordinates.
 
@@ -312,8 +451,7 @@ class EllPowerLawCored(mp.MassProfile):
         return covnergence_grid
 
     @grid_decorators.grid_2d_to_structure
-    @grid_decorators.transform
-    @grid_decorators.relocate_to_radial_minimum
+    @geometry_profiles.transform_and_relocate_to_radial_minimum
     def potential_2d_from_grid(self, grid):
         """
         Calculate the potential on a grid of (y,x) arc-second coordinates.
@@ -325,19 +463,16 @@ class EllPowerLawCored(mp.MassProfile):
 
         """
 
-        potential_grid = quad_grid(
-            self.potential_func,
-            0.0,
-            1.0,
-            grid,
+        potential_grid = self.quad_grid_from(
+            func=self.potential_func,
+            grid=grid,
             args=(self.axis_ratio, self.slope, self.core_radius),
-        )[0]
+        )
 
         return self.einstein_radius_rescaled * self.axis_ratio * potential_grid
 
     @grid_decorators.grid_2d_to_structure
-    @grid_decorators.transform
-    @grid_decorators.relocate_to_radial_minimum
+    @geometry_profiles.transform_and_relocate_to_radial_minimum
     def deflections_2d_from_grid(self, grid):
         """
         Calculate the deflection angles on a grid of (y,x) arc-second coordinates.
@@ -355,13 +490,11 @@ class EllPowerLawCored(mp.MassProfile):
             deflection_grid = self.axis_ratio * grid[:, index]
             deflection_grid *= (
                 einstein_radius_rescaled
-                * quad_grid(
-                    self.deflection_func,
-                    0.0,
-                    1.0,
-                    grid,
+                * self.quad_grid_from(
+                    func=self.deflection_func,
+                    grid=grid,
                     args=(npow, self.axis_ratio, self.slope, self.core_radius),
-                )[0]
+                )
             )
 
             return deflection_grid
@@ -444,8 +577,7 @@ class SphPowerLawCored(EllPowerLawCored):
         )
 
     @grid_decorators.grid_2d_to_structure
-    @grid_decorators.transform
-    @grid_decorators.relocate_to_radial_minimum
+    @geometry_profiles.transform_and_relocate_to_radial_minimum
     def deflections_2d_from_grid(self, grid):
         """
         Calculate the deflection angles on a grid of (y,x) arc-second coordinates.
@@ -506,8 +638,7 @@ class EllPowerLaw(EllPowerLawCored):
         )
 
     @grid_decorators.grid_2d_to_structure
-    @grid_decorators.transform
-    @grid_decorators.relocate_to_radial_minimum
+    @geometry_profiles.transform_and_relocate_to_radial_minimum
     def deflections_2d_from_grid(self, grid):
         """
         Calculate the deflection angles on a grid of (y,x) arc-second coordinates.
@@ -607,8 +738,7 @@ class SphPowerLaw(EllPowerLaw):
         )
 
     @grid_decorators.grid_2d_to_structure
-    @grid_decorators.transform
-    @grid_decorators.relocate_to_radial_minimum
+    @geometry_profiles.transform_and_relocate_to_radial_minimum
     def deflections_2d_from_grid(self, grid):
 
         eta = self.grid_to_grid_radii(grid)
@@ -717,8 +847,7 @@ class EllIsothermal(EllPowerLaw):
             self.axis_ratio = 0.99999
 
     @grid_decorators.grid_2d_to_structure
-    @grid_decorators.transform
-    @grid_decorators.relocate_to_radial_minimum
+    @geometry_profiles.transform_and_relocate_to_radial_minimum
     def deflections_2d_from_grid(self, grid):
         """
         Calculate the deflection angles on a grid of (y,x) arc-second coordinates.
@@ -752,8 +881,7 @@ class EllIsothermal(EllPowerLaw):
         )
 
     @grid_decorators.grid_2d_to_structure
-    @grid_decorators.transform
-    @grid_decorators.relocate_to_radial_minimum
+    @geometry_profiles.transform_and_relocate_to_radial_minimum
     def shear_2d_from_grid(self, grid):
         """
         Calculate the (gamma_y, gamma_x) shear vector field on a grid of (y,x) arc-second coordinates.
@@ -804,8 +932,7 @@ class SphIsothermal(EllIsothermal):
         )
 
     @grid_decorators.grid_2d_to_structure
-    @grid_decorators.transform
-    @grid_decorators.relocate_to_radial_minimum
+    @geometry_profiles.transform_and_relocate_to_radial_minimum
     def potential_2d_from_grid(self, grid):
         """
         Calculate the potential on a grid of (y,x) arc-second coordinates.
@@ -819,8 +946,7 @@ class SphIsothermal(EllIsothermal):
         return 2.0 * self.einstein_radius_rescaled * eta
 
     @grid_decorators.grid_2d_to_structure
-    @grid_decorators.transform
-    @grid_decorators.relocate_to_radial_minimum
+    @geometry_profiles.transform_and_relocate_to_radial_minimum
     def deflections_2d_from_grid(self, grid):
         """
         Calculate the deflection angles on a grid of (y,x) arc-second coordinates.
@@ -13,4 +13,7 @@ from autoarray.inversion import regularization_util as regularization
 from autoarray.inversion import inversion_util as inversion
 from autoarray.operators import transformer_util as transformer
 from autogalaxy.analysis import model_util as model
+from autogalaxy.util import convolver_util as convolver
 from autogalaxy.util import cosmology_util as cosmology
+from autogalaxy.util import mass_collection_util as mass_collection
+from autogalaxy.util import oversampling_util as oversampling
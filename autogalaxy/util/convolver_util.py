@@ -0,0 +1,82 @@
+import numpy as np
+from autoarray import decorator_util
+
+
+def convolved_images_from(images, blurring_images, convolver):
+    """
+    Convolve a stack of images with a `Convolver` in a single pass, as opposed to calling `convolve_image` once for
+    every image.
+
+    Every row of `images` and `blurring_images` is one image in its binned 1D representation (e.g. a sub-size 1 array
+    of shape [total_unmasked_pixels]), such that the inputs have shape [total_images, total_unmasked_pixels] and
+    [total_images, total_blurring_pixels]. Every returned row is identical to the result of `convolve_image` on the
+    corresponding image and blurring image.
+
+    Parameters
+    ----------
+    images : np.ndarray
+        The stack of 1D images which are to be blurred with the convolver's PSF.
+    blurring_images : np.ndarray
+        The stack of 1D blurring images which blur into each image after PSF convolution.
+    convolver : aa.Convolver
+        The convolver whose precomputed PSF frames are used to perform the convolution.
+    """
+    return convolve_images_jit(
+        images=np.asarray(images, dtype="float64"),
+        image_frame_1d_indexes=convolver.image_frame_1d_indexes,
+        image_frame_1d_kernels=convolver.image_frame_1d_kernels,
+        image_frame_1d_lengths=convolver.image_frame_1d_lengths,
+        blurring_images=np.asarray(blurring_images, dtype="float64"),
+        blurring_frame_1d_indexes=convolver.blurring_frame_1d_indexes,
+        blurring_frame_1d_kernels=convolver.blurring_frame_1d_kernels,
+        blurring_frame_1d_lengths=convolver.blurring_frame_1d_lengths,
+    )
+
+
+@decorator_util.jit()
+def convolve_images_jit(
+    images,
+    image_frame_1d_indexes,
+    image_frame_1d_kernels,
+    image_frame_1d_lengths,
+    blurring_images,
+    blurring_frame_1d_indexes,
+    blurring_frame_1d_kernels,
+    blurring_frame_1d_lengths,
+):
+
+    blurred_images = np.zeros(images.shape)
+
+    for image_1d_index in range(images.shape[1]):
+
+        frame_1d_indexes = image_frame_1d_indexes[image_1d_index]
+        frame_1d_kernel = image_frame_1d_kernels[image_1d_index]
+        frame_1d_length = image_frame_1d_lengths[image_1d_index]
+
+        for kernel_1d_index in range(frame_1d_length):
+
+            vector_index = frame_1d_indexes[kernel_1d_index]
+            kernel_value = frame_1d_kernel[kernel_1d_index]
+
+            for image_index in range(images.shape[0]):
+                blurred_images[image_index, vector_index] += (
+                    images[image_index, image_1d_index] * kernel_value
+                )
+
+    for blurring_1d_index in range(blurring_images.shape[1]):
+
+        frame_1d_indexes = blurring_frame_1d_indexes[blurring_1d_index]
+        frame_1d_kernel = blurring_frame_1d_kernels[blurring_1d_index]
+        frame_1d_length = blurring_frame_1d_lengths[blurring_1d_index]
+
+        for kernel_1d_index in range(frame_1d_length):
+
+            vector_index = frame_1d_indexes[kernel_1d_index]
+            kernel_value = frame_1d_kernel[kernel_1d_index]
+
+            for image_index in range(blurring_images.shape[0]):
+                blurred_images[image_index, vector_index] += (
+                    blurring_images[image_index, blurring_1d_index] * kernel_value
+                )
+
+    return blurred_images
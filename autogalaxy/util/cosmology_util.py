@@ -1,43 +1,398 @@
 import math
+import weakref
+from collections import OrderedDict
 
 import numpy as np
-from astropy import constants
+from astropy import constants, units
+from astropy.cosmology import FLRW
+from autoconf import conf
+from scipy.interpolate import CubicSpline
+
+"""
+The constant c^2 / (4 pi G) of the critical surface density in units of solar masses per kpc, the speed of light in
+kpc per second and the unit conversions used by the `CosmologyDistances` engine, which are computed once when the
+module is imported as opposed to on every call.
+"""
+critical_surface_density_constant = (
+    constants.c.to("kpc / s") ** 2.0
+    / (4 * math.pi * constants.G.to("kpc3 / (solMass s2)"))
+).value
+
+speed_of_light_kpc_per_s = constants.c.to("kpc / s").value
+
+km_per_kpc = units.kpc.to(units.km)
+
+arcsec_per_radian = units.radian.to(units.arcsec)
+
+
+class CosmologyDistances:
+    def __init__(
+        self, cosmology, redshift_max: float = 20.0, total_redshifts: int = 20001
+    ):
+        """
+        Computes the angular diameter distances and critical densities of a cosmology, which every function in this
+        module uses instead of calling the astropy cosmology (and its unit conversions) directly.
+
+        The comoving distance is tabulated once by integrating a cubic spline of the cosmology's inverse Hubble
+        function 1 / E(z) over a dense grid of redshifts, from which D_A(z) and D_A(z1, z2) at any redshift are
+        interpolated (including for curved cosmologies), to a fractional accuracy of ~1e-13. Redshifts above
+        `redshift_max` are computed by astropy.
+
+        Every value computed for a scalar redshift or pair of redshifts is also memoized, such that repeated calls
+        (e.g. the same lens and source redshifts in every likelihood evaluation) return the stored value. The number
+        of memoized values is set by the `distance_memo_size` entry of the [cosmology] section of the general.ini
+        config.
+
+        Parameters
+        ----------
+        cosmology : astropy.cosmology.FLRW
+            The cosmology the distances are computed in.
+        redshift_max
+            The maximum redshift of the grid the comoving distance is tabulated on.
+        total_redshifts
+            The number of redshifts in the grid the comoving distance is tabulated on.
+        """
+        self.cosmology = cosmology
+
+        self.redshift_max = redshift_max
+        self.total_redshifts = total_redshifts
+
+        self.hubble_distance_kpc = cosmology.hubble_distance.to("kpc").value
+        self.curvature = cosmology.Ok0
+
+        self.critical_density_0 = cosmology.critical_density0.to(
+            "solMass / kpc^3"
+        ).value
+
+        self._comoving_distance_spline = None
+        self.memo = OrderedDict()
+
+    @property
+    def comoving_distance_spline(self):
+        """
+        The integral of the inverse Hubble function 1 / E(z) from redshift 0, as the antiderivative of its cubic
+        spline on the grid of redshifts, which is computed the first time it is used.
+        """
+        if self._comoving_distance_spline is None:
+
+            redshifts = np.linspace(0.0, self.redshift_max, self.total_redshifts)
+
+            self._comoving_distance_spline = CubicSpline(
+                redshifts, self.cosmology.inv_efunc(redshifts)
+            ).antiderivative()
+
+        return self._comoving_distance_spline
+
+    def value_via_memo_from(self, key, func):
+        """
+        Returns a value stored in the memo under a key (e.g. the name of the quantity and its redshifts), computing
+        it using the input function and storing it if it is not in the memo.
+        """
+        if key in self.memo:
+
+            self.memo.move_to_end(key)
+            return self.memo[key]
+
+        value = func()
+
+        self.memo[key] = value
+
+        distance_memo_size = conf.instance["general"]["cosmology"]["distance_memo_size"]
+
+        while len(self.memo) > distance_memo_size:
+            self.memo.popitem(last=False)
+
+        return value
+
+    def transverse_comoving_distance_kpc_from(self, redshift):
+        """
+        The transverse comoving distance in kpc to redshifts on the grid, interpolated from the tabulated
+        comoving distance and corrected for the curvature of the cosmology.
+        """
+        comoving_distance = self.hubble_distance_kpc * self.comoving_distance_spline(
+            redshift
+        )
 
+        if self.curvature > 0.0:
+            sqrt_curvature = np.sqrt(self.curvature)
+            return (
+                self.hubble_distance_kpc
+                / sqrt_curvature
+                * np.sinh(sqrt_curvature * comoving_distance / self.hubble_distance_kpc)
+            )
+        elif self.curvature < 0.0:
+            sqrt_curvature = np.sqrt(-self.curvature)
+            return (
+                self.hubble_distance_kpc
+                / sqrt_curvature
+                * np.sin(sqrt_curvature * comoving_distance / self.hubble_distance_kpc)
+            )
+
+        return comoving_distance
+
+    def is_on_grid(self, redshifts) -> bool:
+        return np.max(redshifts) <= self.redshift_max
+
+    def angular_diameter_distance_kpc_from(self, redshift):
+        """
+        The angular diameter distance in kpc from Earth to a redshift, or an ndarray of redshifts.
+        """
+        if np.ndim(redshift) == 0:
+            return self.value_via_memo_from(
+                key=("angular_diameter_distance", float(redshift)),
+                func=lambda: float(
+                    self._angular_diameter_distance_kpc_from(redshift=redshift)
+                ),
+            )
+
+        return self._angular_diameter_distance_kpc_from(redshift=redshift)
+
+    def _angular_diameter_distance_kpc_from(self, redshift):
+
+        redshift = np.asarray(redshift, dtype="float64")
+
+        if not self.is_on_grid(redshifts=redshift):
+            return self.cosmology.angular_diameter_distance(redshift).to("kpc").value
+
+        return self.transverse_comoving_distance_kpc_from(redshift=redshift) / (
+            1.0 + redshift
+        )
 
-def arcsec_per_kpc_from(*, redshift, cosmology):
-    return cosmology.arcsec_per_kpc_proper(z=redshift).value
+    def angular_diameter_distance_between_redshifts_kpc_from(
+        self, redshift_0, redshift_1
+    ):
+        """
+        The angular diameter distance in kpc between two redshifts, or two ndarrays of redshifts, where `redshift_1`
+        is greater than `redshift_0`.
+        """
+        if np.ndim(redshift_0) == 0 and np.ndim(redshift_1) == 0:
+            return self.value_via_memo_from(
+                key=(
+                    "angular_diameter_distance_between_redshifts",
+                    float(redshift_0),
+                    float(redshift_1),
+                ),
+                func=lambda: float(
+                    self._angular_diameter_distance_between_redshifts_kpc_from(
+                        redshift_0=redshift_0, redshift_1=redshift_1
+                    )
+                ),
+            )
+
+        return self._angular_diameter_distance_between_redshifts_kpc_from(
+            redshift_0=redshift_0, redshift_1=redshift_1
+        )
 
+    def _angular_diameter_distance_between_redshifts_kpc_from(
+        self, redshift_0, redshift_1
+    ):
+
+        redshift_0 = np.asarray(redshift_0, dtype="float64")
+        redshift_1 = np.asarray(redshift_1, dtype="float64")
+
+        if not self.is_on_grid(redshifts=redshift_1):
+            return (
+                self.cosmology.angular_diameter_distance_z1z2(redshift_0, redshift_1)
+                .to("kpc")
+                .value
+            )
+
+        distance_0 = self.transverse_comoving_distance_kpc_from(redshift=redshift_0)
+        distance_1 = self.transverse_comoving_distance_kpc_from(redshift=redshift_1)
+
+        if self.curvature == 0.0:
+            return (distance_1 - distance_0) / (1.0 + redshift_1)
+
+        return (
+            distance_1
+            * np.sqrt(
+                1.0 + self.curvature * distance_0 ** 2 / self.hubble_distance_kpc ** 2
+            )
+            - distance_0
+            * np.sqrt(
+                1.0 + self.curvature * distance_1 ** 2 / self.hubble_distance_kpc ** 2
+            )
+        ) / (1.0 + redshift_1)
+
+    def arcsec_per_kpc_from(self, redshift):
+        """
+        The angular size in arc-seconds of a proper kpc at a redshift, or an ndarray of redshifts.
+        """
+        return arcsec_per_radian / self.angular_diameter_distance_kpc_from(
+            redshift=redshift
+        )
 
-def kpc_per_arcsec_from(*, redshift, cosmology):
-    return 1.0 / cosmology.arcsec_per_kpc_proper(z=redshift).value
+    def critical_density_solar_mass_per_kpc3_from(self, redshift):
+        """
+        The critical density of the Universe in solar masses per kpc^3 at a redshift, or an ndarray of redshifts.
+        """
+        if np.ndim(redshift) == 0:
+            return self.value_via_memo_from(
+                key=("critical_density", float(redshift)),
+                func=lambda: float(
+                    self.critical_density_0 * self.cosmology.efunc(redshift) ** 2
+                ),
+            )
+
+        return (
+            self.critical_density_0
+            * self.cosmology.efunc(np.asarray(redshift, dtype="float64")) ** 2
+        )
 
 
-def angular_diameter_distance_to_earth_in_kpc_from(*, redshift, cosmology):
+class CosmologyDistancesViaMethods:
+    def __init__(self, cosmology):
+        """
+        Computes the angular diameter distances and critical densities of a cosmology which is not an astropy `FLRW`
+        cosmology (e.g. the `MockCosmology` used in tests) on every call, using its astropy-like methods
+        (`arcsec_per_kpc_proper`, `angular_diameter_distance`, `angular_diameter_distance_z1z2` and
+        `critical_density`), as opposed to the tabulated distances of a `CosmologyDistances` engine.
+
+        Parameters
+        ----------
+        cosmology
+            The cosmology the distances are computed in.
+        """
+        self.cosmology = cosmology
+
+    def angular_diameter_distance_kpc_from(self, redshift):
+        return self.cosmology.angular_diameter_distance(z=redshift).to("kpc").value
+
+    def angular_diameter_distance_between_redshifts_kpc_from(
+        self, redshift_0, redshift_1
+    ):
+        return (
+            self.cosmology.angular_diameter_distance_z1z2(redshift_0, redshift_1)
+            .to("kpc")
+            .value
+        )
+
+    def arcsec_per_kpc_from(self, redshift):
+        return self.cosmology.arcsec_per_kpc_proper(z=redshift).value
+
+    def critical_density_solar_mass_per_kpc3_from(self, redshift):
+        return self.cosmology.critical_density(z=redshift).to("solMass / kpc^3").value
+
+
+_cosmology_distances = OrderedDict()
+_cosmology_distances_of_ids = OrderedDict()
+
+
+def cosmology_key_from(cosmology) -> tuple:
+    """
+    Returns a hashable key of the class and full-precision parameters of a cosmology, such that two cosmologies
+    share a key only if they have the same distances (the `repr` of a cosmology rounds its parameters, so is not used).
+
+    Parameters a cosmology class does not have (e.g. the dark energy equation of state parameters of a
+    `FlatLambdaCDM`) are stored as None.
+    """
+
+    def value_from(parameter):
+
+        if parameter is None:
+            return None
+
+        return tuple(np.atleast_1d(getattr(parameter, "value", parameter)).tolist())
+
+    return (cosmology.__class__,) + tuple(
+        value_from(getattr(cosmology, name, None))
+        for name in (
+            "H0",
+            "Om0",
+            "Ode0",
+            "Tcmb0",
+            "Neff",
+            "m_nu",
+            "Ob0",
+            "w0",
+            "wa",
+            "wz",
+            "wp",
+            "apivot",
+            "zp",
+        )
+    )
+
+
+def cosmology_distances_from(cosmology):
+    """
+    Returns the `CosmologyDistances` engine of a cosmology, which is created the first time it is requested and
+    reused for every equal cosmology afterwards.
+
+    Astropy cosmologies are not hashable, so engines are keyed by the class and parameters of their cosmology (see
+    `cosmology_key_from`). As computing this key is slow compared to a memoized distance, the engine of every
+    cosmology object is also stored by its `id`, alongside a weak reference to the object (so that the `id` cannot be
+    reused and the cosmology is not kept alive by the cache).
+
+    Both caches hold the most recently used cosmologies, the number of which is set by the `distances_cache_size`
+    entry of the [cosmology] section of the general.ini config.
+
+    A cosmology which is not an astropy `FLRW` cosmology (e.g. a `MockCosmology`) cannot be tabulated, so its
+    distances are computed on every call using its own methods (see `CosmologyDistancesViaMethods`).
+    """
+    if not isinstance(cosmology, FLRW):
+        return CosmologyDistancesViaMethods(cosmology=cosmology)
 
-    angular_diameter_distance_kpc = cosmology.angular_diameter_distance(z=redshift).to(
-        "kpc"
+    reference_and_distances = _cosmology_distances_of_ids.get(id(cosmology))
+
+    if (
+        reference_and_distances is not None
+        and reference_and_distances[0]() is cosmology
+    ):
+        _cosmology_distances_of_ids.move_to_end(id(cosmology))
+        return reference_and_distances[1]
+
+    key = cosmology_key_from(cosmology=cosmology)
+
+    if key in _cosmology_distances:
+        _cosmology_distances.move_to_end(key)
+    else:
+        _cosmology_distances[key] = CosmologyDistances(cosmology=cosmology)
+
+    distances = _cosmology_distances[key]
+
+    _cosmology_distances_of_ids[id(cosmology)] = (weakref.ref(cosmology), distances)
+    _cosmology_distances_of_ids.move_to_end(id(cosmology))
+
+    distances_cache_size = conf.instance["general"]["cosmology"]["distances_cache_size"]
+
+    for cache in (_cosmology_distances, _cosmology_distances_of_ids):
+        while len(cache) > distances_cache_size:
+            cache.popitem(last=False)
+
+    return distances
+
+
+def arcsec_per_kpc_from(*, redshift, cosmology):
+    return cosmology_distances_from(cosmology=cosmology).arcsec_per_kpc_from(
+        redshift=redshift
     )
 
-    return angular_diameter_distance_kpc.value
+
+def kpc_per_arcsec_from(*, redshift, cosmology):
+    return 1.0 / arcsec_per_kpc_from(redshift=redshift, cosmology=cosmology)
+
+
+def angular_diameter_distance_to_earth_in_kpc_from(*, redshift, cosmology):
+    return cosmology_distances_from(
+        cosmology=cosmology
+    ).angular_diameter_distance_kpc_from(redshift=redshift)
 
 
 def angular_diameter_distance_between_redshifts_in_kpc_from(
     *, redshift_0, redshift_1, cosmology
 ):
-
-    angular_diameter_distance_between_redshifts_kpc = cosmology.angular_diameter_distance_z1z2(
-        redshift_0, redshift_1
-    ).to(
-        "kpc"
+    return cosmology_distances_from(
+        cosmology=cosmology
+    ).angular_diameter_distance_between_redshifts_kpc_from(
+        redshift_0=redshift_0, redshift_1=redshift_1
     )
 
-    return angular_diameter_distance_between_redshifts_kpc.value
-
 
 def cosmic_average_density_from(*, redshift, cosmology):
 
-    cosmic_average_density_kpc = (
-        cosmology.critical_density(z=redshift).to("solMass / kpc^3").value
+    cosmic_average_density_kpc = cosmic_average_density_solar_mass_per_kpc3_from(
+        redshift=redshift, cosmology=cosmology
     )
 
     kpc_per_arcsec = kpc_per_arcsec_from(redshift=redshift, cosmology=cosmology)
@@ -46,12 +401,9 @@ def cosmic_average_density_from(*, redshift, cosmology):
 
 
 def cosmic_average_density_solar_mass_per_kpc3_from(*, redshift, cosmology):
-
-    cosmic_average_density_kpc = (
-        cosmology.critical_density(z=redshift).to("solMass / kpc^3").value
-    )
-
-    return cosmic_average_density_kpc
+    return cosmology_distances_from(
+        cosmology=cosmology
+    ).critical_density_solar_mass_per_kpc3_from(redshift=redshift)
 
 
 def critical_surface_density_between_redshifts_from(
@@ -71,10 +423,6 @@ def critical_surface_density_between_redshifts_solar_mass_per_kpc2_from(
     *, redshift_0, redshift_1, cosmology
 ):
 
-    const = constants.c.to("kpc / s") ** 2.0 / (
-        4 * math.pi * constants.G.to("kpc3 / (solMass s2)")
-    )
-
     angular_diameter_distance_of_redshift_0_to_earth_kpc = angular_diameter_distance_to_earth_in_kpc_from(
         redshift=redshift_0, cosmology=cosmology
     )
@@ -88,37 +436,33 @@ def critical_surface_density_between_redshifts_solar_mass_per_kpc2_from(
     )
 
     return (
-        const
+        critical_surface_density_constant
         * angular_diameter_distance_of_redshift_1_to_earth_kpc
         / (
             angular_diameter_distance_between_redshifts_kpc
             * angular_diameter_distance_of_redshift_0_to_earth_kpc
         )
-    ).value
+    )
 
 
 def scaling_factor_between_redshifts_from(
     *, redshift_0, redshift_1, redshift_final, cosmology
 ):
 
-    angular_diameter_distance_between_redshifts_0_and_1 = (
-        cosmology.angular_diameter_distance_z1z2(z1=redshift_0, z2=redshift_1)
-        .to("kpc")
-        .value
+    angular_diameter_distance_between_redshifts_0_and_1 = angular_diameter_distance_between_redshifts_in_kpc_from(
+        redshift_0=redshift_0, redshift_1=redshift_1, cosmology=cosmology
     )
 
-    angular_diameter_distance_to_redshift_final = (
-        cosmology.angular_diameter_distance(z=redshift_final).to("kpc").value
+    angular_diameter_distance_to_redshift_final = angular_diameter_distance_to_earth_in_kpc_from(
+        redshift=redshift_final, cosmology=cosmology
     )
 
-    angular_diameter_distance_of_redshift_1_to_earth = (
-        cosmology.angular_diameter_distance(z=redshift_1).to("kpc").value
+    angular_diameter_distance_of_redshift_1_to_earth = angular_diameter_distance_to_earth_in_kpc_from(
+        redshift=redshift_1, cosmology=cosmology
     )
 
-    angular_diameter_distance_between_redshift_1_and_final = (
-        cosmology.angular_diameter_distance_z1z2(z1=redshift_0, z2=redshift_final)
-        .to("kpc")
-        .value
+    angular_diameter_distance_between_redshift_1_and_final = angular_diameter_distance_between_redshifts_in_kpc_from(
+        redshift_0=redshift_0, redshift_1=redshift_final, cosmology=cosmology
     )
 
     return (
@@ -132,8 +476,6 @@ def scaling_factor_between_redshifts_from(
 
 def velocity_dispersion_from(*, redshift_0, redshift_1, einstein_radius, cosmology):
 
-    const = constants.c.to("kpc / s")
-
     angular_diameter_distance_to_redshift_0_kpc = angular_diameter_distance_to_earth_in_kpc_from(
         redshift=redshift_1, cosmology=cosmology
     )
@@ -150,7 +492,7 @@ def velocity_dispersion_from(*, redshift_0, redshift_1, einstein_radius, cosmolo
 
     einstein_radius_kpc = einstein_radius * kpc_per_arcsec
 
-    velocity_dispersion_kpc = const * np.sqrt(
+    velocity_dispersion_kpc = speed_of_light_kpc_per_s * np.sqrt(
         (einstein_radius_kpc * angular_diameter_distance_to_redshift_1_kpc)
         / (
             4
@@ -160,4 +502,4 @@ def velocity_dispersion_from(*, redshift_0, redshift_1, einstein_radius, cosmolo
         )
     )
 
-    return velocity_dispersion_kpc.to("km/s").value
+    return velocity_dispersion_kpc * km_per_kpc
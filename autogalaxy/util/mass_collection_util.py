@@ -0,0 +1,633 @@
+import numpy as np
+from numba import prange
+from autoarray import decorator_util
+
+
+class CellIndex:
+    def __init__(self, centres, cut_radii, profiles_per_cell: int = 4):
+        """
+        A spatial index of the centres of a collection of mass profiles, which bins the centres into a uniform grid of
+        square cells covering them, such that the profiles near a (y,x) coordinate are found without looping over
+        every profile.
+
+        Every profile has a cut radius beyond which its contribution is negligible (e.g. its deflection angle is below
+        a tolerance). Every cell stores the largest cut radius of its profiles, such that a cell whose nearest point
+        to a coordinate is further than this radius is skipped without checking the profiles inside it.
+
+        The cells are stored in the compressed layout used by `values_via_cell_index_jit`, where the indexes of the
+        profiles in cell `i` are `cell_profiles[cell_starts[i]:cell_starts[i+1]]` and cells are ordered along rows.
+
+        Parameters
+        ----------
+        centres : np.ndarray
+            The (y,x) arc-second coordinates of every profile centre, of shape [total_profiles, 2].
+        cut_radii : np.ndarray
+            The radius from the centre of every profile beyond which it is skipped, which may be `np.inf` for
+            profiles which are never skipped.
+        profiles_per_cell
+            The average number of profiles per cell that the number of cells is chosen to give.
+        """
+        centres = np.reshape(np.asarray(centres, dtype="float64"), (-1, 2))
+        cut_radii = np.asarray(cut_radii, dtype="float64")
+
+        total_profiles = centres.shape[0]
+
+        cells_per_side = max(1, int(np.sqrt(total_profiles / profiles_per_cell)))
+
+        if total_profiles > 0:
+            origin = np.min(centres, axis=0)
+            extent = float(np.max(np.max(centres, axis=0) - origin))
+        else:
+            origin = np.zeros(2)
+            extent = 0.0
+
+        cell_size = extent / cells_per_side if extent > 0.0 else 1.0
+
+        cell_coordinates = np.clip(
+            np.floor((centres - origin) / cell_size).astype("int"),
+            0,
+            cells_per_side - 1,
+        )
+
+        cell_ids = cell_coordinates[:, 0] * cells_per_side + cell_coordinates[:, 1]
+
+        total_cells = cells_per_side ** 2
+
+        self.cell_starts = np.zeros(total_cells + 1, dtype="int")
+        self.cell_starts[1:] = np.cumsum(np.bincount(cell_ids, minlength=total_cells))
+
+        self.cell_profiles = np.argsort(cell_ids, kind="stable")
+
+        self.cell_cut_radii = np.zeros(total_cells)
+        np.maximum.at(self.cell_cut_radii, cell_ids, cut_radii)
+
+        self.cell_geometry = np.array(
+            [
+                origin[0],
+                origin[1],
+                cell_size,
+                cells_per_side,
+                np.max(cut_radii, initial=0.0),
+            ]
+        )
+
+        self.centres = np.ascontiguousarray(centres)
+        self.cut_radii = np.ascontiguousarray(cut_radii)
+
+    @property
+    def cells_per_side(self) -> int:
+        return int(self.cell_geometry[3])
+
+
+class BarnesHutTree:
+    def __init__(
+        self,
+        centres,
+        masses,
+        expansion_order: int = 6,
+        leaf_size: int = 8,
+        total_levels: int = 16,
+    ):
+        """
+        A quadtree of the centres of a collection of point-masses, which computes their summed deflection angles using
+        the Barnes-Hut algorithm (see `deflections_2d_via_barnes_hut_from`) in O(log(total_point_masses)) operations
+        per coordinate, as opposed to the O(total_point_masses) operations of direct summation.
+
+        Writing coordinates as complex numbers z = x + iy, the deflection angle of point-masses of mass m_i (the
+        square of their Einstein radius) at positions z_i is the complex conjugate of S(z) = sum_i m_i / (z - z_i).
+        Every node of the tree stores the multipole expansion of S of its point-masses about their centre of mass
+        z_c, S(z) = sum_k a_k / (z - z_c)^(k+1) where a_k = sum_i m_i (z_i - z_c)^k, for k up to `expansion_order`.
+
+        The tree is built from the Morton codes of the centres, which are quantized to a uniform grid of
+        2^total_levels x 2^total_levels positions over their extent. The centres are sorted by their codes, such that
+        every node's point-masses are a contiguous range of the sorted centres, and the tree is built one level at a
+        time with vectorized searches of the sorted codes. Nodes with at most `leaf_size` point-masses, or at the
+        last level, are leaves.
+
+        Parameters
+        ----------
+        centres : np.ndarray
+            The (y,x) arc-second coordinates of every point-mass, of shape [total_point_masses, 2].
+        masses : np.ndarray
+            The mass of every point-mass, which is the square of its arc-second Einstein radius.
+        expansion_order
+            The highest order of the multipole expansion of every node.
+        leaf_size
+            The maximum number of point-masses in a node which is not split into child nodes.
+        total_levels
+            The maximum depth of the tree.
+        """
+        centres = np.reshape(np.asarray(centres, dtype="float64"), (-1, 2))
+        masses = np.asarray(masses, dtype="float64")
+
+        codes = morton_codes_from(centres=centres, total_levels=total_levels)
+
+        order = np.argsort(codes, kind="stable")
+
+        codes = codes[order]
+
+        self.point_positions = np.ascontiguousarray(
+            centres[order, 1] + 1j * centres[order, 0]
+        )
+        self.point_masses = np.ascontiguousarray(masses[order])
+
+        node_starts = [np.array([0])]
+        node_ends = [np.array([centres.shape[0]])]
+        node_prefixes = [np.array([0], dtype="uint64")]
+        node_children = []
+
+        total_nodes = 1
+
+        for level in range(total_levels + 1):
+
+            starts = node_starts[-1]
+            ends = node_ends[-1]
+            prefixes = node_prefixes[-1]
+
+            children = np.full((starts.shape[0], 4), -1, dtype="int")
+
+            node_children.append(children)
+
+            if level == total_levels:
+                break
+
+            split = np.where(ends - starts > leaf_size)[0]
+
+            if split.shape[0] == 0:
+                break
+
+            shift = np.uint64(2 * (total_levels - level - 1))
+
+            child_prefixes = (
+                prefixes[split, None] * np.uint64(4)
+                + np.arange(4, dtype="uint64")[None, :]
+            )
+
+            child_starts = np.searchsorted(codes, child_prefixes << shift)
+            child_ends = np.searchsorted(
+                codes, (child_prefixes + np.uint64(1)) << shift
+            )
+
+            non_empty = child_ends > child_starts
+
+            rows, columns = np.nonzero(non_empty)
+
+            children[split[rows], columns] = total_nodes + np.arange(rows.shape[0])
+
+            total_nodes += rows.shape[0]
+
+            node_starts.append(child_starts[non_empty])
+            node_ends.append(child_ends[non_empty])
+            node_prefixes.append(child_prefixes[non_empty])
+
+        self.node_starts = np.concatenate(node_starts)
+        self.node_ends = np.concatenate(node_ends)
+        self.node_children = np.ascontiguousarray(np.concatenate(node_children))
+        self.node_is_leaf = np.all(self.node_children == -1, axis=1)
+
+        self.total_levels = total_levels
+
+        (
+            self.node_centres,
+            self.node_radii,
+            self.node_multipoles,
+        ) = node_multipoles_from(
+            point_positions=self.point_positions,
+            point_masses=self.point_masses,
+            node_starts=self.node_starts,
+            node_ends=self.node_ends,
+            expansion_order=expansion_order,
+        )
+
+    @property
+    def total_nodes(self) -> int:
+        return self.node_starts.shape[0]
+
+
+def morton_codes_from(centres, total_levels: int = 16) -> np.ndarray:
+    """
+    Returns the Morton code of every (y,x) coordinate, which interleaves the bits of its y and x positions on a uniform
+    grid of 2^total_levels x 2^total_levels positions covering the square bounding the coordinates, such that
+    coordinates which are close have close codes and every quadtree node is a contiguous range of sorted codes.
+    """
+    centres = np.reshape(np.asarray(centres, dtype="float64"), (-1, 2))
+
+    codes = np.zeros(centres.shape[0], dtype="uint64")
+
+    if centres.shape[0] == 0:
+        return codes
+
+    origin = np.min(centres, axis=0)
+    extent = float(np.max(np.max(centres, axis=0) - origin))
+
+    scale = (2 ** total_levels - 1) / extent if extent > 0.0 else 0.0
+
+    positions = np.floor((centres - origin) * scale).astype("uint64")
+
+    for bit in range(total_levels):
+
+        bit = np.uint64(bit)
+
+        codes |= ((positions[:, 1] >> bit) & np.uint64(1)) << (np.uint64(2) * bit)
+        codes |= ((positions[:, 0] >> bit) & np.uint64(1)) << (
+            np.uint64(2) * bit + np.uint64(1)
+        )
+
+    return codes
+
+
+def node_multipoles_from(
+    point_positions, point_masses, node_starts, node_ends, expansion_order
+):
+    """
+    Returns the centre of mass, radius (the largest distance of its point-masses from the centre of mass) and
+    multipole coefficients a_k = sum_i m_i (z_i - z_c)^k of every node of a `BarnesHutTree`.
+    """
+    total_nodes = node_starts.shape[0]
+
+    node_centres = np.zeros(total_nodes, dtype="complex128")
+    node_radii = np.zeros(total_nodes)
+    node_multipoles = np.zeros((total_nodes, expansion_order + 1), dtype="complex128")
+
+    non_empty = np.where(node_ends > node_starts)[0]
+
+    if non_empty.shape[0] == 0:
+        return node_centres, node_radii, node_multipoles
+
+    counts = node_ends[non_empty] - node_starts[non_empty]
+    offsets = np.concatenate(([0], np.cumsum(counts)[:-1]))
+
+    points = np.repeat(node_starts[non_empty] - offsets, counts) + np.arange(
+        np.sum(counts)
+    )
+
+    masses = point_masses[points]
+    positions = point_positions[points]
+
+    total_masses = np.add.reduceat(masses, offsets)
+    means = np.add.reduceat(positions, offsets) / counts
+
+    centres = np.where(
+        total_masses > 0.0,
+        np.add.reduceat(masses * positions, offsets)
+        / np.where(total_masses > 0.0, total_masses, 1.0),
+        means,
+    )
+
+    node_centres[non_empty] = centres
+
+    offsets_from_centres = positions - np.repeat(centres, counts)
+
+    node_radii[non_empty] = np.maximum.reduceat(np.abs(offsets_from_centres), offsets)
+
+    powers = masses.astype("complex128")
+
+    for order in range(expansion_order + 1):
+
+        node_multipoles[non_empty, order] = np.add.reduceat(powers, offsets)
+
+        powers = powers * offsets_from_centres
+
+    return node_centres, node_radii, node_multipoles
+
+
+def deflections_2d_via_barnes_hut_from(grid, tree, opening_angle, grid_radial_minimum):
+    """
+    Returns the summed deflection angles of the point-masses of a `BarnesHutTree` at every (y,x) coordinate of a
+    grid using the Barnes-Hut algorithm.
+
+    The tree is traversed from its root for every coordinate. A node whose radius r is less than `opening_angle`
+    times its distance d from the coordinate is evaluated using its multipole expansion, leaves which are not are
+    summed directly and the children of other nodes are traversed. Coordinates within the radial minimum of a
+    point-mass are relocated to it, as for a single `PointMass`.
+
+    The error of a node's expansion truncated at order p is at most M / (d - r) * (r / d)^(p+1), where M is the
+    node's mass. The deflection angle at every coordinate therefore differs from direct summation by at most
+    (1 + theta) * theta^(p+1) / (1 - theta) times the sum of the magnitudes of the individual deflection angles of
+    every point-mass, where theta is the opening angle, such that an opening angle of zero gives direct summation.
+
+    Parameters
+    ----------
+    grid : np.ndarray
+        The (y,x) coordinates the deflection angles are computed at.
+    tree : BarnesHutTree
+        The quadtree of the point-masses.
+    opening_angle
+        The ratio of a node's radius to its distance below which its multipole expansion is used, which must be
+        below 1.0.
+    grid_radial_minimum
+        The radius coordinates closer to a point-mass are relocated to.
+    """
+    return deflections_2d_via_barnes_hut_jit(
+        grid=np.asarray(grid, dtype="float64"),
+        point_positions=tree.point_positions,
+        point_masses=tree.point_masses,
+        node_starts=tree.node_starts,
+        node_ends=tree.node_ends,
+        node_children=tree.node_children,
+        node_is_leaf=tree.node_is_leaf,
+        node_centres=tree.node_centres,
+        node_radii=tree.node_radii,
+        node_multipoles=tree.node_multipoles,
+        opening_angle=float(opening_angle),
+        grid_radial_minimum=float(grid_radial_minimum),
+        stack_size=4 * (tree.total_levels + 2),
+    )
+
+
+@decorator_util.jit()
+def deflections_2d_via_barnes_hut_jit(
+    grid,
+    point_positions,
+    point_masses,
+    node_starts,
+    node_ends,
+    node_children,
+    node_is_leaf,
+    node_centres,
+    node_radii,
+    node_multipoles,
+    opening_angle,
+    grid_radial_minimum,
+    stack_size,
+):
+
+    deflections = np.zeros((grid.shape[0], 2))
+
+    for index in prange(grid.shape[0]):
+
+        position = grid[index, 1] + 1j * grid[index, 0]
+
+        stack = np.zeros(stack_size, dtype=np.int64)
+        stack[0] = 0
+        stack_top = 1
+
+        total = 0.0 + 0.0j
+
+        while stack_top > 0:
+
+            stack_top -= 1
+            node = stack[stack_top]
+
+            separation = position - node_centres[node]
+
+            if node_radii[node] < opening_angle * abs(separation):
+
+                inverse_separation = 1.0 / separation
+                term = inverse_separation
+
+                for order in range(node_multipoles.shape[1]):
+                    total += node_multipoles[node, order] * term
+                    term *= inverse_separation
+
+            elif node_is_leaf[node]:
+
+                for point in range(node_starts[node], node_ends[node]):
+
+                    separation = position - point_positions[point]
+
+                    radius = abs(separation)
+
+                    if radius == 0.0:
+                        separation = grid_radial_minimum + 1j * grid_radial_minimum
+                    elif radius < grid_radial_minimum:
+                        separation *= grid_radial_minimum / radius
+
+                    total += point_masses[point] / separation
+
+            else:
+
+                for child in range(4):
+                    if node_children[node, child] != -1:
+                        stack[stack_top] = node_children[node, child]
+                        stack_top += 1
+
+        deflections[index, 0] = -total.imag
+        deflections[index, 1] = total.real
+
+    return deflections
+
+
+def values_via_cell_index_from(
+    func, grid, parameters, cell_index, grid_radial_minimum, deflections
+):
+    """
+    Returns the summed convergence or deflection angles of a collection of spherical mass profiles at every (y,x)
+    coordinate of a grid, evaluating the profiles near every coordinate in a single compiled loop.
+
+    The profiles near a coordinate are those inside the cut radius of the `CellIndex` of their centres, where the
+    contribution of profiles outside their cut radius is skipped. Coordinates within the radial minimum of a profile's
+    centre are relocated to it, as the `transform_and_relocate_to_radial_minimum` decorator does for a single profile.
+
+    Parameters
+    ----------
+    func : func
+        A function compiled with numba, `func(radius, parameters)`, returning the convergence or magnitude of the
+        deflection angle of one profile at a radius from its centre given the row of `parameters` of that profile.
+    grid : np.ndarray
+        The (y,x) coordinates the values are computed at.
+    parameters : np.ndarray
+        The parameters of every profile which are passed to `func`, of shape [total_profiles, total_parameters].
+    cell_index : CellIndex
+        The spatial index of the profile centres.
+    grid_radial_minimum
+        The radius coordinates closer to a profile's centre are relocated to.
+    deflections
+        If `True`, `func` returns the magnitude of a deflection angle, which is directed radially away from the
+        centre and an ndarray of shape [total_coordinates, 2] is returned. If `False`, `func` returns a convergence
+        and an ndarray of shape [total_coordinates] is returned.
+    """
+    values = values_via_cell_index_jit(
+        func=func,
+        grid=np.asarray(grid, dtype="float64"),
+        parameters=np.ascontiguousarray(parameters, dtype="float64"),
+        centres=cell_index.centres,
+        cut_radii=cell_index.cut_radii,
+        cell_geometry=cell_index.cell_geometry,
+        cell_starts=cell_index.cell_starts,
+        cell_profiles=cell_index.cell_profiles,
+        cell_cut_radii=cell_index.cell_cut_radii,
+        grid_radial_minimum=float(grid_radial_minimum),
+        deflections=deflections,
+    )
+
+    if deflections:
+        return values
+
+    return values[:, 0]
+
+
+@decorator_util.jit()
+def values_via_cell_index_jit(
+    func,
+    grid,
+    parameters,
+    centres,
+    cut_radii,
+    cell_geometry,
+    cell_starts,
+    cell_profiles,
+    cell_cut_radii,
+    grid_radial_minimum,
+    deflections,
+):
+
+    values = np.zeros((grid.shape[0], 2))
+
+    origin_y = cell_geometry[0]
+    origin_x = cell_geometry[1]
+    cell_size = cell_geometry[2]
+    cells_per_side = int(cell_geometry[3])
+    max_cut_radius = cell_geometry[4]
+
+    for index in prange(grid.shape[0]):
+
+        y = grid[index, 0]
+        x = grid[index, 1]
+
+        cell_y_min = max(0.0, np.floor((y - max_cut_radius - origin_y) / cell_size))
+        cell_y_max = min(
+            cells_per_side - 1.0, np.floor((y + max_cut_radius - origin_y) / cell_size)
+        )
+        cell_x_min = max(0.0, np.floor((x - max_cut_radius - origin_x) / cell_size))
+        cell_x_max = min(
+            cells_per_side - 1.0, np.floor((x + max_cut_radius - origin_x) / cell_size)
+        )
+
+        value_0 = 0.0
+        value_1 = 0.0
+
+        for cell_y in range(int(cell_y_min), int(cell_y_max) + 1):
+
+            distance_y = max(
+                0.0, abs(y - origin_y - (cell_y + 0.5) * cell_size) - 0.5 * cell_size
+            )
+
+            for cell_x in range(int(cell_x_min), int(cell_x_max) + 1):
+
+                distance_x = max(
+                    0.0,
+                    abs(x - origin_x - (cell_x + 0.5) * cell_size) - 0.5 * cell_size,
+                )
+
+                cell = cell_y * cells_per_side + cell_x
+
+                if distance_y ** 2 + distance_x ** 2 > cell_cut_radii[cell] ** 2:
+                    continue
+
+                for cell_profile_index in range(
+                    cell_starts[cell], cell_starts[cell + 1]
+                ):
+
+                    profile = cell_profiles[cell_profile_index]
+
+                    shifted_y = y - centres[profile, 0]
+                    shifted_x = x - centres[profile, 1]
+
+                    radius = np.sqrt(shifted_y ** 2 + shifted_x ** 2)
+
+                    if radius > cut_radii[profile]:
+                        continue
+
+                    if radius == 0.0:
+                        shifted_y = grid_radial_minimum
+                        shifted_x = grid_radial_minimum
+                        radius = np.sqrt(2.0) * grid_radial_minimum
+                    elif radius < grid_radial_minimum:
+                        shifted_y *= grid_radial_minimum / radius
+                        shifted_x *= grid_radial_minimum / radius
+                        radius = grid_radial_minimum
+
+                    value = func(radius, parameters[profile])
+
+                    if deflections:
+                        value_0 += value * shifted_y / radius
+                        value_1 += value * shifted_x / radius
+                    else:
+                        value_0 += value
+
+        values[index, 0] = value_0
+        values[index, 1] = value_1
+
+    return values
+
+
+@decorator_util.jit()
+def nfw_coord_func_f_jit(grid_radius):
+
+    if grid_radius > 1.0:
+        return np.arccos(1.0 / grid_radius) / np.sqrt(grid_radius ** 2 - 1.0)
+    elif grid_radius < 1.0:
+        return np.arccosh(1.0 / grid_radius) / np.sqrt(1.0 - grid_radius ** 2)
+
+    return 1.0
+
+
+@decorator_util.jit()
+def sph_nfw_truncated_convergence_jit(radius, parameters):
+    """
+    The convergence of a `SphNFWTruncated` profile at a radius from its centre, where `parameters` are its
+    (kappa_s, scale_radius, tau).
+    """
+    kappa_s = parameters[0]
+    tau = parameters[2]
+
+    grid_radius = radius / parameters[1]
+
+    f_r = nfw_coord_func_f_jit(grid_radius)
+
+    if grid_radius == 1.0:
+        g_r = 1.0 / 3.0
+    else:
+        g_r = (1.0 - f_r) / (grid_radius ** 2 - 1.0)
+
+    root = np.sqrt(tau ** 2 + grid_radius ** 2)
+    k_r = np.log(grid_radius / (root + tau))
+
+    return (
+        2.0
+        * kappa_s
+        * (tau ** 2 / (tau ** 2 + 1.0) ** 2)
+        * (
+            ((tau ** 2 + 1.0) * g_r)
+            + (2.0 * f_r)
+            - (np.pi / root)
+            + (((tau ** 2 - 1.0) / (tau * root)) * k_r)
+        )
+    )
+
+
+@decorator_util.jit()
+def sph_nfw_truncated_deflection_jit(radius, parameters):
+    """
+    The magnitude of the deflection angle of a `SphNFWTruncated` profile at a radius from its centre, where
+    `parameters` are its (kappa_s, scale_radius, tau).
+    """
+    kappa_s = parameters[0]
+    scale_radius = parameters[1]
+    tau = parameters[2]
+
+    grid_radius = radius / scale_radius
+
+    f_r = nfw_coord_func_f_jit(grid_radius)
+
+    root = np.sqrt(tau ** 2 + grid_radius ** 2)
+    k_r = np.log(grid_radius / (root + tau))
+
+    m_r = (tau ** 2 / (tau ** 2 + 1.0) ** 2) * (
+        ((tau ** 2 + 2.0 * grid_radius ** 2 - 1.0) * f_r)
+        + (np.pi * tau)
+        + ((tau ** 2 - 1.0) * np.log(tau))
+        + (root * (((tau ** 2 - 1.0) / tau) * k_r - np.pi))
+    )
+
+    return 4.0 * kappa_s * scale_radius * m_r / grid_radius
+
+
+@decorator_util.jit()
+def point_mass_deflection_jit(radius, parameters):
+    """
+    The magnitude of the deflection angle of a `PointMass` profile at a radius from its centre, where `parameters`
+    are its (einstein_radius,).
+    """
+    return parameters[0] ** 2 / radius
@@ -0,0 +1,124 @@
+import numpy as np
+from autoarray import decorator_util
+
+
+def image_2d_via_adaptive_oversampling_from(
+    func, grid_2d, pixel_scales, fractional_accuracy=0.9999, sub_steps=None
+):
+    """
+    Returns the image of a function (e.g. the `image_2d_from_grid` of a light profile) in every pixel of a grid of
+    pixel centres, where every pixel is oversampled only as much as is required for its value to converge.
+
+    The function is first evaluated at every pixel centre and then on a sub-grid of every pixel for every sub-size in
+    `sub_steps`. After every sub-size, the pixels whose value is within `fractional_accuracy` of the value at the
+    previous sub-size (using the same fractional accuracy check as a `Grid2DIterate`) are converged and are not
+    evaluated at higher sub-sizes. Pixels which have not converged after the last sub-size use its value.
+
+    Only pixels where the function has steep gradients or curvature (e.g. the core of a compact Sersic profile) are
+    therefore evaluated at high sub-sizes, such that the cost scales with the structure in the image rather than the
+    number of pixels.
+
+    Parameters
+    ----------
+    func : (np.ndarray) -> np.ndarray
+        A function which returns the image at an input array of (y,x) coordinates of shape [total_coordinates, 2].
+    grid_2d : np.ndarray
+        The (y,x) coordinates of the centre of every pixel, of shape [total_pixels, 2].
+    pixel_scales : (float, float)
+        The (y,x) arc-second dimensions of every pixel.
+    fractional_accuracy
+        The fractional accuracy the value of a pixel must be converged to before it is no longer oversampled.
+    sub_steps : [int]
+        The increasing sub-sizes pixels are oversampled at, which default to [2, 4, 8, 16].
+    """
+    sub_steps = sub_steps or [2, 4, 8, 16]
+
+    grid_2d = np.asarray(grid_2d, dtype="float64")
+    pixel_scales = (float(pixel_scales[0]), float(pixel_scales[1]))
+
+    image = np.asarray(func(grid_2d), dtype="float64").copy()
+
+    pixel_indexes = np.arange(grid_2d.shape[0])
+
+    for sub_size in sub_steps:
+
+        if len(pixel_indexes) == 0:
+            break
+
+        sub_grid_2d = sub_grid_2d_from(
+            grid_2d=grid_2d[pixel_indexes], pixel_scales=pixel_scales, sub_size=sub_size
+        )
+
+        image_higher = np.mean(
+            np.asarray(func(sub_grid_2d), dtype="float64").reshape(
+                len(pixel_indexes), sub_size ** 2
+            ),
+            axis=1,
+        )
+
+        converged = (
+            fractional_accuracies_from(
+                image_lower=image[pixel_indexes], image_higher=image_higher
+            )
+            >= fractional_accuracy
+        )
+
+        image[pixel_indexes] = image_higher
+
+        pixel_indexes = pixel_indexes[~converged]
+
+    return image
+
+
+def fractional_accuracies_from(image_lower, image_higher):
+    """
+    Returns the fractional accuracy of every pixel of an image computed at a lower and higher sub-size, which is the
+    ratio of the smaller to the larger value. Pixels which are zero at both sub-sizes have a fractional accuracy of
+    1.0 and pixels which are zero at only one sub-size have a fractional accuracy of 0.0.
+    """
+    image_lower = np.abs(image_lower)
+    image_higher = np.abs(image_higher)
+
+    lower = np.minimum(image_lower, image_higher)
+    higher = np.maximum(image_lower, image_higher)
+
+    return np.divide(lower, higher, out=np.ones(higher.shape), where=higher > 0.0)
+
+
+@decorator_util.jit()
+def sub_grid_2d_from(grid_2d, pixel_scales, sub_size):
+    """
+    Returns the (y,x) coordinates of the centres of a uniform sub-grid of every pixel of a grid of pixel centres,
+    where the sub-pixels of each pixel are contiguous and ordered from the top-left sub-pixel rightwards and then
+    downwards, like the sub-grid of a `Grid2D`.
+
+    Parameters
+    ----------
+    grid_2d : np.ndarray
+        The (y,x) coordinates of the centre of every pixel, of shape [total_pixels, 2].
+    pixel_scales : (float, float)
+        The (y,x) arc-second dimensions of every pixel.
+    sub_size
+        The size of the sub-grid of every pixel, which has sub_size x sub_size sub-pixels.
+    """
+    sub_grid_2d = np.zeros((grid_2d.shape[0] * sub_size ** 2, 2))
+
+    y_sub_scale = pixel_scales[0] / sub_size
+    x_sub_scale = pixel_scales[1] / sub_size
+
+    sub_index = 0
+
+    for pixel_index in range(grid_2d.shape[0]):
+
+        y_top = grid_2d[pixel_index, 0] + 0.5 * pixel_scales[0]
+        x_left = grid_2d[pixel_index, 1] - 0.5 * pixel_scales[1]
+
+        for y1 in range(sub_size):
+            for x1 in range(sub_size):
+
+                sub_grid_2d[sub_index, 0] = y_top - (y1 + 0.5) * y_sub_scale
+                sub_grid_2d[sub_index, 1] = x_left + (x1 + 0.5) * x_sub_scale
+
+                sub_index += 1
+
+    return sub_grid_2d
@@ -1,7 +1,10 @@
+import inspect
 import numpy as np
 from autoarray.structures.grids.two_d import grid_2d
 from autogalaxy import exc
 from autogalaxy.plane import plane as pl
+from autogalaxy.profiles import light_profiles as lp
+from autogalaxy.util import convolver_util
 
 
 def plane_image_of_galaxies_from(shape, grid, galaxies, buffer=1.0e-2):
@@ -26,6 +29,193 @@ def plane_image_of_galaxies_from(shape, grid, galaxies, buffer=1.0e-2):
     return pl.PlaneImage(array=image, grid=grid)
 
 
+def images_of_planes_from(planes, grid):
+    """
+    Returns the (unbinned) image of every plane in a list of planes as a single stacked ndarray of shape
+    [total_planes, total_coordinates], where every row is the summed image of the light profiles of every galaxy in
+    the corresponding plane.
+
+    The light profiles of all planes are grouped by their class and every group is evaluated as a single stack of
+    profiles (see `LightProfile.stack_from`), such that the images of many planes are computed in one set of NumPy
+    operations per light profile class. Light profiles which do not support stacked evaluation are evaluated
+    individually via `image_2d_from_grid`.
+
+    Stacked evaluation uses the (y,x) coordinates of the grid directly, so it is only used for a `Grid2D`. For other
+    grids (e.g. a `Grid2DIterate`, which adaptively increases its sub-size, or a `Grid2DInterpolate`) every plane's
+    image is computed via `image_2d_from_grid`, such that it is identical to the image of the plane.
+
+    Parameters
+    -----------
+    planes : [Plane]
+        The planes whose light profile images are evaluated.
+    grid : Grid2D
+        The (y, x) coordinates on which every plane's image is evaluated.
+    """
+    if type(grid) is not grid_2d.Grid2D:
+        return np.asarray(
+            [np.asarray(plane.image_2d_from_grid(grid=grid)) for plane in planes],
+            dtype="float64",
+        ).reshape(len(planes), grid.shape[0])
+
+    images = np.zeros((len(planes), grid.shape[0]))
+
+    stack_profiles_dict = {}
+
+    for plane_index, plane in enumerate(planes):
+        for galaxy in plane.galaxies:
+            for light_profile in galaxy.light_profiles:
+
+                if isinstance(
+                    light_profile, (lp.EllGaussian, lp.EllSersic, lp.EllChameleon)
+                ):
+                    stack_profiles_dict.setdefault(light_profile.__class__, []).append(
+                        (plane_index, light_profile)
+                    )
+                else:
+                    images[plane_index] += np.asarray(
+                        light_profile.image_2d_from_grid(grid=grid)
+                    )
+
+    for cls, plane_index_and_profiles in stack_profiles_dict.items():
+
+        plane_indexes = [plane_index for plane_index, _ in plane_index_and_profiles]
+        light_profiles = [profile for _, profile in plane_index_and_profiles]
+
+        parameter_names = [
+            name
+            for name in inspect.signature(cls.__init__).parameters
+            if name not in ("self", "centre", "elliptical_comps")
+        ]
+
+        profile_stack = cls.stack_from(
+            centres=[profile.centre for profile in light_profiles],
+            elliptical_comps=[profile.elliptical_comps for profile in light_profiles],
+            **{
+                name: [getattr(profile, name) for profile in light_profiles]
+                for name in parameter_names
+            },
+        )
+
+        np.add.at(
+            images, plane_indexes, profile_stack.image_2d_stack_from_grid(grid=grid)
+        )
+
+    return images
+
+
+def blurred_images_of_planes_from(planes, grid, convolver, blurring_grid):
+    """
+    Returns the blurred image of every plane in a list of planes as a single stacked ndarray of shape
+    [total_planes, total_unmasked_pixels], where every row is the result of the plane's
+    `blurred_image_2d_from_grid_and_convolver` method.
+
+    The images and blurring images of all planes are computed as stacks (see `images_of_planes_from`) and binned up,
+    so that the PSF convolution of every plane is performed in one pass over the `Convolver`'s frames (see
+    `convolver_util.convolved_images_from`).
+
+    Parameters
+    -----------
+    planes : [Plane]
+        The planes whose light profile images are evaluated and blurred.
+    grid : Grid2D
+        The (y, x) coordinates on which every plane's image is evaluated.
+    convolver : aa.Convolver
+        The Convolver object used to blur the images.
+    blurring_grid : Grid2D
+        The (y,x) coordinates neighboring the (masked) grid whose light is blurred into the image.
+    """
+    images = images_of_planes_from(planes=planes, grid=grid)
+    blurring_images = images_of_planes_from(planes=planes, grid=blurring_grid)
+
+    return convolver_util.convolved_images_from(
+        images=binned_images_from(images=images, grid=grid),
+        blurring_images=binned_images_from(images=blurring_images, grid=blurring_grid),
+        convolver=convolver,
+    )
+
+
+def binned_images_from(images, grid):
+    """
+    Bin up a stack of images of shape [total_images, total_sub_pixels] evaluated on a sub-gridded `Grid2D`, returning
+    an ndarray of shape [total_images, total_unmasked_pixels] where every row is the mean value of every set of
+    sub-pixels (e.g. the `binned` attribute of an `Array2D`).
+
+    Parameters
+    -----------
+    images : np.ndarray
+        The stack of 1D images evaluated on the sub-grid.
+    grid : Grid2D
+        The sub-grid the images are evaluated on, whose mask defines the sub-size.
+    """
+    return grid.mask.sub_fraction * np.sum(
+        np.reshape(images, (images.shape[0], -1, grid.mask.sub_length)), axis=2
+    )
+
+
+def contribution_maps_of_galaxies_from(galaxies):
+    """
+    Returns the contribution map of every galaxy in a list of galaxies with a `HyperGalaxy` as a single stacked
+    ndarray of shape [total_galaxies, total_unmasked_pixels], where every row is the result of the corresponding
+    `HyperGalaxy`'s `contribution_map_from_hyper_images` method.
+
+    The hyper images and contribution factors of all galaxies are stacked, such that the contribution maps are
+    computed in one set of NumPy operations as opposed to one per galaxy.
+
+    Parameters
+    -----------
+    galaxies : [Galaxy]
+        The galaxies whose contribution maps are computed, which must all have a `HyperGalaxy` and hyper images.
+    """
+    hyper_model_images = np.asarray(
+        [galaxy.hyper_model_image for galaxy in galaxies], dtype="float64"
+    )
+    hyper_galaxy_images = np.asarray(
+        [galaxy.hyper_galaxy_image for galaxy in galaxies], dtype="float64"
+    )
+    contribution_factors = np.asarray(
+        [galaxy.hyper_galaxy.contribution_factor for galaxy in galaxies],
+        dtype="float64",
+    )
+
+    contribution_maps = np.divide(
+        hyper_galaxy_images, np.add(hyper_model_images, contribution_factors[:, None])
+    )
+
+    return np.divide(
+        contribution_maps, np.max(contribution_maps, axis=1, keepdims=True)
+    )
+
+
+def hyper_noise_maps_of_galaxies_from(galaxies, noise_map):
+    """
+    Returns the hyper noise-map of every galaxy in a list of galaxies with a `HyperGalaxy` as a single stacked ndarray
+    of shape [total_galaxies, total_unmasked_pixels], where every row is the result of the corresponding
+    `HyperGalaxy`'s `hyper_noise_map_from_hyper_images_and_noise_map` method.
+
+    The contribution maps of all galaxies are computed as a stack (see `contribution_maps_of_galaxies_from`) and
+    scaled by every galaxy's noise factor and noise power in one set of NumPy operations.
+
+    Parameters
+    -----------
+    galaxies : [Galaxy]
+        The galaxies whose hyper noise-maps are computed, which must all have a `HyperGalaxy` and hyper images.
+    noise_map : np.ndarray
+        The observed noise-map which is scaled by every galaxy.
+    """
+    contribution_maps = contribution_maps_of_galaxies_from(galaxies=galaxies)
+
+    noise_factors = np.asarray(
+        [galaxy.hyper_galaxy.noise_factor for galaxy in galaxies], dtype="float64"
+    )
+    noise_powers = np.asarray(
+        [galaxy.hyper_galaxy.noise_power for galaxy in galaxies], dtype="float64"
+    )
+
+    return noise_factors[:, None] * np.power(
+        np.asarray(noise_map)[None, :] * contribution_maps, noise_powers[:, None]
+    )
+
+
 def ordered_plane_redshifts_from(galaxies):
     """Given a list of galaxies (with redshifts), return a list of the redshifts in ascending order.
 
@@ -0,0 +1,46 @@
+import threading
+from contextlib import contextmanager
+
+_profiler = threading.local()
+
+
+def active_profiler():
+    """
+    Returns the profiler active for the `log_likelihood_function` call currently being evaluated, or `None`.
+
+    The profiler (e.g. an `analysis.profiling.Profiler`) is set by the analysis via `set_active_profiler`, such that
+    the galaxy and plane modules which time their steps via `section` do not depend on the analysis package.
+    """
+    return getattr(_profiler, "profiler", None)
+
+
+def set_active_profiler(profiler):
+    """
+    Set the profiler which every `section` is recorded in on the current thread, where `None` deactivates profiling.
+    """
+    _profiler.profiler = profiler
+
+
+@contextmanager
+def section(name: str, galaxy=None, profile=None):
+    """
+    Context manager which records a section of a `log_likelihood_function` call in the active profiler, and does
+    nothing if no profiler is active.
+
+    Parameters
+    ----------
+    name
+        The name of the step of the likelihood evaluation the section times (e.g. `convolution`).
+    galaxy
+        The galaxy the section is evaluated for, which its timings are broken down by.
+    profile
+        The profile the section is evaluated for, whose class its timings are broken down by.
+    """
+    profiler = active_profiler()
+
+    if profiler is None:
+        yield
+        return
+
+    with profiler.section(name=name, galaxy=galaxy, profile=profile):
+        yield
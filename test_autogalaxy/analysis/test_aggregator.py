@@ -1,3 +1,6 @@
+import numpy as np
+from functools import partial
+from types import SimpleNamespace
 from os import path
 import os
 import pytest
@@ -6,6 +9,8 @@ import shutil
 from autoconf import conf
 import autofit as af
 import autogalaxy as ag
+from autogalaxy import exc
+from autogalaxy.analysis.aggregator.exporter import column_value_from
 from autogalaxy.mock import mock
 
 directory = path.dirname(path.realpath(__file__))
@@ -228,3 +233,234 @@ def test__fit_interferometer_generator_from_aggregator(
         assert (fit_interferometer.interferometer.real_space_mask == mask_2d_7x7).all()
 
     clean(database_file=database_file, result_path=result_path)
+
+
+def test__shared_array_from__identical_arrays_are_shared():
+
+    array_0 = ag.Array2D.manual_native(array=[[1.0, 2.0]], pixel_scales=1.0)
+    array_1 = ag.Array2D.manual_native(array=[[1.0, 2.0]], pixel_scales=1.0)
+    array_2 = ag.Array2D.manual_native(array=[[1.0, 3.0]], pixel_scales=1.0)
+
+    shared_array_0 = ag.agg.shared_array_from(array_0)
+
+    assert shared_array_0 is array_0
+    assert ag.agg.shared_array_from(array_1) is array_0
+    assert ag.agg.shared_array_from(array_2) is array_2
+    assert ag.agg.shared_array_from(np.array([1.0, 2.0])) is not array_0
+    assert ag.agg.shared_array_from(None) is None
+
+
+def test__lazy_proxy__loads_object_when_attribute_accessed():
+
+    loaded = []
+
+    def plane_from(fit):
+        loaded.append(fit)
+        return ag.Plane(galaxies=[ag.Galaxy(redshift=fit)])
+
+    proxy = ag.agg.LazyProxy(plane_from, 0.5)
+
+    assert proxy.is_loaded is False
+    assert loaded == []
+
+    assert proxy.redshift == 0.5
+    assert proxy.galaxies[0].redshift == 0.5
+    assert proxy.is_loaded is True
+    assert loaded == [0.5]
+
+    proxy.unload()
+
+    assert proxy.is_loaded is False
+    assert proxy.redshift == 0.5
+    assert loaded == [0.5, 0.5]
+
+
+def test__dataset_via_cache_from__reuses_dataset_of_identical_values(imaging_7x7):
+
+    created = []
+
+    def imaging_from():
+        created.append(1)
+        return imaging_7x7
+
+    settings = ag.SettingsImaging(sub_size=1)
+
+    values = [imaging_7x7.image, imaging_7x7.noise_map, imaging_7x7.psf, settings]
+
+    imaging = ag.agg.dataset_via_cache_from(values=values, func=imaging_from)
+
+    assert imaging is imaging_7x7
+
+    imaging = ag.agg.dataset_via_cache_from(
+        values=[
+            imaging_7x7.image.copy(),
+            imaging_7x7.noise_map,
+            imaging_7x7.psf,
+            ag.SettingsImaging(sub_size=1),
+        ],
+        func=imaging_from,
+    )
+
+    assert imaging is imaging_7x7
+    assert len(created) == 1
+
+    ag.agg.dataset_via_cache_from(
+        values=values[:3] + [ag.SettingsImaging(sub_size=2)], func=imaging_from
+    )
+
+    assert len(created) == 2
+
+    assert ag.agg.dataset_fingerprint_from(
+        values=[imaging_7x7.image]
+    ) != ag.agg.dataset_fingerprint_from(values=[2.0 * imaging_7x7.image])
+
+
+class MockFit:
+    def __init__(self, instance, values):
+
+        self.instance = instance
+        self.values = values
+
+    def value(self, name):
+        return self.values.get(name)
+
+
+class MockAggregator:
+    def __init__(self, fits):
+
+        self.fits = fits
+
+    def map(self, func):
+        for fit in self.fits:
+            yield func(fit)
+
+
+def data_sum_via_database_from(fit):
+    return fit.instance + float(np.sum(fit.value(name="data")))
+
+
+def test__parallel_map_from__results_in_same_order_as_map():
+
+    aggregator = MockAggregator(
+        fits=[
+            MockFit(instance=float(i), values={"data": np.full(3, i), "psf": None})
+            for i in range(7)
+        ]
+    )
+
+    fit_values = list(aggregator.map(func=partial(ag.agg.FitValues, names=["data"])))
+
+    assert fit_values[2].instance == 2.0
+    assert (fit_values[2].value(name="data") == np.full(3, 2)).all()
+    assert fit_values[2].value(name="psf") is None
+
+    results = list(aggregator.map(func=data_sum_via_database_from))
+
+    for chunk_size, max_in_flight in [(1, None), (2, 1), (3, 2), (10, None)]:
+
+        parallel_results = ag.agg.parallel_map_from(
+            aggregator=aggregator,
+            func=data_sum_via_database_from,
+            names=["data"],
+            processes=2,
+            chunk_size=chunk_size,
+            max_in_flight=max_in_flight,
+        )
+
+        assert list(parallel_results) == results
+
+
+@pytest.fixture(name="attribute_aggregator")
+def make_attribute_aggregator():
+    return MockAggregator(
+        fits=[
+            MockFit(
+                instance=SimpleNamespace(
+                    galaxies=[
+                        ag.Galaxy(
+                            redshift=0.5,
+                            light=ag.lp.EllSersic(centre=(0.0, float(i))),
+                            mass=ag.mp.SphIsothermal(einstein_radius=float(i)),
+                        )
+                    ]
+                ),
+                values={},
+            )
+            for i in range(3)
+        ]
+    )
+
+
+def test__plane_gen_from__processes_with_chunks_and_lazy_raises(
+    attribute_aggregator,
+):
+
+    planes = ag.agg.Plane(
+        aggregator=attribute_aggregator, processes=2, chunk_size=2, max_in_flight=1
+    )
+
+    assert [plane.galaxies[0].mass.einstein_radius for plane in planes] == [
+        0.0,
+        1.0,
+        2.0,
+    ]
+
+    with pytest.raises(exc.AggregatorException):
+        ag.agg.Plane(aggregator=attribute_aggregator, lazy=True, processes=2)
+
+
+def test__attribute_rows_gen_from(attribute_aggregator):
+
+    attributes = {
+        "light_centre": (ag.lp.LightProfile, "centre"),
+        "einstein_radius": (ag.mp.MassProfile, "einstein_radius"),
+        "redshift": lambda plane: plane.redshift,
+    }
+
+    rows = list(
+        ag.agg.attribute_rows_gen_from(
+            aggregator=attribute_aggregator, attributes=attributes
+        )
+    )
+
+    assert rows[2]["light_centre"] == [[0.0, 2.0]]
+    assert rows[2]["einstein_radius"] == [2.0]
+    assert rows[2]["redshift"] == 0.5
+    assert rows[2]["identifier"] is None
+
+
+def test__column_value_from__only_numeric_arrays_cast_to_float():
+
+    assert column_value_from(value=np.array([1, 2])) == [1.0, 2.0]
+    assert column_value_from(value=[(0.0, 1), (2, 3.0)]) == [[0.0, 1.0], [2.0, 3.0]]
+    assert column_value_from(value=np.float64(1.5)) == 1.5
+    assert column_value_from(value=["lens", "source"]) == ["lens", "source"]
+    assert column_value_from(value=[[1.0], [2.0, 3.0]]) == [[1.0], [2.0, 3.0]]
+    assert column_value_from(value=None) is None
+
+
+def test__output_attributes_to_parquet(attribute_aggregator):
+
+    pq = pytest.importorskip("pyarrow.parquet")
+
+    file_path = path.join(directory, "files", "attributes.parquet")
+
+    os.makedirs(path.dirname(file_path), exist_ok=True)
+
+    for i, fit in enumerate(attribute_aggregator.fits):
+        fit.id = f"fit_{i}"
+
+    ag.agg.output_attributes_to_parquet(
+        aggregator=attribute_aggregator,
+        attributes={"einstein_radius": (ag.mp.MassProfile, "einstein_radius")},
+        file_path=file_path,
+        chunk_size=2,
+    )
+
+    table = pq.read_table(file_path)
+
+    assert table.num_rows == 3
+    assert table.column("identifier").to_pylist() == ["fit_0", "fit_1", "fit_2"]
+    assert table.column("einstein_radius").to_pylist() == [[0.0], [1.0], [2.0]]
+
+    os.remove(file_path)
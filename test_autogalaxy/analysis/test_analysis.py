@@ -175,6 +175,91 @@ class TestAnalysisImaging:
         assert (fit.plane.galaxies[0].hyper_galaxy_image == galaxy_hyper_image).all()
         assert fit_likelihood == fit.log_likelihood
 
+    def test__figures_of_merit_from_instances__matches_log_likelihood_function(
+        self, masked_imaging_7x7
+    ):
+
+        hyper_image_sky = ag.hyper_data.HyperImageSky(sky_scale=1.0)
+
+        galaxy_0 = ag.Galaxy(redshift=0.5, light=ag.lp.EllSersic(intensity=0.1))
+        galaxy_1 = ag.Galaxy(
+            redshift=0.5,
+            light=ag.lp.EllSersic(intensity=0.2, effective_radius=0.5),
+            light_1=ag.lp.EllExponential(intensity=0.05),
+        )
+
+        instance_0 = af.Collection(
+            galaxies=af.Collection(galaxy=galaxy_0)
+        ).instance_from_unit_vector([])
+        instance_1 = af.Collection(
+            galaxies=af.Collection(galaxy=galaxy_1)
+        ).instance_from_unit_vector([])
+        instance_2 = af.Collection(
+            hyper_image_sky=hyper_image_sky, galaxies=af.Collection(galaxy=galaxy_0)
+        ).instance_from_unit_vector([])
+
+        analysis = ag.AnalysisImaging(dataset=masked_imaging_7x7)
+
+        figures_of_merit = analysis.figures_of_merit_from_instances(
+            instances=[instance_0, instance_1, instance_2]
+        )
+
+        assert figures_of_merit[0] == pytest.approx(
+            analysis.log_likelihood_function(instance=instance_0), 1.0e-8
+        )
+        assert figures_of_merit[1] == pytest.approx(
+            analysis.log_likelihood_function(instance=instance_1), 1.0e-8
+        )
+        assert figures_of_merit[2] == analysis.log_likelihood_function(
+            instance=instance_2
+        )
+
+    def test__profiler__log_likelihood_function_timed_by_galaxy_and_profile(
+        self, masked_imaging_7x7
+    ):
+
+        galaxy = ag.Galaxy(
+            redshift=0.5,
+            bulge=ag.lp.EllSersic(intensity=0.1),
+            disk=ag.lp.EllExponential(intensity=0.1),
+        )
+
+        model = af.Collection(galaxies=af.Collection(lens=galaxy))
+
+        profiler = ag.Profiler()
+
+        analysis = ag.AnalysisImaging(dataset=masked_imaging_7x7, profiler=profiler)
+
+        instance = model.instance_from_unit_vector([])
+
+        fit_figure_of_merit = analysis.log_likelihood_function(instance=instance)
+        analysis.log_likelihood_function(instance=instance)
+
+        plane = analysis.plane_for_instance(instance=instance)
+        fit = ag.FitImaging(imaging=masked_imaging_7x7, plane=plane)
+
+        assert fit.log_likelihood == fit_figure_of_merit
+
+        assert profiler.evaluations == 2
+
+        for key in [
+            "log_likelihood_function",
+            "associate_hyper_images",
+            "plane_for_instance",
+            "fit",
+            "convolution",
+            "figure_of_merit",
+        ]:
+            assert profiler.stats[key]["calls"] == 2
+
+        assert (
+            profiler.stats["image_2d_from_grid/galaxies.lens/EllSersic"]["calls"] == 4
+        )
+        assert (
+            profiler.stats["image_2d_from_grid/galaxies.lens/EllExponential"]["calls"]
+            == 4
+        )
+
 
 class TestAnalysisInterferometer:
     def test__make_result__result_interferometer_is_returned(self, interferometer_7):
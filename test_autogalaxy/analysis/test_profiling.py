@@ -0,0 +1,71 @@
+import pytest
+import tracemalloc
+
+import autogalaxy as ag
+from autogalaxy.util import profiling_util
+
+
+class TestProfiler:
+    def test__section__only_recorded_when_profiler_active(self):
+
+        profiler = ag.Profiler()
+
+        with profiling_util.section(name="plane_for_instance"):
+            pass
+
+        assert profiler.stats == {}
+
+        with profiler.evaluation():
+            with profiling_util.section(name="plane_for_instance"):
+                pass
+            with profiling_util.section(name="plane_for_instance"):
+                pass
+
+        assert profiling_util.active_profiler() is None
+        assert profiler.evaluations == 1
+        assert profiler.stats["plane_for_instance"]["calls"] == 2
+        assert profiler.stats["log_likelihood_function"]["calls"] == 1
+        assert (
+            profiler.stats["log_likelihood_function"]["total_time"]
+            >= profiler.stats["plane_for_instance"]["total_time"]
+        )
+
+    def test__key_from__broken_down_by_galaxy_name_and_profile_class(self):
+
+        galaxy = ag.Galaxy(redshift=0.5)
+        light = ag.lp.EllSersic()
+
+        profiler = ag.Profiler()
+        profiler.galaxy_names = {id(galaxy): "galaxies.lens"}
+
+        assert profiler.key_from(name="convolution") == "convolution"
+        assert (
+            profiler.key_from(name="image_2d_from_grid", galaxy=galaxy, profile=light)
+            == "image_2d_from_grid/galaxies.lens/EllSersic"
+        )
+
+        profiler.galaxy_names = {}
+
+        assert (
+            profiler.key_from(name="image_2d_from_grid", galaxy=galaxy)
+            == f"image_2d_from_grid/galaxy_{galaxy.id}"
+        )
+
+    def test__trace_memory__allocated_bytes_recorded(self):
+
+        profiler = ag.Profiler(trace_memory=True)
+
+        with profiler.evaluation():
+            with profiling_util.section(name="allocate"):
+                _ = bytearray(10000000)
+
+        tracemalloc.stop()
+
+        assert profiler.stats["allocate"]["allocated_bytes"] >= 1000000
+
+        summary = profiler.summary
+
+        assert summary["evaluations"] == 1
+        assert summary["sections"]["allocate"]["mean_time"] == pytest.approx(
+            profiler.stats["allocate"]["total_time"], 1.0e-4
+        )
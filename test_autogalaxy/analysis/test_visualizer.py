@@ -1,7 +1,12 @@
+import multiprocessing
+import os
 import shutil
+from concurrent.futures import Future
 from os import path
+import numpy as np
 import pytest
 
+import autofit as af
 import autogalaxy as ag
 from autoconf import conf
 from autogalaxy.analysis import visualizer as vis
@@ -213,3 +218,223 @@ class TestVisualizer:
             path.join(plot_path, "subplot_contribution_maps_of_galaxies.png")
             not in plot_patch.paths
         )
+
+
+class TestIncremental:
+    def test__is_unchanged_from__true_only_if_recorded_hash_is_unchanged(self):
+
+        array = np.ones(3)
+
+        value_hash = vis.hash_from(values=[array, 1])
+
+        assert (
+            vis.is_unchanged_from(
+                visualize_path="incremental", name="fit", value_hash=value_hash
+            )
+            is False
+        )
+
+        vis.record_hash(visualize_path="incremental", name="fit", value_hash=value_hash)
+
+        assert (
+            vis.is_unchanged_from(
+                visualize_path="incremental", name="fit", value_hash=value_hash
+            )
+            is True
+        )
+        assert (
+            vis.is_unchanged_from(
+                visualize_path="other_path", name="fit", value_hash=value_hash
+            )
+            is False
+        )
+
+        array[0] = 2.0
+
+        assert vis.hash_from(values=[array, 1]) != value_hash
+        assert vis.hash_from(values=[np.ones(3), 2]) != value_hash
+
+        assert vis.hash_from(values=[np.ones((2, 2))]) != vis.hash_from(
+            values=[np.ones(4)]
+        )
+
+    def test__values_of_instance_from__equal_instances_have_equal_hashes(self):
+
+        model = af.Collection(
+            galaxies=af.Collection(
+                galaxy=af.Model(
+                    ag.Galaxy,
+                    redshift=0.5,
+                    light=ag.lp.EllSersic,
+                    hyper_galaxy=ag.HyperGalaxy,
+                )
+            )
+        )
+
+        instance = model.instance_from_prior_medians()
+        instance_equal = model.instance_from_prior_medians()
+
+        assert instance.galaxies.galaxy.id != instance_equal.galaxies.galaxy.id
+
+        value_hash = vis.hash_from(
+            values=[vis.values_of_instance_from(instance=instance), True]
+        )
+
+        assert value_hash == vis.hash_from(
+            values=[vis.values_of_instance_from(instance=instance_equal), True]
+        )
+        assert value_hash != vis.hash_from(
+            values=[vis.values_of_instance_from(instance=instance), False]
+        )
+
+        instance_equal.galaxies.galaxy.light.intensity += 1.0
+
+        assert value_hash != vis.hash_from(
+            values=[vis.values_of_instance_from(instance=instance_equal), True]
+        )
+
+    def test__record_hash__only_recorded_once_future_succeeds(self):
+
+        future = Future()
+
+        vis.record_hash(
+            visualize_path="future", name="fit", value_hash="a", future=future
+        )
+
+        assert (
+            vis.is_unchanged_from(visualize_path="future", name="fit", value_hash="a")
+            is False
+        )
+
+        future.set_result(None)
+
+        assert (
+            vis.is_unchanged_from(visualize_path="future", name="fit", value_hash="a")
+            is True
+        )
+
+        future = Future()
+
+        vis.record_hash(
+            visualize_path="future", name="fit", value_hash="b", future=future
+        )
+
+        future.set_exception(ValueError())
+
+        assert (
+            vis.is_unchanged_from(visualize_path="future", name="fit", value_hash="b")
+            is False
+        )
+
+    def test__visualize_imaging__skipped_if_imaging_unchanged(
+        self, imaging_7x7, include_2d_all, plot_path, plot_patch
+    ):
+
+        visualizer = vis.Visualizer(visualize_path=path.join(plot_path, "incremental"))
+        visualizer.incremental = True
+
+        visualizer.visualize_imaging(imaging=imaging_7x7)
+
+        total_paths = len(plot_patch.paths)
+
+        assert total_paths > 0
+
+        visualizer.visualize_imaging(imaging=imaging_7x7)
+
+        assert len(plot_patch.paths) == total_paths
+
+    def test__is_unchanged__false_at_end_of_analysis_or_if_not_incremental(
+        self, plot_path
+    ):
+
+        visualizer = vis.Visualizer(visualize_path=path.join(plot_path, "end"))
+        visualizer.incremental = True
+
+        assert visualizer.is_unchanged(name="fit", values=[1]) is False
+        assert visualizer.is_unchanged(name="fit", values=[1]) is False
+
+        visualizer.record_visualized("fit")
+
+        assert visualizer.is_unchanged(name="fit", values=[1]) is True
+        assert (
+            visualizer.is_unchanged(name="fit", values=[1], during_analysis=False)
+            is False
+        )
+
+        visualizer = vis.Visualizer(
+            visualize_path=path.join(plot_path, "end"), incremental=False
+        )
+
+        assert visualizer.is_unchanged(name="fit", values=[1]) is False
+
+
+def output_text_to_file(file_path, text):
+
+    with open(file_path, "w") as f:
+        f.write(str(text))
+
+
+@pytest.mark.skipif(
+    "fork" not in multiprocessing.get_all_start_methods(),
+    reason="visualizer pool requires fork",
+)
+class TestVisualizerPool:
+    def test__submitted_functions_run_in_background_processes(self, plot_path):
+
+        os.makedirs(plot_path, exist_ok=True)
+
+        visualizer_pool = vis.VisualizerPool(processes=1)
+
+        file_paths = [path.join(plot_path, f"pool_{i}.txt") for i in range(3)]
+
+        for i, file_path in enumerate(file_paths):
+            visualizer_pool.submit(output_text_to_file, file_path, f"text_{i}")
+
+        assert len(visualizer_pool.futures) <= 2
+
+        visualizer_pool.wait()
+
+        assert visualizer_pool.futures == []
+
+        for i, file_path in enumerate(file_paths):
+            with open(file_path) as f:
+                assert f.read() == f"text_{i}"
+
+    def test__arguments_are_snapshotted_when_submitted(self, plot_path):
+
+        os.makedirs(plot_path, exist_ok=True)
+
+        file_path = path.join(plot_path, "pool_snapshot.txt")
+
+        text = ["before"]
+
+        visualizer_pool = vis.VisualizerPool(processes=1)
+        visualizer_pool.submit(output_text_to_file, file_path, text)
+
+        text[0] = "after"
+
+        visualizer_pool.wait()
+
+        with open(file_path) as f:
+            assert f.read() == "['before']"
+
+    def test__keyword_arguments_passed_and_pending_futures_not_collected(
+        self, plot_path
+    ):
+
+        os.makedirs(plot_path, exist_ok=True)
+
+        file_path = path.join(plot_path, "pool_kwargs.txt")
+
+        visualizer_pool = vis.VisualizerPool(processes=1)
+        visualizer_pool.submit(output_text_to_file, file_path=file_path, text="kwargs")
+        visualizer_pool.wait()
+
+        with open(file_path) as f:
+            assert f.read() == "kwargs"
+
+        assert vis.VisualizerPool.collect(Future()) is False
+
+    def test__pool_from_config__none_if_not_asynchronous(self):
+
+        assert vis.visualizer_pool_from_config() is None
@@ -0,0 +1,113 @@
+import json
+from os import path
+
+import pytest
+
+from autogalaxy.benchmarks import benchmarks
+from autogalaxy.benchmarks.__main__ import main
+
+
+class TestBenchmarks:
+    def test__time_from__min_and_median_of_repeats(self):
+
+        calls = []
+
+        timings = benchmarks.time_from(func=lambda: calls.append(1), repeats=3)
+
+        assert len(calls) == 4
+        assert timings["repeats"] == 3
+        assert 0.0 <= timings["min"] <= timings["median"]
+
+    def test__run__filtered_benchmarks_keyed_by_instrument_and_sub_size(self):
+
+        results = benchmarks.run(
+            instruments=["lsst"],
+            sub_sizes=(1,),
+            repeats=1,
+            name_filter="EllSersic/",
+        )
+
+        assert results["metadata"]["repeats"] == 1
+        assert set(results["results"].keys()) == {
+            "deflections_2d_from_grid/EllSersic/lsst/sub_1",
+            "image_2d_from_grid/EllSersic/lsst/sub_1",
+        }
+        assert "min" in results["results"]["image_2d_from_grid/EllSersic/lsst/sub_1"]
+
+    def test__regressions_from__only_slower_than_tolerance_returned(self):
+
+        baseline = {
+            "results": {
+                "a": {"min": 1.0},
+                "b": {"min": 1.0},
+                "c": {"min": 1.0},
+                "d": {"error": "ProfileException()"},
+            }
+        }
+
+        results = {
+            "results": {
+                "a": {"min": 1.1},
+                "b": {"min": 1.5},
+                "c": {"error": "ProfileException()"},
+                "d": {"min": 2.0},
+                "e": {"min": 2.0},
+            }
+        }
+
+        regressions = benchmarks.regressions_from(
+            benchmarks=results, baseline=baseline, tolerance=0.2
+        )
+
+        assert list(regressions.keys()) == ["b"]
+        assert regressions["b"]["ratio"] == pytest.approx(1.5, 1.0e-4)
+
+    def test__output_to_json_and_from_json(self, tmpdir):
+
+        results = {"metadata": {"repeats": 1}, "results": {"a": {"min": 1.0}}}
+
+        file_path = path.join(tmpdir, "benchmarks.json")
+
+        benchmarks.output_to_json(benchmarks=results, file_path=file_path)
+
+        assert benchmarks.from_json(file_path=file_path) == results
+
+    def test__main__json_on_stdout_and_missing_baseline_is_an_error(
+        self, tmpdir, capsys
+    ):
+
+        baseline_path = path.join(tmpdir, "baseline.json")
+
+        args = [
+            "--baseline",
+            baseline_path,
+            "--instruments",
+            "lsst",
+            "--sub-sizes",
+            "1",
+            "--repeats",
+            "1",
+            "--filter",
+            "EllSersic/",
+        ]
+
+        assert main(args=args) == 2
+
+        captured = capsys.readouterr()
+
+        results = json.loads(captured.out)["results"]
+
+        assert "image_2d_from_grid/EllSersic/lsst/sub_1" in results
+        assert "No baseline found" in captured.err
+
+        assert main(args=args + ["--save-baseline"]) == 0
+        assert path.exists(baseline_path)
+
+        capsys.readouterr()
+
+        assert main(args=args + ["--tolerance", "1.0e8"]) == 0
+
+        captured = capsys.readouterr()
+
+        json.loads(captured.out)
+        assert captured.err == ""
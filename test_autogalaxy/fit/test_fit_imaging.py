@@ -1351,3 +1351,79 @@ class TestAttributes:
         assert fit.subtracted_images_of_galaxies[0].slim[0] == -2.0
         assert fit.subtracted_images_of_galaxies[1].slim[0] == -3.0
         assert fit.subtracted_images_of_galaxies[2].slim[0] == 0.0
+
+
+class TestLinearLightProfiles:
+    def test__intensities_solved_for__recover_input_intensities(
+        self, masked_imaging_7x7
+    ):
+
+        g0 = ag.Galaxy(
+            redshift=0.5,
+            bulge=ag.lp.EllSersic(intensity=1.0, effective_radius=0.6),
+            disk=ag.lp.EllExponential(intensity=2.0, effective_radius=1.2),
+        )
+        g1 = ag.Galaxy(redshift=0.5, light=ag.lp.SphGaussian(intensity=3.0, sigma=0.5))
+
+        plane = ag.Plane(redshift=0.5, galaxies=[g0, g1])
+
+        image = plane.blurred_image_2d_from_grid_and_convolver(
+            grid=masked_imaging_7x7.grid,
+            convolver=masked_imaging_7x7.convolver,
+            blurring_grid=masked_imaging_7x7.blurring_grid,
+        )
+
+        imaging = masked_imaging_7x7.modify_image_and_noise_map(
+            image=image, noise_map=masked_imaging_7x7.noise_map
+        )
+
+        g0_unit = ag.Galaxy(
+            redshift=0.5,
+            bulge=ag.lp.EllSersic(intensity=0.1, effective_radius=0.6),
+            disk=ag.lp.EllExponential(intensity=0.1, effective_radius=1.2),
+        )
+        g1_unit = ag.Galaxy(
+            redshift=0.5, light=ag.lp.SphGaussian(intensity=0.1, sigma=0.5)
+        )
+
+        plane_unit = ag.Plane(redshift=0.5, galaxies=[g0_unit, g1_unit])
+
+        fit = ag.FitImaging(
+            imaging=imaging, plane=plane_unit, use_linear_light_profiles=True
+        )
+
+        assert fit.linear_light_profile_intensities == pytest.approx(
+            np.array([1.0, 2.0, 3.0]), 1.0e-4
+        )
+        assert fit.plane.galaxies[0].bulge.intensity == pytest.approx(1.0, 1.0e-4)
+        assert fit.plane.galaxies[0].disk.intensity == pytest.approx(2.0, 1.0e-4)
+        assert fit.plane.galaxies[1].light.intensity == pytest.approx(3.0, 1.0e-4)
+        assert fit.chi_squared == pytest.approx(0.0, abs=1.0e-4)
+
+        assert g0_unit.bulge.intensity == 0.1
+
+        fit = ag.FitImaging(imaging=imaging, plane=plane_unit)
+
+        assert fit.linear_light_profile_intensities is None
+        assert fit.chi_squared > 0.0
+
+    def test__intensities_solved_for__non_negative(self, masked_imaging_7x7):
+
+        image = masked_imaging_7x7.image.copy()
+        image[:] = -1.0
+
+        imaging = masked_imaging_7x7.modify_image_and_noise_map(
+            image=image, noise_map=masked_imaging_7x7.noise_map
+        )
+
+        plane = ag.Plane(
+            redshift=0.5, galaxies=[ag.Galaxy(redshift=0.5, light=ag.lp.EllSersic())]
+        )
+
+        fit = ag.FitImaging(
+            imaging=imaging, plane=plane, use_linear_light_profiles=True
+        )
+
+        assert fit.linear_light_profile_intensities == pytest.approx(
+            np.array([0.0]), 1.0e-4
+        )
@@ -5,6 +5,7 @@ import autogalaxy as ag
 import numpy as np
 import pytest
 from autogalaxy import exc
+from autogalaxy.galaxy import galaxy as g
 from autogalaxy.mock import mock
 
 
@@ -221,6 +222,86 @@ class TestLightProfiles:
         assert visibilities == pytest.approx(galaxy_visibilities, 1.0e-4)
 
 
+class TestImageCache:
+    def test__light_profile_key__same_for_identical_light_profiles(self):
+
+        galaxy_0 = ag.Galaxy(redshift=0.5, light=ag.lp.EllSersic(intensity=1.0))
+        galaxy_1 = ag.Galaxy(redshift=1.0, light=ag.lp.EllSersic(intensity=1.0))
+        galaxy_2 = ag.Galaxy(redshift=0.5, light=ag.lp.EllSersic(intensity=2.0))
+
+        assert galaxy_0.light_profile_key == galaxy_1.light_profile_key
+        assert galaxy_0.light_profile_key != galaxy_2.light_profile_key
+
+        galaxy_0.light.intensity = np.array([1.0])
+
+        assert galaxy_0.light_profile_key is None
+
+    def test__image_from__lru_eviction_above_memory_cap(self):
+
+        image_cache = g.GalaxyImageCache()
+
+        grid = np.zeros((10, 2))
+
+        image = image_cache.image_from(
+            key=("a",), structures=(grid,), func=lambda: np.ones(10), memory_cap=200.0
+        )
+
+        assert (image == np.ones(10)).all()
+        assert image_cache.nbytes == 80
+
+        image = image_cache.image_from(
+            key=("a",), structures=(grid,), func=lambda: np.zeros(10), memory_cap=200.0
+        )
+
+        assert (image == np.ones(10)).all()
+
+        image_cache.image_from(
+            key=("b",), structures=(grid,), func=lambda: np.ones(10), memory_cap=200.0
+        )
+        image_cache.image_from(
+            key=("c",), structures=(grid,), func=lambda: np.ones(10), memory_cap=200.0
+        )
+
+        assert image_cache.nbytes == 160
+        assert [key[0] for key in image_cache.cache_dict] == ["b", "c"]
+
+        image = image_cache.image_from(
+            key=("c",),
+            structures=(np.zeros((10, 2)),),
+            func=lambda: 2.0 * np.ones(10),
+            memory_cap=200.0,
+        )
+
+        assert (image == 2.0 * np.ones(10)).all()
+
+    def test__image_2d_from_grid__reused_for_unchanged_galaxies(
+        self, sub_grid_2d_7x7, monkeypatch
+    ):
+
+        monkeypatch.setattr(g, "image_cache_enabled", lambda: True)
+        monkeypatch.setattr(g, "_image_cache", g.GalaxyImageCache())
+
+        galaxy = ag.Galaxy(redshift=0.5, light=ag.lp.EllSersic(intensity=1.0))
+
+        image = galaxy.image_2d_from_grid(grid=sub_grid_2d_7x7)
+
+        assert len(g._image_cache.cache_dict) == 1
+
+        galaxy = ag.Galaxy(redshift=0.5, light=ag.lp.EllSersic(intensity=1.0))
+
+        image_cached = galaxy.image_2d_from_grid(grid=sub_grid_2d_7x7)
+
+        assert len(g._image_cache.cache_dict) == 1
+        assert (image_cached == image).all()
+
+        galaxy = ag.Galaxy(redshift=0.5, light=ag.lp.EllSersic(intensity=2.0))
+
+        image_new = galaxy.image_2d_from_grid(grid=sub_grid_2d_7x7)
+
+        assert len(g._image_cache.cache_dict) == 2
+        assert image_new == pytest.approx(2.0 * image, 1.0e-4)
+
+
 class TestMassProfiles:
     def test__convergence_1d_from_grid(
         self, sub_grid_1d_7, mp_0, gal_x1_mp, mp_1, gal_x2_mp
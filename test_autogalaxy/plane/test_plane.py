@@ -2,6 +2,7 @@ import autogalaxy as ag
 import numpy as np
 import pytest
 from autogalaxy import exc
+from autogalaxy.galaxy import galaxy as g
 from autogalaxy.plane import plane
 from skimage import measure
 from autogalaxy.mock import mock
@@ -1012,6 +1013,35 @@ class TestAbstractPlaneData:
                 blurred_g0_image.native + blurred_g1_image.native, 1.0e-4
             )
 
+        def test__blurred_image_2d_from_grid_and_convolver__galaxy_image_cache(
+            self, sub_grid_2d_7x7, blurring_grid_2d_7x7, convolver_7x7, monkeypatch
+        ):
+            g0 = ag.Galaxy(redshift=0.5, light_profile=ag.lp.EllSersic(intensity=1.0))
+            g1 = ag.Galaxy(redshift=1.0, light_profile=ag.lp.EllSersic(intensity=2.0))
+
+            plane = ag.Plane(redshift=0.5, galaxies=[g0, g1])
+
+            blurred_image = plane.blurred_image_2d_from_grid_and_convolver(
+                grid=sub_grid_2d_7x7,
+                convolver=convolver_7x7,
+                blurring_grid=blurring_grid_2d_7x7,
+            )
+
+            monkeypatch.setattr(g, "image_cache_enabled", lambda: True)
+            monkeypatch.setattr(g, "_image_cache", g.GalaxyImageCache())
+
+            for _ in range(2):
+
+                blurred_image_cached = plane.blurred_image_2d_from_grid_and_convolver(
+                    grid=sub_grid_2d_7x7,
+                    convolver=convolver_7x7,
+                    blurring_grid=blurring_grid_2d_7x7,
+                )
+
+                assert blurred_image_cached.slim == pytest.approx(
+                    blurred_image.slim, 1.0e-4
+                )
+
         def test__blurred_image_of_galaxies_from_grid_and_convolver(
             self, sub_grid_2d_7x7, blurring_grid_2d_7x7, convolver_7x7
         ):
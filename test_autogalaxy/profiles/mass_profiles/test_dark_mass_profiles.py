@@ -5,7 +5,9 @@ import autogalaxy as ag
 import numpy as np
 import pytest
 from astropy import cosmology as cosmo
+from autogalaxy import exc
 from autogalaxy.mock import mock
+from autogalaxy.profiles.mass_profiles import dark_mass_profiles
 
 grid = np.array([[1.0, 1.0], [2.0, 2.0], [3.0, 3.0], [2.0, 4.0]])
 
@@ -372,6 +374,80 @@ class TestAbstractNFW:
         assert mass_at_200 == pytest.approx(24516707575366.09, 1.0e-4)
         assert mass_at_truncation_radius == pytest.approx(13190486262169.797, 1.0e-4)
 
+    def test__concentration_from__solves_concentration_func_for_arrays(self):
+
+        delta_concentration = np.array([[1.0, 10.0, 1.0e3], [1.0e5, 1.0e7, 1.0e9]])
+
+        concentration = dark_mass_profiles.concentration_from(
+            delta_concentration=delta_concentration
+        )
+
+        assert concentration.shape == (2, 3)
+
+        residual = ag.mp.SphNFW.concentration_func(
+            concentration=concentration, delta_concentration=delta_concentration
+        )
+
+        assert residual / delta_concentration == pytest.approx(
+            np.zeros((2, 3)), abs=1.0e-10
+        )
+
+    def test__concentration_radius_at_200_and_mass_at_200_from__same_as_profiles(
+        self,
+    ):
+
+        cosmology = cosmo.LambdaCDM(H0=70.0, Om0=0.3, Ode0=0.7)
+
+        kappa_s = np.array([0.5, 0.1, 0.2])
+        scale_radius = np.array([5.0, 1.0, 10.0])
+        redshift_object = np.array([0.6, 0.3, 0.6])
+
+        for redshift_of_cosmic_average_density in ["local", "profile"]:
+
+            concentration, radius_at_200, mass_at_200 = dark_mass_profiles.concentration_radius_at_200_and_mass_at_200_from(
+                kappa_s=kappa_s,
+                scale_radius=scale_radius,
+                redshift_object=redshift_object,
+                redshift_source=2.5,
+                redshift_of_cosmic_average_density=redshift_of_cosmic_average_density,
+                cosmology=cosmology,
+            )
+
+            for i in range(3):
+
+                nfw = ag.mp.SphNFW(kappa_s=kappa_s[i], scale_radius=scale_radius[i])
+
+                assert concentration[i] == pytest.approx(
+                    nfw.concentration(
+                        redshift_profile=redshift_object[i],
+                        redshift_source=2.5,
+                        redshift_of_cosmic_average_density=redshift_of_cosmic_average_density,
+                        cosmology=cosmology,
+                    ),
+                    1.0e-8,
+                )
+                assert radius_at_200[i] == pytest.approx(
+                    nfw.radius_at_200(
+                        redshift_object=redshift_object[i],
+                        redshift_source=2.5,
+                        redshift_of_cosmic_average_density=redshift_of_cosmic_average_density,
+                        cosmology=cosmology,
+                    ),
+                    1.0e-8,
+                )
+                assert mass_at_200[i] == pytest.approx(
+                    nfw.mass_at_200_solar_masses(
+                        redshift_object=redshift_object[i],
+                        redshift_source=2.5,
+                        redshift_of_cosmic_average_density=redshift_of_cosmic_average_density,
+                        cosmology=cosmology,
+                    ),
+                    1.0e-8,
+                )
+
+        assert concentration[0] == pytest.approx(14.401574489517804, 1.0e-4)
+        assert mass_at_200[0] == pytest.approx(24516707575366.09, 1.0e-4)
+
 
 class TestGeneralizedNFW:
     def test__convergence_correct_values(self):
@@ -792,6 +868,96 @@ class TestGeneralizedNFW:
 
         assert deflections.shape_native == (2, 2)
 
+    def test__lookup_table__interpolated_integrals_match_integrator(self, tmp_path):
+
+        lookup_table = dark_mass_profiles.NFWGeneralizedLookupTable.make(
+            file_path=str(tmp_path),
+            log_eta_over_scale_radius=np.linspace(-2.0, 1.0, 301),
+            inner_slopes=np.linspace(1.0, 1.5, 51),
+            tolerance=1.0e-2,
+        )
+
+        assert isinstance(lookup_table.potential_integral, np.memmap)
+        assert lookup_table.max_relative_error < 1.0e-2
+
+        eta_over_scale_radius = np.array([0.0123, 0.456, 7.89])
+
+        surface_density_integral = (
+            dark_mass_profiles.surface_density_integral_via_integrator_from(
+                eta_over_scale_radius=eta_over_scale_radius,
+                inner_slope=1.23,
+                epsrel=1.49e-5,
+            )[0]
+        )
+
+        assert lookup_table.surface_density_integral_from(
+            eta_over_scale_radius=eta_over_scale_radius, inner_slope=1.23
+        ) == pytest.approx(surface_density_integral, 1.0e-4)
+
+        potential_integral = dark_mass_profiles.potential_integral_via_integrator_from(
+            eta_over_scale_radius=eta_over_scale_radius,
+            inner_slope=1.23,
+            epsrel=1.49e-5,
+        )[0]
+
+        assert lookup_table.potential_integral_from(
+            eta_over_scale_radius=eta_over_scale_radius, inner_slope=1.23
+        ) == pytest.approx(potential_integral, 1.0e-4)
+
+        assert list(
+            lookup_table.covers_from(
+                eta_over_scale_radius=np.array([0.001, 1.0, 100.0]), inner_slope=1.23
+            )
+        ) == [False, True, False]
+        assert list(
+            lookup_table.covers_from(
+                eta_over_scale_radius=np.array([0.1, 1.0]), inner_slope=2.0
+            )
+        ) == [False, False]
+
+    def test__lookup_table__above_tolerance__raises_exception(self, tmp_path):
+
+        with pytest.raises(exc.ProfileException):
+            dark_mass_profiles.NFWGeneralizedLookupTable.make(
+                file_path=str(tmp_path),
+                log_eta_over_scale_radius=np.linspace(-2.0, 1.0, 4),
+                inner_slopes=np.array([1.0, 1.5]),
+                tolerance=1.0e-6,
+            )
+
+    def test__lookup_table__potential_and_deflections_match_integrator(
+        self, tmp_path, monkeypatch
+    ):
+
+        gnfw = ag.mp.EllNFWGeneralized(
+            centre=(0.0, 0.0),
+            elliptical_comps=(0.1, 0.05),
+            kappa_s=1.0,
+            inner_slope=1.2,
+            scale_radius=2.0,
+        )
+
+        potential = gnfw.potential_2d_from_grid(grid=grid)
+        deflections = gnfw.deflections_2d_from_grid_via_integrator(grid=grid)
+
+        lookup_table = dark_mass_profiles.NFWGeneralizedLookupTable.make(
+            file_path=str(tmp_path),
+            log_eta_over_scale_radius=np.linspace(-3.0, 1.0, 401),
+            inner_slopes=np.linspace(1.0, 1.5, 51),
+            tolerance=1.0e-2,
+        )
+
+        monkeypatch.setattr(
+            dark_mass_profiles, "lookup_table_from_config", lambda: lookup_table
+        )
+
+        assert gnfw.potential_2d_from_grid(grid=grid) == pytest.approx(
+            potential, 1.0e-4
+        )
+        assert gnfw.deflections_2d_from_grid_via_integrator(grid=grid) == pytest.approx(
+            deflections, 1.0e-4
+        )
+
 
 class TestTruncatedNFW:
     def test__convergence_correct_values(self):
@@ -1376,6 +1542,156 @@ class TestTruncatedNFWMCRLludlow:
         assert truncated_nfw_mass.truncation_radius == pytest.approx(33.7134116, 1.0e-4)
 
 
+class TestSphNFWTruncatedCollection:
+    def test__convergence_and_deflections__same_as_sum_of_truncated_nfws(self):
+
+        truncated_nfws = [
+            ag.mp.SphNFWTruncated(
+                centre=(0.0, 0.0), kappa_s=1.0, scale_radius=1.0, truncation_radius=2.0
+            ),
+            ag.mp.SphNFWTruncated(
+                centre=(1.0, -0.5), kappa_s=0.2, scale_radius=0.5, truncation_radius=3.0
+            ),
+            ag.mp.SphNFWTruncated(
+                centre=(-2.0, 1.0), kappa_s=0.5, scale_radius=2.0, truncation_radius=4.0
+            ),
+        ]
+
+        collection = ag.mp.SphNFWTruncatedCollection.from_profiles(
+            profiles=truncated_nfws
+        )
+
+        assert collection.total_profiles == 3
+        assert collection.tau == pytest.approx(np.array([2.0, 6.0, 2.0]), 1.0e-4)
+
+        convergence = collection.convergence_2d_from_grid(grid=grid)
+
+        assert convergence == pytest.approx(
+            sum(
+                truncated_nfw.convergence_2d_from_grid(grid=grid)
+                for truncated_nfw in truncated_nfws
+            ),
+            1.0e-4,
+        )
+
+        deflections = collection.deflections_2d_from_grid(grid=grid)
+
+        assert deflections == pytest.approx(
+            sum(
+                truncated_nfw.deflections_2d_from_grid(grid=grid)
+                for truncated_nfw in truncated_nfws
+            ),
+            1.0e-4,
+        )
+
+    def test__tolerance__halos_skipped_where_deflections_below_tolerance(self):
+
+        collection = ag.mp.SphNFWTruncatedCollection(
+            centres=[(0.0, 0.0), (0.0, 1.0)],
+            kappa_s=0.1,
+            scale_radius=0.1,
+            truncation_radius=0.5,
+            tolerance=1.0e-2,
+        )
+
+        assert collection.cut_radii == pytest.approx(
+            np.array([0.419149, 0.419149]), 1.0e-4
+        )
+
+        truncated_nfw = ag.mp.SphNFWTruncated(
+            centre=(0.0, 1.0), kappa_s=0.1, scale_radius=0.1, truncation_radius=0.5
+        )
+
+        deflections = collection.deflections_2d_from_grid(grid=np.array([[0.0, 1.2]]))
+
+        assert deflections == pytest.approx(
+            truncated_nfw.deflections_2d_from_grid(grid=np.array([[0.0, 1.2]])),
+            1.0e-4,
+        )
+
+    def test__tolerance__convergence_not_cut_within_truncation_radius(self):
+
+        collection = ag.mp.SphNFWTruncatedCollection(
+            centres=[(0.0, 0.0)],
+            kappa_s=0.1,
+            scale_radius=0.1,
+            truncation_radius=0.5,
+            tolerance=1.0e-2,
+        )
+
+        truncated_nfw = ag.mp.SphNFWTruncated(
+            centre=(0.0, 0.0), kappa_s=0.1, scale_radius=0.1, truncation_radius=0.5
+        )
+
+        grid = np.array([[0.0, 0.45], [0.0, 1.0]])
+
+        convergence = collection.convergence_2d_from_grid(grid=grid)
+
+        assert convergence[0] > 1.0e-3
+        assert convergence == pytest.approx(
+            truncated_nfw.convergence_2d_from_grid(grid=grid), 1.0e-4
+        )
+
+    def test__from_mcr_duffy_and_ludlow__same_as_mcr_profiles(self):
+
+        centres = [(1.0, 2.0), (0.0, 0.0)]
+        mass_at_200 = [1.0e9, 1.0e10]
+
+        collection = ag.mp.SphNFWTruncatedCollection.from_mcr_duffy(
+            centres=centres,
+            mass_at_200=mass_at_200,
+            redshift_object=0.6,
+            redshift_source=2.5,
+        )
+
+        for i in range(2):
+
+            truncated_nfw_mass = ag.mp.SphNFWTruncatedMCRDuffy(
+                centre=centres[i],
+                mass_at_200=mass_at_200[i],
+                redshift_object=0.6,
+                redshift_source=2.5,
+            )
+
+            assert collection.kappa_s[i] == pytest.approx(
+                truncated_nfw_mass.kappa_s, 1.0e-8
+            )
+            assert collection.scale_radius[i] == pytest.approx(
+                truncated_nfw_mass.scale_radius, 1.0e-8
+            )
+            assert collection.truncation_radius[i] == pytest.approx(
+                truncated_nfw_mass.truncation_radius, 1.0e-8
+            )
+
+        redshift_object = [0.6, 0.5]
+
+        collection = ag.mp.SphNFWTruncatedCollection.from_mcr_ludlow(
+            centres=centres,
+            mass_at_200=mass_at_200,
+            redshift_object=redshift_object,
+            redshift_source=2.5,
+        )
+
+        for i in range(2):
+
+            truncated_nfw_mass = ag.mp.SphNFWTruncatedMCRLudlow(
+                centre=centres[i],
+                mass_at_200=mass_at_200[i],
+                redshift_object=redshift_object[i],
+                redshift_source=2.5,
+            )
+
+            assert collection.kappa_s[i] == pytest.approx(
+                truncated_nfw_mass.kappa_s, 1.0e-8
+            )
+            assert collection.scale_radius[i] == pytest.approx(
+                truncated_nfw_mass.scale_radius, 1.0e-8
+            )
+            assert collection.truncation_radius[i] == pytest.approx(
+                truncated_nfw_mass.truncation_radius, 1.0e-8
+            )
+
+
 class TestNFWMCRDuffy:
     def test__mass_and_concentration_consistent_with_normal_nfw(self):
 
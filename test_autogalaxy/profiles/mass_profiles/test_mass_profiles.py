@@ -2,8 +2,11 @@ import math
 
 import autogalaxy as ag
 from autogalaxy import exc
+from autogalaxy.profiles.mass_profiles import mass_profiles
 import numpy as np
 import pytest
+from pyquad import quad_grid
+from scipy.special import wofz
 
 
 def mass_within_radius_of_profile_from_grid_calculation(radius, profile):
@@ -570,6 +573,209 @@ class TestRegression:
         assert deflections.native[1, 3, 1] <= 0
 
 
+class TestMGE:
+    def test__w_f_approx_jit__matches_w_f_approx_and_wofz(self):
+
+        z = np.array(
+            [
+                0.1 + 0.1j,
+                1.0 + 1.5j,
+                2.0 + 0.01j,
+                5.0 + 2.0j,
+                0.3 + 5.9j,
+                7.0 + 0.0j,
+                10.0 + 10.0j,
+                200.0 + 100.0j,
+            ]
+        )
+
+        w_f = mass_profiles.w_f_approx(z=z.copy())
+
+        for z_value, w_f_value in zip(z, w_f):
+
+            w_f_jit = mass_profiles.w_f_approx_jit(z_value)
+
+            assert w_f_jit == pytest.approx(w_f_value, 1.0e-10)
+            assert w_f_jit == pytest.approx(wofz(z_value), 1.0e-4)
+
+    def test__zeta_from_grid__matches_sum_of_w_f_approx_of_each_gaussian(self):
+
+        grid = np.array([[1.0, 0.5], [-0.5, 2.0], [0.01, -0.3], [-3.0, -1.0]])
+
+        amps = np.array([1.0, 2.0, 0.5])
+        sigmas = np.array([0.1, 0.5, 2.0])
+        axis_ratio = 0.6
+
+        zeta = mass_profiles.MassProfileMGE.zeta_from_grid(
+            grid=grid, amps=amps, sigmas=sigmas, axis_ratio=axis_ratio
+        )
+
+        q2 = axis_ratio ** 2.0
+
+        zeta_manual = np.zeros(grid.shape[0], dtype="complex128")
+
+        for amp, sigma in zip(amps, sigmas):
+
+            scale_factor = axis_ratio / (sigma * np.sqrt(2.0 * (1.0 - q2)))
+
+            xs = grid[:, 1] * scale_factor
+            ys = np.abs(grid[:, 0]) * scale_factor
+
+            expv = -(xs ** 2.0) * (1.0 - q2) - ys ** 2.0 * (1.0 / q2 - 1.0)
+
+            zeta_gaussian = -1j * (
+                mass_profiles.w_f_approx(xs + 1j * ys)
+                - np.exp(expv)
+                * mass_profiles.w_f_approx(axis_ratio * xs + 1j * ys / axis_ratio)
+            )
+
+            zeta_gaussian[grid[:, 0] < 0.0] = np.conj(zeta_gaussian[grid[:, 0] < 0.0])
+
+            zeta_manual += amp * sigma * zeta_gaussian
+
+        assert zeta == pytest.approx(zeta_manual, 1.0e-8)
+
+    def test__kesi_and_eta__are_cached_and_read_only(self):
+
+        kesis = mass_profiles.MassProfileMGE.kesi(28)
+        etas = mass_profiles.MassProfileMGE.eta(28)
+
+        assert mass_profiles.MassProfileMGE.kesi(28) is kesis
+        assert mass_profiles.MassProfileMGE.eta(28) is etas
+        assert kesis.flags.writeable is False
+        assert etas.flags.writeable is False
+
+    def test__decompose_convergence_into_gaussians__cache_matches_direct_calculation(
+        self,
+    ):
+
+        sersic = ag.mp.EllSersic(
+            intensity=2.0,
+            effective_radius=0.8,
+            sersic_index=2.5,
+            mass_to_light_ratio=3.0,
+        )
+
+        def sersic_2d(r):
+            return np.exp(
+                -sersic.sersic_constant
+                * (((r / sersic.effective_radius) ** (1.0 / sersic.sersic_index)) - 1.0)
+            )
+
+        amps_direct, sigmas_direct = sersic._decompose_convergence_into_gaussians(
+            func=sersic_2d,
+            radii_min=sersic.effective_radius / 100.0,
+            radii_max=sersic.effective_radius * 20.0,
+        )
+
+        amps, sigmas = sersic.decompose_convergence_into_gaussians()
+
+        assert amps == pytest.approx(6.0 * amps_direct, 1.0e-8)
+        assert sigmas == pytest.approx(sigmas_direct, 1.0e-8)
+
+        amps_direct, sigmas_direct = sersic._decompose_convergence_into_gaussians(
+            func=lambda r: 6.0 * sersic_2d(r),
+            radii_min=sersic.effective_radius / 100.0,
+            radii_max=sersic.effective_radius * 20.0,
+        )
+
+        assert amps == pytest.approx(amps_direct, 1.0e-4)
+
+        sersic = ag.mp.EllSersic(
+            intensity=4.0,
+            effective_radius=0.8,
+            sersic_index=2.5,
+            mass_to_light_ratio=3.0,
+        )
+
+        amps_rescaled, sigmas_rescaled = sersic.decompose_convergence_into_gaussians()
+
+        assert amps_rescaled == pytest.approx(2.0 * amps, 1.0e-8)
+        assert sigmas_rescaled == pytest.approx(sigmas, 1.0e-8)
+
+        sigmas_rescaled *= 2.0
+
+        amps, sigmas = sersic.decompose_convergence_into_gaussians()
+
+        assert sigmas == pytest.approx(sigmas_direct, 1.0e-8)
+
+    def test__decompose_convergence_into_gaussians__gnfw_scales_with_kappa_s(self):
+
+        gnfw_0 = ag.mp.EllNFWGeneralized(
+            kappa_s=0.1, scale_radius=10.0, inner_slope=1.5
+        )
+        gnfw_1 = ag.mp.EllNFWGeneralized(
+            kappa_s=0.3, scale_radius=10.0, inner_slope=1.5
+        )
+
+        amps_0, sigmas_0 = gnfw_0.decompose_convergence_into_gaussians()
+        amps_1, sigmas_1 = gnfw_1.decompose_convergence_into_gaussians()
+
+        assert amps_1 == pytest.approx(3.0 * amps_0, 1.0e-8)
+        assert sigmas_1 == pytest.approx(sigmas_0, 1.0e-8)
+
+
+class TestQuadGridViaGaussLegendre:
+    def test__nodes_and_weights__integrate_powers_of_sqrt_u_exactly(self):
+
+        nodes, weights = mass_profiles.gauss_legendre_nodes_and_weights_from(
+            quadrature_order=8
+        )
+
+        assert np.sum(weights) == pytest.approx(1.0, 1.0e-12)
+        assert np.sum(weights * nodes) == pytest.approx(0.5, 1.0e-12)
+        assert np.sum(weights * np.sqrt(nodes)) == pytest.approx(2.0 / 3.0, 1.0e-12)
+
+    def test__matches_adaptive_quad_grid_for_deflection_integrands(self):
+
+        grid = np.array([[1.0, 0.5], [-0.5, 2.0], [0.01, -0.3], [-3.0, -1.0]])
+
+        for func, args, quadrature_order in [
+            (ag.mp.EllPowerLawCored.deflection_func, (1.0, 0.7, 2.0, 0.05), 64),
+            (ag.mp.EllGaussian.deflection_func, (0.0, 0.6, 0.5), 32),
+            (ag.mp.EllSersic.deflection_func, (1.0, 0.7, 2.0, 1.0, 3.67206), 64),
+            (ag.mp.EllNFW.deflection_func, (0.0, 0.8, 2.0), 32),
+        ]:
+
+            integral = mass_profiles.quad_grid_via_gauss_legendre(
+                func=func, grid=grid, args=args, quadrature_order=quadrature_order
+            )
+
+            integral_adaptive = quad_grid(func, 0.0, 1.0, grid, args=args)[0]
+
+            assert integral == pytest.approx(integral_adaptive, 1.0e-4)
+
+    def test__matches_adaptive_quad_grid_for_steep_and_compact_profiles(self):
+
+        grid = np.array([[1.0, 0.5], [-0.5, 2.0], [0.01, -0.3], [0.02, 0.01]])
+
+        sersic_constant_n6 = ag.mp.EllSersic(sersic_index=6.0).sersic_constant
+        sersic_constant_n4 = ag.mp.EllSersic(sersic_index=4.0).sersic_constant
+
+        for func, args, quadrature_order in [
+            (ag.mp.EllPowerLawCored.deflection_func, (1.0, 0.7, 2.8, 0.001), 512),
+            (ag.mp.EllGaussian.deflection_func, (0.0, 0.3, 0.05), 64),
+            (
+                ag.mp.EllSersic.deflection_func,
+                (1.0, 0.7, 6.0, 0.5, sersic_constant_n6),
+                1024,
+            ),
+            (
+                ag.mp.EllSersic.deflection_func,
+                (0.0, 0.6, 4.0, 0.05, sersic_constant_n4),
+                1024,
+            ),
+        ]:
+
+            integral = mass_profiles.quad_grid_via_gauss_legendre(
+                func=func, grid=grid, args=args, quadrature_order=quadrature_order
+            )
+
+            integral_adaptive = quad_grid(func, 0.0, 1.0, grid, args=args)[0]
+
+            assert integral == pytest.approx(integral_adaptive, 1.0e-5)
+
+
 class TestDecorators:
     def test__grid_iterate_in__iterates_grid_result_correctly(self, gal_x1_mp):
 
@@ -2,6 +2,7 @@ import os
 
 from autoconf import conf
 import autogalaxy as ag
+from autogalaxy import exc
 import numpy as np
 import pytest
 
@@ -120,6 +121,82 @@ class TestPointMass:
         assert deflections.shape_native == (2, 2)
 
 
+class TestPointMassCollection:
+    def test__deflections__same_as_sum_of_point_masses(self):
+
+        point_masses = [
+            ag.mp.PointMass(centre=(0.0, 0.0), einstein_radius=1.0),
+            ag.mp.PointMass(centre=(1.0, 2.0), einstein_radius=0.5),
+            ag.mp.PointMass(centre=(-1.0, 0.5), einstein_radius=2.0),
+        ]
+
+        collection = ag.mp.PointMassCollection.from_profiles(profiles=point_masses)
+
+        assert collection.is_point_mass is False
+
+        grid = np.array([[1.0, 1.0], [2.0, 3.0], [4.0, 9.0]])
+
+        deflections = collection.deflections_2d_from_grid(grid=grid)
+
+        assert deflections == pytest.approx(
+            sum(
+                point_mass.deflections_2d_from_grid(grid=grid)
+                for point_mass in point_masses
+            ),
+            1.0e-4,
+        )
+
+        assert collection.convergence_2d_from_grid(grid=grid) == pytest.approx(
+            np.zeros(3), 1.0e-4
+        )
+
+    def test__tolerance__point_masses_skipped_beyond_cut_radii(self):
+
+        collection = ag.mp.PointMassCollection(
+            centres=[(0.0, 0.0), (0.0, 5.0)],
+            einstein_radius=[1.0, 0.1],
+            tolerance=0.1,
+        )
+
+        assert collection.cut_radii == pytest.approx(np.array([10.0, 0.1]), 1.0e-4)
+
+        deflections = collection.deflections_2d_from_grid(grid=np.array([[0.0, 4.0]]))
+
+        assert deflections[0, 0] == pytest.approx(0.0, 1.0e-4)
+        assert deflections[0, 1] == pytest.approx(0.25, 1.0e-4)
+
+    def test__opening_angle__deflections_via_barnes_hut_tree_same_as_direct_sum(
+        self,
+    ):
+
+        centres = np.random.RandomState(seed=1).uniform(
+            low=-2.0, high=2.0, size=(200, 2)
+        )
+        einstein_radius = np.random.RandomState(seed=2).uniform(
+            low=0.01, high=0.1, size=200
+        )
+
+        grid = np.array([[1.0, 1.0], [2.0, 3.0], [4.0, 9.0]])
+
+        collection = ag.mp.PointMassCollection(
+            centres=centres, einstein_radius=einstein_radius, opening_angle=0.0
+        )
+
+        deflections_direct = collection.deflections_2d_from_grid(grid=grid)
+
+        collection = ag.mp.PointMassCollection(
+            centres=centres, einstein_radius=einstein_radius, opening_angle=0.5
+        )
+
+        deflections = collection.deflections_2d_from_grid(grid=grid)
+
+        assert collection.barnes_hut_tree.total_nodes > 1
+        assert deflections == pytest.approx(deflections_direct, 1.0e-3)
+
+        with pytest.raises(exc.ProfileException):
+            ag.mp.PointMassCollection(opening_angle=1.0)
+
+
 class TestPowerLawBroken:
     def test__convergence_correct_values(self):
 
@@ -6,6 +6,8 @@ import numpy as np
 import pytest
 
 import autogalaxy as ag
+from autoarray.structures.grids import grid_decorators
+from autoarray.structures.grids.two_d import grid_2d
 from autogalaxy.profiles import geometry_profiles
 
 directory = path.dirname(path.realpath(__file__))
@@ -242,3 +244,98 @@ class TestSphProfile:
         )
 
         assert transformed_grid == pytest.approx(grid_original, 1e-5)
+
+
+class TestTransformAndRelocateToRadialMinimum:
+    def test__matches_unfused_transform_and_relocate_decorators(self):
+        def grid_from(profile, grid):
+            return grid
+
+        fused = geometry_profiles.transform_and_relocate_to_radial_minimum(grid_from)
+        unfused = grid_decorators.transform(
+            grid_decorators.relocate_to_radial_minimum(grid_from)
+        )
+
+        grid = ag.Grid2D.uniform(shape_native=(5, 5), pixel_scales=0.2, sub_size=2)
+
+        for profile in [
+            ag.mp.EllIsothermal(centre=(0.2, 0.2), elliptical_comps=(0.1, 0.2)),
+            ag.mp.SphIsothermal(centre=(0.2, 0.2)),
+        ]:
+
+            assert np.asarray(fused(profile, grid)) == pytest.approx(
+                np.asarray(unfused(profile, grid)), 1.0e-8
+            )
+
+            transformed_grid = profile.transform_grid_to_reference_frame(grid=grid)
+
+            assert np.asarray(fused(profile, transformed_grid)) == pytest.approx(
+                np.asarray(unfused(profile, transformed_grid)), 1.0e-8
+            )
+
+    def test__coordinate_at_centre__relocated_to_radial_minimum(self):
+        def grid_from(profile, grid):
+            return grid
+
+        fused = geometry_profiles.transform_and_relocate_to_radial_minimum(grid_from)
+
+        isothermal = ag.mp.EllIsothermal(
+            centre=(0.5, 0.5), elliptical_comps=(0.1, 0.2), einstein_radius=1.0
+        )
+
+        grid = fused(isothermal, np.array([[0.5, 0.5], [1.5, 0.5]]))
+
+        assert isinstance(grid, grid_2d.Grid2DTransformedNumpy)
+        assert grid[0] == pytest.approx(np.array([0.0001, 0.0001]), 1.0e-8)
+
+
+class TestGeometryCache:
+    def test__profiles_with_same_geometry__share_transformed_grid_and_radii(self):
+        def grid_from(profile, grid):
+            return grid
+
+        fused = geometry_profiles.transform_and_relocate_to_radial_minimum(grid_from)
+
+        grid = ag.Grid2D.uniform(shape_native=(5, 5), pixel_scales=0.2, sub_size=2)
+
+        profile_0 = ag.mp.EllIsothermal(centre=(0.1, 0.2), elliptical_comps=(0.1, 0.2))
+        profile_1 = ag.mp.EllIsothermal(
+            centre=(0.1, 0.2), elliptical_comps=(0.1, 0.2), einstein_radius=2.0
+        )
+        profile_2 = ag.mp.EllIsothermal(centre=(0.3, 0.2), elliptical_comps=(0.1, 0.2))
+
+        with geometry_profiles.geometry_cache():
+
+            transformed_grid_0 = fused(profile_0, grid)
+            transformed_grid_1 = fused(profile_1, grid)
+            transformed_grid_2 = fused(profile_2, grid)
+
+            assert transformed_grid_1 is transformed_grid_0
+            assert transformed_grid_2 is not transformed_grid_0
+
+            elliptical_radii_0 = profile_0.grid_to_elliptical_radii(grid=grid)
+            elliptical_radii_1 = profile_1.grid_to_elliptical_radii(grid=grid)
+
+            assert (elliptical_radii_0 == elliptical_radii_1).all()
+
+        assert fused(profile_0, grid) is not transformed_grid_0
+        assert fused(profile_0, grid) == pytest.approx(
+            np.asarray(transformed_grid_0), 1.0e-8
+        )
+
+    def test__plane_image_with_cache__matches_sum_of_profile_images(self):
+
+        grid = ag.Grid2D.uniform(shape_native=(5, 5), pixel_scales=0.2, sub_size=2)
+
+        bulge = ag.lp.EllSersic(centre=(0.1, 0.2), elliptical_comps=(0.1, 0.2))
+        disk = ag.lp.EllExponential(centre=(0.1, 0.2), elliptical_comps=(0.1, 0.2))
+
+        plane = ag.Plane(galaxies=[ag.Galaxy(redshift=0.5, bulge=bulge, disk=disk)])
+
+        image = plane.image_2d_from_grid(grid=grid)
+
+        assert image.slim == pytest.approx(
+            bulge.image_2d_from_grid(grid=grid).slim
+            + disk.image_2d_from_grid(grid=grid).slim,
+            1.0e-8,
+        )
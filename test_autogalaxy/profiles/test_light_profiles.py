@@ -7,6 +7,7 @@ import pytest
 import scipy.special
 
 import autogalaxy as ag
+from autogalaxy import exc
 from autogalaxy.mock import mock
 
 grid = np.array([[1.0, 1.0], [2.0, 2.0], [3.0, 3.0], [2.0, 4.0]])
@@ -848,6 +849,149 @@ class TestChameleon:
         assert image.shape_native == (2, 2)
 
 
+class TestImage2DStack:
+    def test__stack_of_profiles__rows_match_image_of_each_profile(self):
+
+        grid = ag.Grid2D.uniform(shape_native=(5, 5), pixel_scales=0.3, sub_size=2)
+
+        centres = [(0.0, 0.0), (0.1, -0.2), (0.3, 0.3)]
+        elliptical_comps = [(0.0, 0.0), (0.1, 0.05), (-0.2, 0.3)]
+
+        profile_list = [
+            [
+                ag.lp.EllSersic(
+                    centre=centre,
+                    elliptical_comps=comps,
+                    intensity=intensity,
+                    effective_radius=effective_radius,
+                    sersic_index=sersic_index,
+                )
+                for centre, comps, intensity, effective_radius, sersic_index in zip(
+                    centres,
+                    elliptical_comps,
+                    [1.0, 2.0, 0.5],
+                    [0.6, 1.0, 0.3],
+                    [4.0, 1.0, 2.5],
+                )
+            ],
+            [
+                ag.lp.EllGaussian(
+                    centre=centre, elliptical_comps=comps, intensity=1.0, sigma=sigma
+                )
+                for centre, comps, sigma in zip(
+                    centres, elliptical_comps, [0.2, 0.5, 1.0]
+                )
+            ],
+            [
+                ag.lp.EllSersicCore(
+                    centre=centre, elliptical_comps=comps, radius_break=radius_break
+                )
+                for centre, comps, radius_break in zip(
+                    centres, elliptical_comps, [0.01, 0.1, 0.2]
+                )
+            ],
+            [
+                ag.lp.EllChameleon(
+                    centre=centre, elliptical_comps=comps, core_radius_0=core_radius_0
+                )
+                for centre, comps, core_radius_0 in zip(
+                    centres, elliptical_comps, [0.01, 0.02, 0.03]
+                )
+            ],
+        ]
+
+        parameters_list = [
+            dict(
+                intensity=[1.0, 2.0, 0.5],
+                effective_radius=[0.6, 1.0, 0.3],
+                sersic_index=[4.0, 1.0, 2.5],
+            ),
+            dict(intensity=[1.0, 1.0, 1.0], sigma=[0.2, 0.5, 1.0]),
+            dict(radius_break=[0.01, 0.1, 0.2]),
+            dict(core_radius_0=[0.01, 0.02, 0.03]),
+        ]
+
+        for profiles, parameters in zip(profile_list, parameters_list):
+
+            profile_stack = profiles[0].__class__.stack_from(
+                centres=centres, elliptical_comps=elliptical_comps, **parameters
+            )
+
+            image_stack = profile_stack.image_2d_stack_from_grid(grid=grid)
+
+            assert image_stack.shape == (3, grid.shape[0])
+
+            for image, profile in zip(image_stack, profiles):
+                assert image == pytest.approx(
+                    profile.image_2d_from_grid(grid=grid).slim, 1.0e-8
+                )
+
+    def test__spherical_profiles_and_defaults(self):
+
+        grid = ag.Grid2D.uniform(shape_native=(3, 3), pixel_scales=1.0)
+
+        profile_stack = ag.lp.SphExponential.stack_from(
+            centres=[(0.0, 0.0), (1.0, 1.0)], intensity=[1.0, 3.0]
+        )
+
+        image_stack = profile_stack.image_2d_stack_from_grid(grid=grid)
+
+        for image, profile in zip(
+            image_stack,
+            [
+                ag.lp.SphExponential(centre=(0.0, 0.0), intensity=1.0),
+                ag.lp.SphExponential(centre=(1.0, 1.0), intensity=3.0),
+            ],
+        ):
+            assert image == pytest.approx(
+                profile.image_2d_from_grid(grid=grid).slim, 1.0e-8
+            )
+
+    def test__parameter_not_in_profile__raises_exception(self):
+
+        with pytest.raises(exc.ProfileException):
+            ag.lp.EllSersic.stack_from(centres=[(0.0, 0.0)], sigma=[1.0])
+
+
+class TestAdaptiveOversampling:
+    def test__image_2d_via_adaptive_oversampling_from__matches_high_sub_size(self):
+
+        mask = ag.Mask2D.unmasked(shape_native=(11, 11), pixel_scales=0.1)
+
+        grid = ag.Grid2D.from_mask(mask=mask)
+
+        sersic = ag.lp.EllSersic(
+            centre=(0.02, 0.01),
+            elliptical_comps=(0.1, 0.0),
+            intensity=1.0,
+            effective_radius=0.2,
+            sersic_index=4.0,
+        )
+
+        image = sersic.image_2d_via_adaptive_oversampling_from(
+            grid=grid, fractional_accuracy=0.999, sub_steps=[2, 4, 8, 16]
+        )
+
+        grid_sub_16 = ag.Grid2D.from_mask(
+            mask=ag.Mask2D.unmasked(
+                shape_native=(11, 11), pixel_scales=0.1, sub_size=16
+            )
+        )
+
+        image_sub_16 = sersic.image_2d_from_grid(grid=grid_sub_16).binned
+
+        assert image.shape_native == (11, 11)
+        assert image.native == pytest.approx(image_sub_16.native, 1.0e-2)
+
+        galaxy = ag.Galaxy(redshift=0.5, light=sersic, light_1=sersic)
+
+        galaxy_image = galaxy.image_2d_via_adaptive_oversampling_from(
+            grid=grid, fractional_accuracy=0.999, sub_steps=[2, 4, 8, 16]
+        )
+
+        assert galaxy_image.native == pytest.approx(2.0 * image.native, 1.0e-4)
+
+
 class TestRegression:
     def test__centre_of_profile_in_right_place(self):
         grid = ag.Grid2D.uniform(shape_native=(7, 7), pixel_scales=1.0)
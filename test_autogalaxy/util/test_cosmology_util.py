@@ -2,6 +2,7 @@ import autogalaxy as ag
 import pytest
 from astropy import cosmology as cosmo
 import numpy as np
+from autogalaxy.mock import mock
 
 planck = cosmo.Planck15
 
@@ -93,3 +94,131 @@ def test__velocity_dispersion_from():
     )
 
     assert velocity_dispersion == pytest.approx(np.sqrt(2) * 249.03449, 1.0e-4)
+
+
+class TestCosmologyDistances:
+    def test__interpolated_distances_match_astropy(self):
+
+        redshifts = np.array([0.01, 0.1, 0.5, 1.0, 2.5, 7.0])
+
+        for cosmology in [
+            planck,
+            cosmo.LambdaCDM(H0=70.0, Om0=0.3, Ode0=0.6),
+            cosmo.LambdaCDM(H0=70.0, Om0=0.3, Ode0=0.8),
+        ]:
+
+            distances = ag.util.cosmology.cosmology_distances_from(cosmology=cosmology)
+
+            assert distances.angular_diameter_distance_kpc_from(
+                redshift=redshifts
+            ) == pytest.approx(
+                cosmology.angular_diameter_distance(redshifts).to("kpc").value,
+                1.0e-10,
+            )
+
+            assert distances.angular_diameter_distance_between_redshifts_kpc_from(
+                redshift_0=0.5 * redshifts, redshift_1=redshifts
+            ) == pytest.approx(
+                cosmology.angular_diameter_distance_z1z2(0.5 * redshifts, redshifts)
+                .to("kpc")
+                .value,
+                1.0e-10,
+            )
+
+            assert distances.critical_density_solar_mass_per_kpc3_from(
+                redshift=redshifts
+            ) == pytest.approx(
+                cosmology.critical_density(redshifts).to("solMass / kpc^3").value,
+                1.0e-10,
+            )
+
+            assert distances.angular_diameter_distance_kpc_from(
+                redshift=25.0
+            ) == pytest.approx(
+                cosmology.angular_diameter_distance(25.0).to("kpc").value, 1.0e-10
+            )
+
+    def test__engine_shared_by_equal_cosmologies_and_scalar_values_memoized(self):
+
+        distances = ag.util.cosmology.cosmology_distances_from(cosmology=planck)
+
+        assert (
+            ag.util.cosmology.cosmology_distances_from(
+                cosmology=cosmo.FlatLambdaCDM(
+                    name=planck.name,
+                    H0=planck.H0,
+                    Om0=planck.Om0,
+                    Tcmb0=planck.Tcmb0,
+                    Neff=planck.Neff,
+                    m_nu=planck.m_nu,
+                    Ob0=planck.Ob0,
+                )
+            )
+            is distances
+        )
+
+        distances.angular_diameter_distance_between_redshifts_kpc_from(
+            redshift_0=0.3, redshift_1=1.3
+        )
+
+        assert (
+            "angular_diameter_distance_between_redshifts",
+            0.3,
+            1.3,
+        ) in distances.memo
+
+    def test__engines_keyed_by_full_precision_parameters_and_cache_bounded(self):
+
+        cosmology = cosmo.FlatLambdaCDM(H0=70.0, Om0=0.3)
+
+        distances = ag.util.cosmology.cosmology_distances_from(cosmology=cosmology)
+
+        assert (
+            ag.util.cosmology.cosmology_distances_from(
+                cosmology=cosmo.FlatLambdaCDM(H0=70.01, Om0=0.3)
+            )
+            is not distances
+        )
+        assert (
+            ag.util.cosmology.cosmology_distances_from(
+                cosmology=cosmo.FlatLambdaCDM(H0=70.0, Om0=0.30001)
+            )
+            is not distances
+        )
+        assert ag.util.cosmology.cosmology_key_from(
+            cosmology=cosmology
+        ) != ag.util.cosmology.cosmology_key_from(
+            cosmology=cosmo.LambdaCDM(H0=70.0, Om0=0.3, Ode0=0.7)
+        )
+
+        for hubble_constant in np.linspace(60.0, 80.0, 150):
+            ag.util.cosmology.cosmology_distances_from(
+                cosmology=cosmo.FlatLambdaCDM(H0=hubble_constant, Om0=0.3)
+            )
+
+        assert len(ag.util.cosmology._cosmology_distances) == 100
+        assert len(ag.util.cosmology._cosmology_distances_of_ids) == 100
+
+    def test__cosmology_which_is_not_flrw__distances_via_its_methods(self):
+
+        cosmology = mock.MockCosmology(
+            arcsec_per_kpc=0.25,
+            kpc_per_arcsec=4.0,
+            critical_surface_density=2.0,
+            cosmic_average_density=3.0,
+        )
+
+        assert isinstance(
+            ag.util.cosmology.cosmology_distances_from(cosmology=cosmology),
+            ag.util.cosmology.CosmologyDistancesViaMethods,
+        )
+
+        assert ag.util.cosmology.kpc_per_arcsec_from(
+            redshift=0.5, cosmology=cosmology
+        ) == pytest.approx(4.0, 1.0e-8)
+        assert ag.util.cosmology.cosmic_average_density_from(
+            redshift=0.5, cosmology=cosmology
+        ) == pytest.approx(192.0, 1.0e-8)
+        assert ag.util.cosmology.critical_surface_density_between_redshifts_from(
+            redshift_0=0.5, redshift_1=1.0, cosmology=cosmology
+        ) == pytest.approx(8.0, 1.0e-8)
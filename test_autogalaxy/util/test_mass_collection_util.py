@@ -0,0 +1,190 @@
+import numpy as np
+import pytest
+
+from autogalaxy.util import mass_collection_util
+
+
+class TestCellIndex:
+    def test__profiles_binned_into_cells_in_compressed_layout(self):
+
+        centres = np.array(
+            [[0.0, 0.0], [0.0, 3.0], [3.0, 0.0], [3.0, 3.0], [0.5, 0.5], [2.9, 2.9]]
+        )
+
+        cell_index = mass_collection_util.CellIndex(
+            centres=centres, cut_radii=np.arange(6.0), profiles_per_cell=1
+        )
+
+        assert cell_index.cells_per_side == 2
+        assert (cell_index.cell_starts == np.array([0, 2, 3, 4, 6])).all()
+        assert (cell_index.cell_profiles == np.array([0, 4, 1, 2, 3, 5])).all()
+        assert cell_index.cell_cut_radii == pytest.approx(
+            np.array([4.0, 1.0, 2.0, 5.0]), 1.0e-4
+        )
+
+    def test__no_profiles__values_are_zero(self):
+
+        cell_index = mass_collection_util.CellIndex(
+            centres=np.zeros((0, 2)), cut_radii=np.zeros(0)
+        )
+
+        deflections = mass_collection_util.values_via_cell_index_from(
+            func=mass_collection_util.point_mass_deflection_jit,
+            grid=np.array([[1.0, 1.0]]),
+            parameters=np.zeros((0, 1)),
+            cell_index=cell_index,
+            grid_radial_minimum=1.0e-8,
+            deflections=True,
+        )
+
+        assert deflections == pytest.approx(np.zeros((1, 2)), 1.0e-4)
+
+
+class TestValuesViaCellIndex:
+    def test__point_masses__same_as_direct_sum_and_within_tolerance_if_culled(
+        self,
+    ):
+
+        centres = np.random.RandomState(seed=1).uniform(
+            low=-2.0, high=2.0, size=(50, 2)
+        )
+        einstein_radii = np.random.RandomState(seed=2).uniform(
+            low=0.01, high=0.1, size=50
+        )
+
+        grid = np.random.RandomState(seed=3).uniform(low=-3.0, high=3.0, size=(100, 2))
+
+        shifted_grid = grid[None, :, :] - centres[:, None, :]
+        radii_squared = np.sum(shifted_grid ** 2, axis=-1)
+
+        deflections_direct = np.sum(
+            einstein_radii[:, None, None] ** 2
+            * shifted_grid
+            / radii_squared[:, :, None],
+            axis=0,
+        )
+
+        cell_index = mass_collection_util.CellIndex(
+            centres=centres, cut_radii=np.full(50, np.inf)
+        )
+
+        deflections = mass_collection_util.values_via_cell_index_from(
+            func=mass_collection_util.point_mass_deflection_jit,
+            grid=grid,
+            parameters=einstein_radii[:, None],
+            cell_index=cell_index,
+            grid_radial_minimum=1.0e-8,
+            deflections=True,
+        )
+
+        assert deflections == pytest.approx(deflections_direct, 1.0e-8)
+
+        tolerance = 1.0e-3
+
+        cell_index = mass_collection_util.CellIndex(
+            centres=centres, cut_radii=einstein_radii ** 2 / tolerance
+        )
+
+        deflections = mass_collection_util.values_via_cell_index_from(
+            func=mass_collection_util.point_mass_deflection_jit,
+            grid=grid,
+            parameters=einstein_radii[:, None],
+            cell_index=cell_index,
+            grid_radial_minimum=1.0e-8,
+            deflections=True,
+        )
+
+        assert np.max(np.abs(deflections - deflections_direct)) > 0.0
+        assert np.max(np.abs(deflections - deflections_direct)) < 50 * tolerance
+
+
+class TestBarnesHutTree:
+    def test__morton_codes__interleave_bits_of_x_and_y(self):
+
+        codes = mass_collection_util.morton_codes_from(
+            centres=np.array([[0.0, 0.0], [0.0, 3.0], [3.0, 0.0], [3.0, 3.0]]),
+            total_levels=2,
+        )
+
+        assert (codes == np.array([0, 5, 10, 15])).all()
+
+    def test__tree_structure__leaves_partition_point_masses_and_root_is_total_mass(
+        self,
+    ):
+
+        centres = np.random.RandomState(seed=1).uniform(
+            low=-2.0, high=2.0, size=(100, 2)
+        )
+        masses = np.random.RandomState(seed=2).uniform(low=0.1, high=1.0, size=100)
+
+        tree = mass_collection_util.BarnesHutTree(
+            centres=centres, masses=masses, leaf_size=8
+        )
+
+        assert tree.total_nodes > 1
+
+        leaf_sizes = (tree.node_ends - tree.node_starts)[tree.node_is_leaf]
+
+        assert np.sum(leaf_sizes) == 100
+        assert np.max(leaf_sizes) <= 8
+
+        assert tree.node_multipoles[0, 0].real == pytest.approx(np.sum(masses), 1.0e-8)
+        assert tree.node_multipoles[0, 1] == pytest.approx(0.0, abs=1.0e-8)
+
+        assert tree.node_centres[0].real == pytest.approx(
+            np.sum(masses * centres[:, 1]) / np.sum(masses), 1.0e-8
+        )
+
+
+class TestDeflectionsViaBarnesHut:
+    def test__point_masses__same_as_direct_sum_and_within_stated_error(self):
+
+        centres = np.random.RandomState(seed=1).uniform(
+            low=-2.0, high=2.0, size=(500, 2)
+        )
+        einstein_radii = np.random.RandomState(seed=2).uniform(
+            low=0.01, high=0.1, size=500
+        )
+
+        grid = np.random.RandomState(seed=3).uniform(low=-3.0, high=3.0, size=(100, 2))
+
+        shifted_grid = grid[None, :, :] - centres[:, None, :]
+        radii_squared = np.sum(shifted_grid ** 2, axis=-1)
+
+        deflections_direct = np.sum(
+            einstein_radii[:, None, None] ** 2
+            * shifted_grid
+            / radii_squared[:, :, None],
+            axis=0,
+        )
+
+        tree = mass_collection_util.BarnesHutTree(
+            centres=centres, masses=einstein_radii ** 2, expansion_order=4
+        )
+
+        deflections = mass_collection_util.deflections_2d_via_barnes_hut_from(
+            grid=grid, tree=tree, opening_angle=0.0, grid_radial_minimum=1.0e-8
+        )
+
+        assert deflections == pytest.approx(deflections_direct, 1.0e-8)
+
+        opening_angle = 0.5
+
+        deflections = mass_collection_util.deflections_2d_via_barnes_hut_from(
+            grid=grid,
+            tree=tree,
+            opening_angle=opening_angle,
+            grid_radial_minimum=1.0e-8,
+        )
+
+        error_bound = (
+            (1.0 + opening_angle)
+            * opening_angle ** 5
+            / (1.0 - opening_angle)
+            * np.sum(einstein_radii[:, None] ** 2 / np.sqrt(radii_squared), axis=0)
+        )
+
+        errors = np.sqrt(np.sum((deflections - deflections_direct) ** 2, axis=1))
+
+        assert np.max(errors) > 0.0
+        assert (errors <= error_bound).all()
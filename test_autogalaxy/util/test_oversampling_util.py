@@ -0,0 +1,77 @@
+import numpy as np
+import pytest
+
+from autogalaxy.util import oversampling_util
+
+
+class TestSubGrid2D:
+    def test__sub_pixels_ordered_like_grid_2d(self):
+
+        sub_grid_2d = oversampling_util.sub_grid_2d_from(
+            grid_2d=np.array([[0.0, 0.0], [1.0, 2.0]]),
+            pixel_scales=(1.0, 2.0),
+            sub_size=2,
+        )
+
+        assert sub_grid_2d == pytest.approx(
+            np.array(
+                [
+                    [0.25, -0.5],
+                    [0.25, 0.5],
+                    [-0.25, -0.5],
+                    [-0.25, 0.5],
+                    [1.25, 1.5],
+                    [1.25, 2.5],
+                    [0.75, 1.5],
+                    [0.75, 2.5],
+                ]
+            ),
+            1.0e-4,
+        )
+
+
+class TestAdaptiveOversampling:
+    def test__linear_function__every_pixel_converges_at_first_sub_size(self):
+
+        total_coordinates = []
+
+        def func(grid_2d):
+            total_coordinates.append(grid_2d.shape[0])
+            return 1.0 + grid_2d[:, 0] + 2.0 * grid_2d[:, 1]
+
+        grid_2d = np.array([[0.0, 0.0], [1.0, 1.0], [2.0, 2.0]])
+
+        image = oversampling_util.image_2d_via_adaptive_oversampling_from(
+            func=func, grid_2d=grid_2d, pixel_scales=(1.0, 1.0)
+        )
+
+        assert image == pytest.approx(np.array([1.0, 4.0, 7.0]), 1.0e-4)
+        assert total_coordinates == [3, 12]
+
+    def test__only_unconverged_pixels_refined(self):
+
+        total_coordinates = []
+
+        def func(grid_2d):
+            total_coordinates.append(grid_2d.shape[0])
+            return np.exp(-(grid_2d[:, 0] ** 2 + grid_2d[:, 1] ** 2) / 0.01)
+
+        grid_2d = np.array([[0.0, 0.0], [10.0, 10.0]])
+
+        image = oversampling_util.image_2d_via_adaptive_oversampling_from(
+            func=func, grid_2d=grid_2d, pixel_scales=(0.1, 0.1), sub_steps=[2, 4]
+        )
+
+        assert total_coordinates == [2, 8, 16]
+        assert image[1] == 0.0
+
+    def test__fractional_accuracies_from(self):
+
+        fractional_accuracies = oversampling_util.fractional_accuracies_from(
+            image_lower=np.array([1.0, 2.0, 0.0, 0.0]),
+            image_higher=np.array([2.0, 1.0, 0.0, 1.0]),
+        )
+
+        assert fractional_accuracies == pytest.approx(
+            np.array([0.5, 0.5, 1.0, 0.0]), 1.0e-4
+        )
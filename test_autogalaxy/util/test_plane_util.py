@@ -4,12 +4,148 @@ import pytest
 from autogalaxy import exc
 from autogalaxy.util.plane_util import (
     plane_image_of_galaxies_from,
+    blurred_images_of_planes_from,
+    contribution_maps_of_galaxies_from,
+    hyper_noise_maps_of_galaxies_from,
     ordered_plane_redshifts_from,
     ordered_plane_redshifts_with_slicing_from,
     galaxies_in_redshift_ordered_planes_from,
 )
 
 
+class TestBlurredImagesOfPlanes:
+    def test__stacked_blurred_images_match_blurred_image_of_each_plane(
+        self, sub_grid_2d_7x7, blurring_grid_2d_7x7, convolver_7x7
+    ):
+        plane_0 = ag.Plane(
+            galaxies=[ag.Galaxy(redshift=0.5, light=ag.lp.EllSersic(intensity=1.0))]
+        )
+        plane_1 = ag.Plane(
+            galaxies=[
+                ag.Galaxy(redshift=0.5, light=ag.lp.EllExponential(intensity=2.0)),
+                ag.Galaxy(redshift=0.5, light=ag.lp.SphGaussian(intensity=0.5)),
+            ]
+        )
+
+        blurred_images = blurred_images_of_planes_from(
+            planes=[plane_0, plane_1],
+            grid=sub_grid_2d_7x7,
+            convolver=convolver_7x7,
+            blurring_grid=blurring_grid_2d_7x7,
+        )
+
+        assert blurred_images.shape == (2, sub_grid_2d_7x7.mask.pixels_in_mask)
+
+        for plane, blurred_image in zip([plane_0, plane_1], blurred_images):
+
+            blurred_image_of_plane = plane.blurred_image_2d_from_grid_and_convolver(
+                grid=sub_grid_2d_7x7,
+                convolver=convolver_7x7,
+                blurring_grid=blurring_grid_2d_7x7,
+            )
+
+            assert blurred_image == pytest.approx(blurred_image_of_plane.slim, 1.0e-8)
+
+    def test__grid_2d_iterate__blurred_images_match_blurred_image_of_each_plane(
+        self, grid_2d_iterate_7x7, blurring_grid_2d_7x7, convolver_7x7
+    ):
+        plane_0 = ag.Plane(
+            galaxies=[
+                ag.Galaxy(
+                    redshift=0.5,
+                    light=ag.lp.EllSersic(
+                        intensity=1.0, effective_radius=0.1, sersic_index=4.0
+                    ),
+                )
+            ]
+        )
+        plane_1 = ag.Plane(
+            galaxies=[
+                ag.Galaxy(redshift=0.5, light=ag.lp.EllGaussian(sigma=0.05)),
+                ag.Galaxy(redshift=0.5, light=ag.lp.EllExponential(intensity=2.0)),
+            ]
+        )
+
+        blurred_images = blurred_images_of_planes_from(
+            planes=[plane_0, plane_1],
+            grid=grid_2d_iterate_7x7,
+            convolver=convolver_7x7,
+            blurring_grid=blurring_grid_2d_7x7,
+        )
+
+        for plane, blurred_image in zip([plane_0, plane_1], blurred_images):
+
+            blurred_image_of_plane = plane.blurred_image_2d_from_grid_and_convolver(
+                grid=grid_2d_iterate_7x7,
+                convolver=convolver_7x7,
+                blurring_grid=blurring_grid_2d_7x7,
+            )
+
+            assert blurred_image == pytest.approx(blurred_image_of_plane.slim, 1.0e-8)
+
+
+class TestHyperNoiseMapsOfGalaxies:
+    def test__stacked_maps_match_hyper_galaxy_calculation_of_each_galaxy(self):
+
+        noise_map = ag.Array2D.manual_native(array=[[5.0, 3.0, 1.0]], pixel_scales=1.0)
+
+        hyper_model_image = ag.Array2D.manual_native(
+            array=[[2.0, 4.0, 10.0]], pixel_scales=1.0
+        )
+
+        galaxies = [
+            ag.Galaxy(
+                redshift=0.5,
+                hyper_galaxy=ag.HyperGalaxy(
+                    contribution_factor=5.0, noise_factor=1.0, noise_power=1.0
+                ),
+                hyper_model_image=hyper_model_image,
+                hyper_galaxy_image=ag.Array2D.manual_native(
+                    array=[[1.0, 5.0, 8.0]], pixel_scales=1.0
+                ),
+            ),
+            ag.Galaxy(
+                redshift=0.5,
+                hyper_galaxy=ag.HyperGalaxy(
+                    contribution_factor=10.0, noise_factor=2.0, noise_power=2.0
+                ),
+                hyper_model_image=hyper_model_image,
+                hyper_galaxy_image=ag.Array2D.manual_native(
+                    array=[[0.5, 1.0, 3.0]], pixel_scales=1.0
+                ),
+            ),
+        ]
+
+        contribution_maps = contribution_maps_of_galaxies_from(galaxies=galaxies)
+        hyper_noise_maps = hyper_noise_maps_of_galaxies_from(
+            galaxies=galaxies, noise_map=noise_map
+        )
+
+        assert contribution_maps.shape == (2, 3)
+        assert hyper_noise_maps.shape == (2, 3)
+
+        for galaxy, contribution_map, hyper_noise_map in zip(
+            galaxies, contribution_maps, hyper_noise_maps
+        ):
+
+            assert contribution_map == pytest.approx(
+                galaxy.hyper_galaxy.contribution_map_from_hyper_images(
+                    hyper_model_image=galaxy.hyper_model_image,
+                    hyper_galaxy_image=galaxy.hyper_galaxy_image,
+                ),
+                1.0e-8,
+            )
+
+            assert hyper_noise_map == pytest.approx(
+                galaxy.hyper_galaxy.hyper_noise_map_from_hyper_images_and_noise_map(
+                    hyper_model_image=galaxy.hyper_model_image,
+                    hyper_galaxy_image=galaxy.hyper_galaxy_image,
+                    noise_map=noise_map,
+                ),
+                1.0e-8,
+            )
+
+
 class TestPlaneImageFromGrid:
     def test__3x3_grid__extracts_max_min_coordinates__creates_grid_including_half_pixel_offset_from_edge(
         self,